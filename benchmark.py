@@ -0,0 +1,512 @@
+import os, sys, io, json, time, random, shutil, tempfile, argparse, datetime, platform, fnmatch, multiprocessing, subprocess
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+# Converty için tekrarlanabilir performans ölçümü. Sentetik derlemler sabit bir tohumla yerelde üretilir,
+# her durum (dönüşüm x derlem x ayar x eşzamanlılık) ayrı bir süreçte çalıştırılır ki tepe bellek
+# (RSS) birbirine karışmasın. Sonuçlar JSON rapora yazılır; iki rapor karşılaştırılarak gerilemeler görülür.
+#
+# Açılış süresi de ölçülür (startup/* durumları): modülün içe aktarılması, komut satırı ve ilk pencere çizimi.
+#
+#   python benchmark.py run -o report.json [--quick] [--cases "pdf_to_pptx/text/*"]
+#   python benchmark.py compare old.json new.json [--threshold 0.1]
+#   python benchmark.py service --address unix:/tmp/converty.sock --requests 40 --concurrency 8 [--upload --token KEY]
+#   (yollarla gönderimde servis, derlem klasörünü kapsayan --input-root ile başlatılmış olmalı)
+
+REPORT_VERSION = 1
+CORPUS_VERSION = 1
+
+# derlem adı: (tür, dosya sayısı, dosya başına sayfa/slayt, hızlı moddaki sayfa/slayt)
+CORPORA = {
+    "text": ("pdf", 4, 12, 3),
+    "scanned": ("pdf", 4, 4, 1),
+    "mixed": ("pdf", 4, 8, 2),
+    "large_page": ("pdf", 1, 2, 1),
+    "many_pages": ("pdf", 1, 300, 40),
+    "pptx_small": ("pptx", 6, 5, 2),
+    "pptx_large": ("pptx", 2, 60, 10)
+}
+
+PDF_SETTINGS = {
+    "default": {"profile": "default"},
+    "small": {"profile": "small"},
+    "auto": {"profile": "auto"},
+    "png100": {"dpi": 100, "image_format": "png"},
+    "vector": {"pptx_engine": "vector"}
+}
+
+PPTX_SETTINGS = {
+    "libreoffice": {"pdf_engine": "libreoffice"}
+}
+
+# Açılışta yüklenmemesi gereken dönüşüm kütüphaneleri ve yalnızca servis/LibreOffice havuzu için gereken modüller
+HEAVY_MODULES = ("pdf2image", "pptx", "PIL.Image", "lxml.etree", "comtypes", "tqdm", "pymupdf", "uno", "http.server")
+
+# Her durum temiz bir yorumlayıcıda ve boş bir çalışma klasöründe (tercih ve geçmiş dosyaları karışmasın diye)
+# çalışır; ölçüm işaretine gelindiğinde report() çağrılır. "gui" durumunda mainloop'a girilince pencere bir kez
+# çizilip kapatılır; ekran yoksa hata olarak raporlanır.
+STARTUP_PRELUDE = """
+import sys, time, json
+sys.path.insert(0, {repo!r})
+def report():
+    print(json.dumps({{"at": time.time(), "heavy": [m for m in {heavy!r} if m in sys.modules]}}), flush=True)
+"""
+
+STARTUP_CASES = {
+    "import": "import pdf_to_pptx\nreport()\n",
+    "cli_help": ("import contextlib, io, pdf_to_pptx\n"
+                 "with contextlib.redirect_stdout(io.StringIO()):\n"
+                 "    try:\n"
+                 "        pdf_to_pptx.cli_main(['--help'])\n"
+                 "    except SystemExit:\n"
+                 "        pass\n"
+                 "report()\n"),
+    "gui": ("import pdf_to_pptx\n"
+            "def first_paint(self, n=0):\n"
+            "    self.update()\n"
+            "    report()\n"
+            "    self.destroy()\n"
+            "pdf_to_pptx.tk.Tk.mainloop = first_paint\n"
+            "pdf_to_pptx.main_app()\n")
+}
+
+LETTER = (612, 792)
+A0 = (2384, 3370)
+WORDS = ("converty slide page render encode deck archive office layout figure table chart summary "
+         "quarterly revenue forecast margin review appendix overview objective result method").split()
+
+def _text_lines(rng, count, width=12):
+    return [" ".join(rng.choice(WORDS) for _ in range(width)).capitalize() for _ in range(count)]
+
+def _photo(rng, size):
+    # Fotoğraf benzeri içerik: renk geçişi + gürültü; JPEG'e iyi, paletli PNG'ye kötü sıkışır.
+    # Gürültü tohumlu üreteçten gelir, böylece aynı derlem her makinede aynı baytlarla üretilir.
+    gradient = Image.linear_gradient("L").resize(size)
+    noise = Image.blend(gradient, Image.frombytes("L", size, rng.randbytes(size[0] * size[1])), 0.35)
+    base = Image.merge("RGB", (gradient, noise, gradient.rotate(90).resize(size)))
+    buffer = io.BytesIO()
+    base.save(buffer, "JPEG", quality=85)
+    return buffer.getvalue(), size
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_pdf(path, pages):
+    # pages: (genişlik_pt, yükseklik_pt, metin satırları, (jpeg baytları, (w, h)) veya None)
+    objects = [None, None]
+    def add(data):
+        objects.append(data)
+        return len(objects)
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    kids = []
+    for width, height, lines, image in pages:
+        resources = f"/Font << /F1 {font} 0 R >>"
+        ops = []
+        if image is not None:
+            blob, (iw, ih) = image
+            xobject = add(b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB "
+                          b"/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n" % (iw, ih, len(blob))
+                          + blob + b"\nendstream")
+            resources += f" /XObject << /Im1 {xobject} 0 R >>"
+            box_height = height if not lines else height / 2
+            ops.append(f"q {width} 0 0 {box_height} 0 0 cm /Im1 Do Q")
+        if lines:
+            ops.append(f"BT /F1 11 Tf 14 TL 56 {height - 56} Td")
+            ops.extend(f"({_pdf_escape(line)}) '" for line in lines)
+            ops.append("ET")
+        content = "\n".join(ops).encode("latin-1")
+        stream = add(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        kids.append(add(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+                        f"/Resources << {resources} >> /Contents {stream} 0 R >>".encode()))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>".encode()
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for n, body in enumerate(objects, 1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n" % n + body + b"\nendobj\n")
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+def pdf_pages(kind, rng, count):
+    pages = []
+    for n in range(count):
+        if kind == "text":
+            pages.append((*LETTER, _text_lines(rng, 46), None))
+        elif kind == "scanned":
+            pages.append((*LETTER, [], _photo(rng, (1240, 1604))))
+        elif kind == "mixed":
+            pages.append((*LETTER, _text_lines(rng, 20), _photo(rng, (800, 500)) if n % 2 else None))
+        elif kind == "large_page":
+            pages.append((*A0, _text_lines(rng, 200, 40), _photo(rng, (1600, 1100))))
+        elif kind == "many_pages":
+            pages.append((*LETTER, _text_lines(rng, 30), None))
+    return pages
+
+def write_pptx(path, rng, slides, pictures):
+    presentation = Presentation()
+    for n in range(slides):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = " ".join(_text_lines(rng, 1, 5))
+        slide.placeholders[1].text = "\n".join(_text_lines(rng, 5, 8))
+        if pictures:
+            blob, _ = _photo(rng, (960, 540))
+            slide.shapes.add_picture(io.BytesIO(blob), Inches(5), Inches(4), width=Inches(4.5))
+    presentation.save(path)
+
+def generate_corpus(corpus_dir, name, quick=False):
+    # Derlem klasörde zaten aynı sürüm ve boyutta üretilmişse yeniden kullanılır.
+    kind, files, count, quick_count = CORPORA[name]
+    count = quick_count if quick else count
+    folder = os.path.join(corpus_dir, name)
+    info_path = os.path.join(folder, "corpus.json")
+    signature = {"version": CORPUS_VERSION, "files": files, "count": count}
+    if os.path.exists(info_path):
+        with open(info_path, "r", encoding="utf-8") as f:
+            info = json.load(f)
+        if info["signature"] == signature and all(os.path.exists(p) for p in info["paths"]):
+            return info
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+    rng = random.Random(f"{name}-{CORPUS_VERSION}")
+    paths = []
+    for i in range(files):
+        if kind == "pdf":
+            path = os.path.join(folder, f"{name}_{i + 1}.pdf")
+            write_pdf(path, pdf_pages(name, rng, count))
+        else:
+            path = os.path.join(folder, f"{name}_{i + 1}.pptx")
+            write_pptx(path, rng, count, name == "pptx_large")
+        paths.append(path)
+    info = {"signature": signature, "kind": kind, "paths": paths, "pages": files * count,
+            "bytes": sum(os.path.getsize(p) for p in paths)}
+    with open(info_path, "w", encoding="utf-8") as f:
+        json.dump(info, f)
+    return info
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB, macOS'ta bayt cinsindendir; Windows'ta psutil varsa kullanılır.
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None, None
+        return round(psutil.Process().memory_info().peak_wset / 2 ** 20, 1), None
+    scale = 2 ** 20 if sys.platform == "darwin" else 2 ** 10
+    return (round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+            round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1))
+
+def run_case(case, sender):
+    # Ayrı süreçte çalışır; ölçüm sonucunu boruya yazar.
+    import pdf_to_pptx
+    output_folder = tempfile.mkdtemp(prefix="converty-bench-")
+    try:
+        options = dict(case["settings"], jobs=case["jobs"], cache=False, manifest=False)
+        started = time.perf_counter()
+        batch = pdf_to_pptx.convert_files(case["conversion"], case["paths"], output_folder, options)
+        seconds = time.perf_counter() - started
+        done = [r for r in batch["results"] if r["status"] == "done"]
+        stages = {}
+        for r in done:
+            for key in ("render_seconds", "encode_seconds", "layout_seconds", "assemble_seconds", "save_seconds"):
+                if key in r:
+                    stages[key] = round(stages.get(key, 0.0) + r[key], 3)
+        pages = sum(r.get("pages", 0) for r in done) if case["conversion"] == "pdf_to_pptx" \
+            else case["pages"] * len(done) // max(1, len(case["paths"]))
+        rss, child_rss = peak_rss_mb()
+        sender.send({
+            "files": len(case["paths"]),
+            "failed": batch["failed"],
+            "errors": sorted({r["error"] for r in batch["results"] if r["error"]})[:3],
+            "pages": pages,
+            "seconds": round(seconds, 3),
+            "pages_per_second": round(pages / seconds, 2) if seconds > 0 else None,
+            "peak_rss_mb": rss,
+            "peak_child_rss_mb": child_rss,
+            "output_bytes": sum(os.path.getsize(r["output"]) for r in done),
+            "stages": stages
+        })
+    except Exception as e:
+        sender.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        shutil.rmtree(output_folder, ignore_errors=True)
+
+def measure(case):
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=run_case, args=(case, sender))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {"error": f"Benchmark process exited with code {process.exitcode}"}
+    process.join()
+    return result
+
+def measure_startup(name, repeat=3):
+    # Süre, süreç başlatılmadan hemen önceden ölçüm işaretine kadar geçen duvar saati süresidir
+    # (yorumlayıcının açılışı dahil). En hızlı çalıştırma raporlanır.
+    code = STARTUP_PRELUDE.format(repo=os.path.dirname(os.path.abspath(__file__)), heavy=HEAVY_MODULES) + STARTUP_CASES[name]
+    runs = []
+    workdir = tempfile.mkdtemp(prefix="converty-startup-")
+    try:
+        for _ in range(max(1, repeat)):
+            started = time.time()
+            process = subprocess.run([sys.executable, "-c", code], cwd=workdir, capture_output=True, text=True,
+                                     timeout=120)
+            try:
+                marker = json.loads(process.stdout.strip().splitlines()[-1])
+            except (IndexError, ValueError):
+                error = (process.stderr.strip().splitlines() or [f"exit code {process.returncode}"])[-1]
+                return {"error": error}
+            runs.append({"startup_seconds": round(marker["at"] - started, 3), "heavy_modules": marker["heavy"]})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return min(runs, key=lambda r: r["startup_seconds"])
+
+def build_cases(corpus_dir, quick, jobs_values, patterns):
+    cases = []
+    for name, (kind, _, _, _) in CORPORA.items():
+        conversion = "pdf_to_pptx" if kind == "pdf" else "pptx_to_pdf"
+        settings = PDF_SETTINGS if kind == "pdf" else PPTX_SETTINGS
+        for setting_name, setting in settings.items():
+            for jobs in jobs_values:
+                case_name = f"{conversion}/{name}/{setting_name}/j{jobs}"
+                if patterns and not any(fnmatch.fnmatch(case_name, p) for p in patterns):
+                    continue
+                cases.append({"name": case_name, "conversion": conversion, "corpus": name, "settings": setting,
+                              "jobs": jobs})
+    corpora = {}
+    for case in cases:
+        if case["corpus"] not in corpora:
+            corpora[case["corpus"]] = generate_corpus(corpus_dir, case["corpus"], quick)
+        case["paths"] = corpora[case["corpus"]]["paths"]
+        case["pages"] = corpora[case["corpus"]]["pages"]
+    return cases, corpora
+
+def run_benchmark(output_path, corpus_dir=None, quick=False, jobs_values=None, patterns=None, repeat=1, log=print):
+    jobs_values = jobs_values or sorted({1, os.cpu_count() or 1})
+    temporary = corpus_dir is None
+    corpus_dir = corpus_dir or tempfile.mkdtemp(prefix="converty-corpus-")
+    try:
+        cases, corpora = build_cases(corpus_dir, quick, jobs_values, patterns)
+        report = {
+            "version": REPORT_VERSION,
+            "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "quick": quick,
+            "platform": {"python": platform.python_version(), "system": platform.platform(),
+                         "machine": platform.machine(), "cpu_count": os.cpu_count()},
+            "corpora": {name: {k: info[k] for k in ("kind", "pages", "bytes")} for name, info in corpora.items()},
+            "cases": []
+        }
+        for name in STARTUP_CASES:
+            case_name = f"startup/{name}"
+            if patterns and not any(fnmatch.fnmatch(case_name, p) for p in patterns):
+                continue
+            entry = dict(name=case_name, conversion="startup", **measure_startup(name, max(3, repeat)))
+            report["cases"].append(entry)
+            if "error" in entry:
+                log(f"{case_name}: {entry['error']}")
+            else:
+                log(f"{case_name}: {entry['startup_seconds']} s" +
+                    (f", loaded {', '.join(entry['heavy_modules'])}" if entry["heavy_modules"] else ""))
+        for case in cases:
+            # Birden fazla tekrar yapılırsa en hızlı çalıştırma raporlanır (ısınma ve gürültü etkisi azalır).
+            runs = [measure(case) for _ in range(max(1, repeat))]
+            ok = [r for r in runs if "error" not in r]
+            result = min(ok, key=lambda r: r["seconds"]) if ok else runs[0]
+            entry = dict(name=case["name"], conversion=case["conversion"], corpus=case["corpus"],
+                         settings=case["settings"], jobs=case["jobs"], **result)
+            report["cases"].append(entry)
+            if "error" in entry:
+                log(f"{case['name']}: {entry['error']}")
+            else:
+                log(f"{case['name']}: {entry['pages_per_second']} pages/s, {entry['peak_rss_mb']} MB, "
+                    f"{entry['output_bytes']} bytes" + (f", {entry['failed']} failed" if entry["failed"] else ""))
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return report
+    finally:
+        if temporary:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+def percentile(values, p):
+    # En yakın sıra yöntemi; değer yoksa None.
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, int(round(p / 100.0 * len(ordered) + 0.5)) - 1))]
+
+def service_request(address, conversion, path, upload, priority, token=None):
+    # Tek istek: gönder, olay akışı kapanana kadar bekle, çıktıyı indir, işi sil. Dönüş: ölçülen alanlar.
+    import conversion_service
+    started = time.perf_counter()
+    connection = conversion_service.connect(address, 600)
+    try:
+        if upload:
+            with open(path, "rb") as f:
+                body = f.read()
+            query = urllib.parse.urlencode({"conversion": conversion, "filename": os.path.basename(path), "priority": priority})
+            connection.request("POST", f"/jobs?{query}", body, {"Content-Type": "application/octet-stream",
+                                                               conversion_service.TOKEN_HEADER: token or ""})
+        else:
+            body = json.dumps({"conversion": conversion, "inputs": [path], "priority": priority})
+            connection.request("POST", "/jobs", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        job = json.loads(response.read())
+        if response.status != 202:
+            return {"error": job.get("error", f"HTTP {response.status}"), "latency": time.perf_counter() - started}
+        connection.request("GET", f"/jobs/{job['id']}/events")
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        connection = conversion_service.connect(address, 600)
+        connection.request("GET", f"/jobs/{job['id']}")
+        job = json.loads(connection.getresponse().read())
+        connection.request("GET", f"/jobs/{job['id']}/result")
+        response = connection.getresponse()
+        output = response.read()
+        output_bytes = len(output) if response.status == 200 else 0
+        latency = time.perf_counter() - started
+        connection.request("DELETE", f"/jobs/{job['id']}")
+        connection.getresponse().read()
+        return {"state": job["state"], "latency": latency, "wait": (job["started"] or job["finished"]) - job["created"],
+                "pages": sum(r.get("pages", 0) for r in job.get("results") or ()), "output_bytes": output_bytes}
+    except OSError as e:
+        return {"error": f"{type(e).__name__}: {e}", "latency": time.perf_counter() - started}
+    finally:
+        connection.close()
+
+def run_service_benchmark(address, conversion, corpus, requests, concurrency, upload=False, corpus_dir=None, quick=False,
+                          log=print, token=None):
+    # Çalışan bir servise aynı anda en çok "concurrency" istek gönderilir; verim ve gecikme yüzdelikleri raporlanır.
+    temporary = corpus_dir is None
+    corpus_dir = corpus_dir or tempfile.mkdtemp(prefix="converty-corpus-")
+    try:
+        info = generate_corpus(corpus_dir, corpus, quick)
+        paths = [os.path.abspath(info["paths"][i % len(info["paths"])]) for i in range(requests)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(lambda path: service_request(address, conversion, path, upload, 0, token), paths))
+        seconds = time.perf_counter() - started
+        done = [r for r in results if r.get("state") == "done"]
+        latencies = [r["latency"] for r in done]
+        errors = sorted({r.get("error") or r["state"] for r in results if r.get("state") != "done"})
+        report = {
+            "address": address, "conversion": conversion, "corpus": corpus, "upload": upload,
+            "requests": requests, "concurrency": concurrency, "succeeded": len(done), "failed": requests - len(done),
+            "errors": errors[:3],
+            "seconds": round(seconds, 3),
+            "requests_per_second": round(len(done) / seconds, 2) if seconds > 0 else None,
+            "pages_per_second": round(sum(r["pages"] for r in done) / seconds, 2) if seconds > 0 else None,
+            "output_bytes": sum(r["output_bytes"] for r in done),
+            "mean_wait_seconds": round(sum(r["wait"] for r in done) / len(done), 3) if done else None
+        }
+        for p in (50, 90, 99):
+            value = percentile(latencies, p)
+            report[f"latency_p{p}_seconds"] = round(value, 3) if value is not None else None
+        report["latency_max_seconds"] = round(max(latencies), 3) if latencies else None
+        log(f"{report['succeeded']}/{requests} requests, {report['requests_per_second']} req/s, "
+            f"p50 {report['latency_p50_seconds']} s, p99 {report['latency_p99_seconds']} s")
+        return report
+    finally:
+        if temporary:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+# Karşılaştırılan ölçümler: (alan, büyümesi mi kötü)
+COMPARED_METRICS = [("pages_per_second", False), ("peak_rss_mb", True), ("output_bytes", True),
+                    ("startup_seconds", True)]
+
+def compare_reports(old, new, threshold=0.10):
+    # Her ortak durum için değişim oranı hesaplanır; eşik aşılan kötüleşmeler gerileme sayılır.
+    old_cases = {c["name"]: c for c in old["cases"] if "error" not in c}
+    rows = []
+    for case in new["cases"]:
+        before = old_cases.get(case["name"])
+        if before is None or "error" in case:
+            continue
+        for metric, higher_is_worse in COMPARED_METRICS:
+            a, b = before.get(metric), case.get(metric)
+            if not a or b is None:
+                continue
+            change = (b - a) / a
+            worse = change > threshold if higher_is_worse else change < -threshold
+            rows.append({"case": case["name"], "metric": metric, "old": a, "new": b,
+                         "change": round(change, 4), "regression": worse})
+        loaded = sorted(set(case.get("heavy_modules", ())) - set(before.get("heavy_modules", ())))
+        if loaded:
+            # Açılışta yeniden yüklenmeye başlayan ağır kütüphane, süre eşiği aşılmasa da gerilemedir.
+            rows.append({"case": case["name"], "metric": "heavy_modules", "old": len(before.get("heavy_modules", ())),
+                         "new": len(case["heavy_modules"]), "change": None, "regression": True})
+        if case.get("failed", 0) > before.get("failed", 0):
+            rows.append({"case": case["name"], "metric": "failed", "old": before.get("failed", 0),
+                         "new": case["failed"], "change": None, "regression": True})
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="converty-benchmark", description="Converty benchmark suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Generate the corpora and measure every case")
+    run.add_argument("-o", "--output", required=True, help="JSON report path")
+    run.add_argument("--corpus-dir", help="Keep generated corpora here and reuse them on later runs")
+    run.add_argument("--quick", action="store_true", help="Smaller corpora for a fast smoke run")
+    run.add_argument("--jobs", type=int, nargs="+", help="Concurrency levels to measure (default: 1 and CPU count)")
+    run.add_argument("--cases", nargs="+", help="Only run cases matching these patterns, e.g. 'pdf_to_pptx/text/*'")
+    run.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is reported")
+    compare = commands.add_parser("compare", help="Compare two reports and flag regressions")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--threshold", type=float, default=0.10, help="Relative change treated as a regression")
+    service = commands.add_parser("service", help="Measure throughput and latency of a running 'converty serve'")
+    service.add_argument("--address", default="http://127.0.0.1:8765", help="http://host:port or unix:/path/to/socket")
+    service.add_argument("--conversion", choices=["pdf_to_pptx", "pptx_to_pdf"], default="pdf_to_pptx")
+    service.add_argument("--corpus", choices=list(CORPORA), help="Corpus whose files are sent (default: text or pptx_small)")
+    service.add_argument("--requests", type=int, default=40, help="Requests sent in total, one file each")
+    service.add_argument("--concurrency", type=int, nargs="+", default=[1, 4], help="Requests in flight; one run per value")
+    service.add_argument("--upload", action="store_true", help="Send the file contents instead of their paths")
+    service.add_argument("--token", default=os.environ.get("CONVERTY_SERVICE_TOKEN"),
+                         help="Service key for uploads, printed by 'converty serve' (default: $CONVERTY_SERVICE_TOKEN)")
+    service.add_argument("--corpus-dir", help="Keep generated corpora here and reuse them on later runs")
+    service.add_argument("--quick", action="store_true", help="Smaller corpora for a fast smoke run")
+    service.add_argument("-o", "--output", help="Also write the JSON report to this file")
+    args = parser.parse_args(argv)
+    if args.command == "service":
+        corpus = args.corpus or ("text" if args.conversion == "pdf_to_pptx" else "pptx_small")
+        log = lambda m: print(m, file=sys.stderr)
+        runs = [run_service_benchmark(args.address, args.conversion, corpus, args.requests, concurrency, args.upload,
+                                      args.corpus_dir, args.quick, log, args.token) for concurrency in args.concurrency]
+        report = {"version": REPORT_VERSION, "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "runs": runs}
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return 0 if all(run["failed"] == 0 for run in runs) else 1
+    if args.command == "run":
+        run_benchmark(args.output, args.corpus_dir, args.quick, args.jobs, args.cases, args.repeat,
+                      log=lambda m: print(m, file=sys.stderr))
+        return 0
+    with open(args.old, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    with open(args.new, "r", encoding="utf-8") as f:
+        new = json.load(f)
+    rows = compare_reports(old, new, args.threshold)
+    for row in rows:
+        change = "" if row["change"] is None else f"{row['change'] * 100:+.1f}%"
+        mark = "REGRESSION" if row["regression"] else ""
+        print(f"{row['case']:<45} {row['metric']:<17} {row['old']!s:>12} -> {row['new']!s:<12} {change:>8} {mark}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
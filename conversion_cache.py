@@ -0,0 +1,135 @@
+import os, json, hashlib, shutil, tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Girdi dosyasının içerik özeti + dönüşüm seçenekleriyle anahtarlanan çıktı önbelleği.
+# Her kayıt bir çıktı dosyası ve yanında sonuç bilgisini tutan bir .json dosyasından oluşur;
+# son kullanım zamanı dosyanın mtime değeridir, boyut sınırı (iki dosyanın toplamı) aşılınca en eski kayıtlar silinir.
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.environ.get("CONVERTY_CACHE_DIR") or os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"), "converty")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+# Çıktıyı etkileyen seçenekler; iş sayısı, sayfa penceresi gibi ayarlar anahtara girmez.
+KEY_OPTIONS = {
+    "pdf_to_pptx": ["dpi", "image_format", "quality", "grayscale", "writer", "pptx_engine"],
+    "pptx_to_pdf": ["pdf_engine"]
+}
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ConversionCache:
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.entries = self.scan()
+
+    def scan(self):
+        entries = {}
+        sidecars = {}
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            st = entry.stat()
+            if entry.name.endswith(".json"):
+                sidecars[entry.name[:-5]] = st.st_size
+            else:
+                entries[entry.name] = (st.st_mtime, st.st_size)
+        return {name: (mtime, size + sidecars.get(name, 0)) for name, (mtime, size) in entries.items()}
+
+    def total_bytes(self):
+        return sum(size for _, size in self.entries.values())
+
+    def keys(self, conversion_key, input_paths, options, jobs=1):
+        relevant = {k: options.get(k) for k in KEY_OPTIONS[conversion_key]}
+        suffix = hashlib.sha256(json.dumps([CACHE_VERSION, conversion_key, relevant], sort_keys=True).encode()).hexdigest()[:16]
+        def key(path):
+            try:
+                return f"{file_digest(path)}-{suffix}"
+            except OSError:
+                return None
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            return list(executor.map(key, input_paths))
+
+    def _entry_name(self, key, output_path):
+        return key + os.path.splitext(output_path)[1].lower()
+
+    def fetch(self, key, output_path):
+        name = self._entry_name(key, output_path) if key else None
+        if name is None or name not in self.entries:
+            self.misses += 1
+            return None
+        path = os.path.join(self.cache_dir, name)
+        try:
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            shutil.copyfile(path, output_path)
+            os.utime(path)
+        except OSError:
+            self.entries.pop(name, None)
+            self.misses += 1
+            return None
+        self.entries[name] = (os.path.getmtime(path), self.entries[name][1])
+        self.hits += 1
+        meta["cached"] = True
+        return meta
+
+    def store(self, key, output_path, meta):
+        if not key or not os.path.exists(output_path):
+            return
+        name = self._entry_name(key, output_path)
+        path = os.path.join(self.cache_dir, name)
+        size = os.path.getsize(output_path)
+        if size > self.max_bytes:
+            return
+        fd, tmp = tempfile.mkstemp(prefix=".", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(output_path, tmp)
+            with open(path + ".json", "w", encoding="utf-8") as f:
+                json.dump({k: v for k, v in meta.items() if k not in ("input", "output", "cached")}, f)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self.entries[name] = (os.path.getmtime(path), size + os.path.getsize(path + ".json"))
+        self.evict()
+
+    def evict(self):
+        total = self.total_bytes()
+        for name, (_, size) in sorted(self.entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            path = os.path.join(self.cache_dir, name)
+            for stale in (path, path + ".json"):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            del self.entries[name]
+            total -= size
+            self.evictions += 1
+
+    def purge(self):
+        removed = len(self.entries)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.entries = {}
+        return removed
+
+    def stats(self):
+        return {
+            "dir": self.cache_dir,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes()
+        }
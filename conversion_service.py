@@ -0,0 +1,520 @@
+import os, re, hmac, json, time, heapq, shutil, socket, secrets, threading, ipaddress, itertools, zipfile, http.client
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingUnixStreamServer
+
+# Yerel dönüşüm servisi. İşler yalnızca geri döngü (127.0.0.1/::1) adresinden veya bir Unix soketinden
+# kabul edilir ve öncelik sırasıyla (büyük sayı önce, eşitlikte geliş sırası) dönüştürücü iş parçacıklarına
+# verilir. Dönüşümün kendisi ve paylaşılan sıcak havuzlar çağıranın verdiği run_job fonksiyonundadır.
+#
+# Aynı makinedeki her süreç (ve geri döngüye istek atan her tarayıcı sayfası) servise ulaşabildiği için:
+# Host başlığı geri döngü olmayan (DNS yeniden bağlama) ve Origin başlığı başka bir siteyi gösteren istekler
+# reddedilir; ham bayt yüklemeleri servisin başlangıçta ürettiği anahtarı (X-Converty-Token) ister; yol ile
+# gönderilen girdiler yalnızca input_roots altından okunur, çıktılar yalnızca servisin klasörlerine yazılır.
+#
+#   POST   /jobs                 {"conversion", "inputs": [yollar], "output"?, "options"?, "priority"?, "zip"?}
+#                                output: output_root altındaki göreli bir klasör
+#   POST   /jobs?conversion=..&filename=..[&priority=..&zip=1]   gövde: tek bir dosyanın baytları
+#   GET    /jobs, /jobs/<id>     durum
+#   GET    /jobs/<id>/events     ilerleme olayları (text/event-stream), iş bitince kapanır
+#   GET    /jobs/<id>/result     ZIP, tek çıktı ya da başarılı çıktılardan oluşturulan ZIP
+#   POST   /jobs/<id>/cancel     iptal
+#   DELETE /jobs/<id>            iptal eder ve işi (servisin klasöründeki dosyalarıyla) unutur
+#   GET    /status               kuyruk, çalışan işler, havuzlar
+
+FINISHED = ("done", "failed", "cancelled")
+SAFE_NAME = re.compile(r"[^\w.\- ()]+")
+TOKEN_HEADER = "X-Converty-Token"
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def loopback_authority(value):
+    # Host ("127.0.0.1:8765", "[::1]:8765", "localhost") veya Origin ("http://localhost:8765") değeri.
+    try:
+        host = urllib.parse.urlsplit(value if "//" in value else "//" + value).hostname
+    except ValueError:
+        return False
+    return host is not None and is_loopback(host)
+
+def within(path, roots):
+    # Sembolik bağlantılar çözüldükten sonra yol köklerden birinin içinde mi
+    real = os.path.realpath(path)
+    return any(os.path.commonpath([real, root]) == root for root in roots)
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class Job:
+    def __init__(self, job_id, conversion, inputs, output_folder, options, zip_option, priority, spool):
+        self.id = job_id
+        self.conversion = conversion
+        self.inputs = inputs
+        self.output_folder = output_folder
+        self.options = options
+        self.zip = zip_option
+        self.priority = priority
+        # spool: işe ait, servisin oluşturduğu klasör (yüklemeler ve varsayılan çıktı); iş silinince kaldırılır.
+        self.spool = spool
+        self.state = "queued"
+        self.error = None
+        self.batch = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.events = []
+        self.cond = threading.Condition()
+        self.cancel = None
+        self.event("queued", priority=priority, files=len(inputs))
+
+    def event(self, kind, **fields):
+        with self.cond:
+            self.events.append(dict(fields, seq=len(self.events) + 1, event=kind, time=round(time.time(), 3)))
+            self.cond.notify_all()
+
+    def snapshot(self):
+        with self.cond:
+            progress = next((e for e in reversed(self.events) if e["event"] == "progress"), None)
+            summary = {"id": self.id, "conversion": self.conversion, "state": self.state, "priority": self.priority,
+                       "files": len(self.inputs), "output_folder": self.output_folder, "zip": self.zip,
+                       "created": self.created, "started": self.started, "finished": self.finished, "error": self.error,
+                       "completed": progress["completed"] if progress else 0}
+            if self.batch is not None:
+                summary.update({k: self.batch[k] for k in ("succeeded", "failed", "cancelled", "seconds", "results")})
+                summary["zip_path"] = self.batch["zip"]
+            return summary
+
+class ConversionService:
+    # run_job(job, progress) toplu işi çalıştırıp convert_files sonucunu döndürür; progress(completed, total, message).
+    # validate(conversion, inputs, options) geçersiz istekte ValueError yükseltir.
+    # input_roots: yol ile gönderilen girdilerin bulunabileceği klasörler (boşsa yalnızca yükleme kabul edilir).
+    # output_root: istemcinin "output" ile seçebileceği klasörlerin kökü (varsayılan: spool_dir/outputs).
+    def __init__(self, run_job, spool_dir, workers=1, validate=None, make_cancel=None, keep_finished=1000,
+                 input_roots=(), output_root=None):
+        self.run_job = run_job
+        self.validate = validate or (lambda conversion, inputs, options: None)
+        self.make_cancel = make_cancel
+        self.spool_dir = os.path.abspath(spool_dir)
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self.input_roots = [os.path.realpath(root) for root in input_roots]
+        self.output_root = os.path.realpath(output_root or os.path.join(self.spool_dir, "outputs"))
+        self.keep_finished = keep_finished
+        self.jobs = {}
+        self.heap = []
+        self.sequence = itertools.count()
+        self.ids = itertools.count(1)
+        self.lock = threading.Condition()
+        self.stopping = False
+        self.started = time.monotonic()
+        self.counters = {"submitted": 0, "done": 0, "failed": 0, "cancelled": 0}
+        self.threads = [threading.Thread(target=self.run_worker, daemon=True) for _ in range(max(1, workers))]
+        for thread in self.threads:
+            thread.start()
+
+    def readable(self, path):
+        return within(path, self.input_roots)
+
+    def check_inputs(self, inputs):
+        if not isinstance(inputs, list) or not all(isinstance(p, str) for p in inputs):
+            raise ServiceError(400, "inputs must be a list of paths")
+        if not self.input_roots:
+            raise ServiceError(403, "This service only accepts uploads (start it with --input-root to allow paths)")
+        # Glob deseninde jokerden önceki klasör denetlenir; bulunan dosyalar ayrıca readable() ile süzülür.
+        outside = [p for p in inputs if not os.path.isabs(p) or not self.readable(re.split(r"[*?\[]", p)[0] or os.sep)]
+        if outside:
+            raise ServiceError(403, f"Inputs must be absolute paths inside the input roots: {', '.join(outside)}")
+
+    def output_folder(self, output):
+        # İstemcinin verdiği klasör output_root altında göreli olmalı; ".." ve bağlantılarla dışarı çıkamaz.
+        if not isinstance(output, str) or not output or os.path.isabs(output) or os.path.splitdrive(output)[0]:
+            raise ServiceError(400, "output must be a folder name relative to the service output root")
+        folder = os.path.join(self.output_root, output)
+        if not within(folder, [self.output_root]):
+            raise ServiceError(403, f"output must stay inside the service output root: {output}")
+        return folder
+
+    def submit(self, conversion, inputs, output=None, options=None, zip_option=False, priority=0, spool=None):
+        # spool verilirse (yükleme) girdi servisin kendi klasöründedir ve çıktı da oraya yazılır.
+        if options is not None and not isinstance(options, dict):
+            raise ServiceError(400, "options must be an object")
+        options = dict(options or {})
+        if spool is None:
+            self.check_inputs(inputs)
+        output_folder = self.output_folder(output) if output is not None else None
+        priority = int(priority)
+        self.validate(conversion, inputs, options)
+        with self.lock:
+            if self.stopping:
+                raise ServiceError(503, "Service is shutting down")
+            job_id = f"{next(self.ids):06d}-{os.urandom(3).hex()}"
+        if spool is None and output_folder is None:
+            spool = os.path.join(self.spool_dir, job_id)
+        if output_folder is None:
+            output_folder = os.path.join(spool, "output")
+        job = Job(job_id, conversion, inputs, output_folder, options, bool(zip_option), priority, spool)
+        with self.lock:
+            self.jobs[job_id] = job
+            self.counters["submitted"] += 1
+            heapq.heappush(self.heap, (-job.priority, next(self.sequence), job))
+            self.lock.notify()
+        return job
+
+    def upload(self, conversion, filename, stream, length, priority=0, zip_option=False, options=None):
+        # Gövde doğrudan işe ait klasöre yazılır; bellekte tutulmaz.
+        name = SAFE_NAME.sub("_", os.path.basename(filename or "")).strip(". ") or "input"
+        spool = os.path.join(self.spool_dir, f"upload-{os.urandom(6).hex()}")
+        os.makedirs(os.path.join(spool, "input"))
+        path = os.path.join(spool, "input", name)
+        remaining = length
+        with open(path, "wb") as f:
+            while remaining > 0:
+                block = stream.read(min(1024 * 1024, remaining))
+                if not block:
+                    break
+                f.write(block)
+                remaining -= len(block)
+        if remaining:
+            shutil.rmtree(spool, ignore_errors=True)
+            raise ServiceError(400, "Request body ended early")
+        try:
+            return self.submit(conversion, [path], None, options, zip_option, priority, spool)
+        except Exception:
+            shutil.rmtree(spool, ignore_errors=True)
+            raise
+
+    def get(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            raise ServiceError(404, f"No such job: {job_id}")
+        return job
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        with self.lock:
+            if job.state == "queued":
+                # Kuyruktaki iş hiç başlamadan biter; yığından çalışan tarafından alınınca atlanır.
+                self.finish(job, "cancelled")
+            elif job.state == "running" and job.cancel is not None:
+                job.cancel.cancel()
+        return job
+
+    def forget(self, job_id):
+        job = self.cancel(job_id)
+        with job.cond:
+            while job.state not in FINISHED:
+                job.cond.wait()
+        with self.lock:
+            self.jobs.pop(job_id, None)
+        if job.spool:
+            shutil.rmtree(job.spool, ignore_errors=True)
+
+    def finish(self, job, state, batch=None, error=None):
+        # self.lock altında veya iş parçacığının sahip olduğu iş için çağrılır.
+        with job.cond:
+            job.state = state
+            job.batch = batch
+            job.error = error
+            job.finished = time.time()
+        self.counters[state] += 1
+        job.event(state, **({"succeeded": batch["succeeded"], "failed": batch["failed"],
+                             "cancelled": batch["cancelled"], "seconds": batch["seconds"]} if batch else {}),
+                  **({"error": error} if error else {}))
+        self.prune()
+
+    def prune(self):
+        # Bitmiş işlerin en eskileri unutulur (servis klasöründeki dosyalarıyla birlikte).
+        finished = [job for job in self.jobs.values() if job.state in FINISHED]
+        for job in sorted(finished, key=lambda j: j.finished)[:max(0, len(finished) - self.keep_finished)]:
+            del self.jobs[job.id]
+            if job.spool:
+                shutil.rmtree(job.spool, ignore_errors=True)
+
+    def run_worker(self):
+        while True:
+            with self.lock:
+                while not self.heap and not self.stopping:
+                    self.lock.wait()
+                if self.stopping:
+                    return
+                _, _, job = heapq.heappop(self.heap)
+                if job.state != "queued":
+                    continue
+                job.state = "running"
+                job.started = time.time()
+                job.cancel = self.make_cancel() if self.make_cancel else None
+            job.event("started", waited=round(job.started - job.created, 3))
+            def progress(completed, total, message):
+                job.event("progress", completed=completed, total=total, message=message)
+            try:
+                batch = self.run_job(job, progress)
+            except Exception as e:
+                state, batch, error = "failed", None, f"{type(e).__name__}: {e}"
+            else:
+                error = None
+                if batch["cancelled"]:
+                    state = "cancelled"
+                else:
+                    state = "done" if batch["failed"] == 0 else "failed"
+            with self.lock:
+                self.finish(job, state, batch, error)
+            # İşaret, iş bittikten sonra kaldırılır; bitmiş işe gelen iptal isteği yeni işaret bırakmaz.
+            if job.cancel is not None and hasattr(job.cancel, "close"):
+                job.cancel.close()
+
+    def result_file(self, job):
+        # Dönüş: (yol, indirme adı, içerik türü).
+        if job.state not in FINISHED or job.batch is None:
+            raise ServiceError(409, f"Job {job.id} is {job.state}")
+        if job.batch["zip"]:
+            return job.batch["zip"], os.path.basename(job.batch["zip"]), "application/zip"
+        outputs = [r["output"] for r in job.batch["results"] if r["status"] == "done" and r["output"]]
+        if not outputs:
+            raise ServiceError(409, f"Job {job.id} produced no output")
+        if len(outputs) == 1:
+            content_type = "application/pdf" if outputs[0].lower().endswith(".pdf") else \
+                "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+            return outputs[0], os.path.basename(outputs[0]), content_type
+        path = os.path.join(job.spool or job.output_folder, f"converty-{job.id}.zip")
+        if not os.path.exists(path):
+            # Desteler ve PDF'ler zaten sıkıştırılmış; yeniden sıkıştırılmadan paketlenir.
+            with zipfile.ZipFile(path + ".tmp", "w", zipfile.ZIP_STORED) as package:
+                for output in outputs:
+                    package.write(output, os.path.basename(output))
+            os.replace(path + ".tmp", path)
+        return path, os.path.basename(path), "application/zip"
+
+    def status(self):
+        with self.lock:
+            states = {}
+            for job in self.jobs.values():
+                states[job.state] = states.get(job.state, 0) + 1
+            return dict(self.counters, queued=states.get("queued", 0), running=states.get("running", 0),
+                        workers=len(self.threads), uptime_seconds=round(time.monotonic() - self.started, 1))
+
+    def close(self):
+        # Kuyruktaki işler iptal edilir, çalışanlar iptal işaretiyle durdurulup beklenir.
+        with self.lock:
+            self.stopping = True
+            for job in self.jobs.values():
+                if job.state == "queued":
+                    self.finish(job, "cancelled")
+                elif job.state == "running" and job.cancel is not None:
+                    job.cancel.cancel()
+            self.lock.notify_all()
+        for thread in self.threads:
+            thread.join()
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "Converty"
+
+    def address_string(self):
+        # Unix soketinde istemci adresi yoktur.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.log is not None:
+            self.server.log(f"{self.address_string()} {format % args}")
+
+    def send_json(self, status, payload):
+        self.responded = True
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def check_origin(self):
+        # Tarayıcı sayfalarından gelen istekler: başka bir alan adıyla (DNS yeniden bağlama) ya da başka bir
+        # siteden (Origin) gelenler reddedilir.
+        if not loopback_authority(self.headers.get("Host") or ""):
+            raise ServiceError(403, "Requests must be addressed to a loopback host")
+        origin = self.headers.get("Origin")
+        if origin is not None and not loopback_authority(origin):
+            raise ServiceError(403, f"Cross-origin requests are not accepted: {origin}")
+
+    def route(self, method):
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        parts = [p for p in url.path.split("/") if p]
+        service = self.server.service
+        self.responded = False
+        try:
+            self.check_origin()
+            if method == "GET" and parts == ["status"]:
+                return self.send_json(200, dict(service.status(), pools=self.server.pool_stats()))
+            if parts == ["jobs"] and method == "GET":
+                with service.lock:
+                    jobs = list(service.jobs.values())
+                return self.send_json(200, [{k: v for k, v in job.snapshot().items() if k != "results"} for job in jobs])
+            if parts == ["jobs"] and method == "POST":
+                return self.send_json(202, self.submit(query).snapshot())
+            if len(parts) >= 2 and parts[0] == "jobs":
+                job = service.get(parts[1])
+                if len(parts) == 2 and method == "GET":
+                    return self.send_json(200, job.snapshot())
+                if len(parts) == 2 and method == "DELETE":
+                    service.forget(job.id)
+                    return self.send_json(200, {"id": job.id, "deleted": True})
+                if parts[2:] == ["cancel"] and method == "POST":
+                    return self.send_json(202, service.cancel(job.id).snapshot())
+                if parts[2:] == ["events"] and method == "GET":
+                    return self.stream_events(job, int(query.get("after") or self.headers.get("Last-Event-ID") or 0))
+                if parts[2:] == ["result"] and method == "GET":
+                    return self.send_file(*service.result_file(job))
+            raise ServiceError(404, f"Unknown endpoint: {method} {url.path}")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        except ServiceError as e:
+            self.send_error_json(e.status, str(e))
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_error_json(400, f"{type(e).__name__}: {e}")
+        except FileNotFoundError as e:
+            self.send_error_json(404, f"{type(e).__name__}: {e}")
+        except PermissionError as e:
+            self.send_error_json(403, f"{type(e).__name__}: {e}")
+        except Exception as e:
+            # Disk dolu, okunamayan çıktı, beklenmedik dönüşüm hataları: istek 500 ile yanıtlanır, servis çalışmaya devam eder.
+            self.log_message("%s %s failed: %s", method, url.path, f"{type(e).__name__}: {e}")
+            self.send_error_json(500, f"{type(e).__name__}: {e}")
+
+    def send_error_json(self, status, message):
+        # Gövdesi okunmamış olabilecek bir isteğin ardından bağlantı yeniden kullanılmaz. Yanıtın başı
+        # gönderildiyse (dosya, olay akışı) hata gövdeye yazılamaz, yalnızca bağlantı kapatılır.
+        self.close_connection = True
+        if self.responded:
+            return
+        try:
+            self.send_json(status, {"error": message})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def submit(self, query):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length < 0:
+            raise ServiceError(400, "Invalid Content-Length")
+        if self.headers.get("Content-Type", "").split(";")[0].strip() == "application/json":
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ServiceError(400, "The request body must be a JSON object")
+            return self.server.service.submit(request["conversion"], request["inputs"], request.get("output"),
+                                              request.get("options"), request.get("zip", False), request.get("priority", 0))
+        # Ham baytlar: tarayıcıların özel başlık gönderebilmesi için ön kontrol (CORS) gerekir, servis buna izin
+        # vermez; anahtar yalnızca servisi başlatanın elindedir.
+        token = self.headers.get(TOKEN_HEADER) or ""
+        if not hmac.compare_digest(token.encode(), self.server.token.encode()):
+            raise ServiceError(401, f"Uploads need the service token in the {TOKEN_HEADER} header")
+        if "conversion" not in query:
+            raise ServiceError(400, "Uploads need a ?conversion= parameter")
+        options = json.loads(query["options"]) if "options" in query else None
+        return self.server.service.upload(query["conversion"], query.get("filename"), self.rfile, length,
+                                          int(query.get("priority", 0)), query.get("zip") in ("1", "true"), options)
+
+    def stream_events(self, job, after):
+        # Olaylar Server-Sent Events biçiminde akıtılır; iş bitip son olay gönderilince bağlantı kapanır.
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.responded = True
+        self.close_connection = True
+        sent = after
+        while True:
+            with job.cond:
+                while len(job.events) <= sent and job.state not in FINISHED:
+                    job.cond.wait(15)
+                    if len(job.events) <= sent:
+                        break
+                events = job.events[sent:]
+                finished = job.state in FINISHED
+            try:
+                if not events:
+                    # Boşta kalan bağlantıların kopup kopmadığı yorum satırıyla anlaşılır.
+                    self.wfile.write(b": keep-alive\n\n")
+                for event in events:
+                    self.wfile.write(f"id: {event['seq']}\nevent: {event['event']}\ndata: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            sent += len(events)
+            if finished and sent >= len(job.events):
+                return
+
+    def send_file(self, path, name, content_type):
+        size = os.path.getsize(path)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{urllib.parse.quote(name)}")
+        self.end_headers()
+        self.responded = True
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile, 1024 * 1024)
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+    def do_DELETE(self):
+        self.route("DELETE")
+
+class LoopbackHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+class UnixHTTPServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        super().server_bind()
+        # Yalnızca servisi başlatan kullanıcı bağlanabilir.
+        os.chmod(self.server_address, 0o600)
+
+def create_server(service, host="127.0.0.1", port=8765, unix_socket=None, pool_stats=None, log=None, token=None):
+    # token: yüklemeler için istenen anahtar; verilmezse rastgele üretilir (server.token).
+    if unix_socket:
+        server = UnixHTTPServer(unix_socket, ServiceHandler)
+    else:
+        if not is_loopback(host):
+            raise ValueError(f"The service only listens on loopback addresses, not {host}")
+        server_class = LoopbackHTTPServer
+        if ":" in host:
+            server_class = type("LoopbackHTTPServer6", (LoopbackHTTPServer,), {"address_family": socket.AF_INET6})
+        server = server_class((host, port), ServiceHandler)
+    server.service = service
+    server.token = token or secrets.token_urlsafe(24)
+    server.pool_stats = pool_stats or (lambda: None)
+    server.log = log
+    return server
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    # İstemciler için: http.client bağlantısı, TCP yerine Unix soketi üzerinden.
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+def connect(address, timeout=None):
+    # address: "http://127.0.0.1:8765" ya da "unix:/yol/converty.sock"
+    if address.startswith("unix:"):
+        return UnixHTTPConnection(address[5:], timeout)
+    url = urllib.parse.urlsplit(address)
+    return http.client.HTTPConnection(url.hostname, url.port or 80, timeout=timeout)
@@ -0,0 +1,343 @@
+import os, sys, time, queue, select, struct, threading, collections, ctypes, ctypes.util
+
+# Sıcak klasör izleme: izlenen klasörlere gelen dosyalar yazılması bitince (boyutu ve zamanı
+# "settle" saniye boyunca değişmeyince) sınırlı bir kuyruğa alınır ve dönüştürücü iş parçacığına
+# toplu halde verilir. Linux'ta inotify kullanılır; başka sistemlerde veya ağ paylaşımlarında
+# (uzak istemcilerin yazdıkları inotify ile bildirilmez) klasörler belirli aralıklarla taranır.
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct("iIII")
+
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _libc.inotify_init1
+    except (OSError, AttributeError):
+        _libc = None
+
+def inotify_available():
+    return _libc is not None
+
+def scan_files(folder, recursive):
+    # os.scandir, stat bilgisini dizin girdisinden aldığı için listdir + stat'tan ucuzdur.
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.stat()
+            except OSError:
+                continue
+
+class InotifySource:
+    def __init__(self, folders, recursive):
+        self.recursive = recursive
+        self.fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.folders = {}
+        for folder in folders:
+            self.add_tree(folder)
+
+    def add_watch(self, folder):
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(folder), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"Cannot watch {folder}")
+        self.folders[wd] = folder
+
+    def add_tree(self, folder):
+        self.add_watch(folder)
+        if self.recursive:
+            for dirpath, dirnames, _ in os.walk(folder):
+                for name in dirnames:
+                    try:
+                        self.add_watch(os.path.join(dirpath, name))
+                    except (FileNotFoundError, NotADirectoryError):
+                        # Tarama ile izleme arasında silinen klasör
+                        continue
+
+    def poll(self, timeout):
+        # Dönüş: (değişen dosya yolları, yeniden tarama gerekli mi). Çekirdek kuyruğu taşarsa olaylar
+        # kaybolmuş olabilir; bu durumda çağıran klasörleri baştan tarar.
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return [], False
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return [], False
+        paths = []
+        rescan = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                rescan = True
+            elif mask & IN_IGNORED:
+                self.folders.pop(wd, None)
+            elif wd in self.folders and name:
+                path = os.path.join(self.folders[wd], os.fsdecode(name))
+                if mask & IN_ISDIR:
+                    if self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                        # Yeni klasör izlemeye alınır; izleme kurulmadan yazılmış dosyalar için taranır.
+                        # Olaydan sonra silinmişse atlanır; diğer hatalar (izin, izleme sınırı) çağırana gider.
+                        try:
+                            self.add_tree(path)
+                        except (FileNotFoundError, NotADirectoryError):
+                            continue
+                        paths.extend(p for p, _ in scan_files(path, True))
+                else:
+                    paths.append(path)
+        return paths, rescan
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingSource:
+    def __init__(self, folders, recursive, interval):
+        self.folders = folders
+        self.recursive = recursive
+        self.interval = interval
+        self.snapshot = self.scan()
+        self.next_scan = time.monotonic() + interval
+
+    def scan(self):
+        return {path: (st.st_size, st.st_mtime_ns) for folder in self.folders for path, st in scan_files(folder, self.recursive)}
+
+    def poll(self, timeout):
+        delay = self.next_scan - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return [], False
+        time.sleep(max(0.0, delay))
+        self.next_scan = time.monotonic() + self.interval
+        snapshot = self.scan()
+        changed = [path for path, signature in snapshot.items() if self.snapshot.get(path) != signature]
+        self.snapshot = snapshot
+        return changed, False
+
+    def close(self):
+        pass
+
+class HotFolder:
+    # convert(paths) dönüştürücü iş parçacığında çağrılır ve her yol için bir sonuç sözlüğü döndürür.
+    # is_current(path) doğru dönerse dosyanın çıktısı güncel sayılır (taramalarda atlanır).
+    # log(mesaj) izleme hatalarını bildirir. "expire" saniyeden uzun süre yazılmaya devam eden dosya bekleme
+    # listesinden çıkarılır (bir sonraki değişiklikte yeniden görülür); kuyruğa girmeyi bekleyen hazır dosyalar en
+    # çok "max_waiting" tanedir, fazlası bekleme listesi boşalınca yapılan taramayla yeniden bulunur.
+    def __init__(self, folders, suffixes, convert, recursive=False, settle=2.0, polling=False, poll_interval=1.0,
+                 queue_size=64, batch_size=8, exclude=(), is_current=None, log=None, expire=3600.0, max_waiting=10000):
+        self.folders = [os.path.abspath(f) for f in folders]
+        self.suffixes = tuple(suffixes)
+        self.convert = convert
+        self.recursive = recursive
+        self.settle = settle
+        self.polling = polling or not inotify_available()
+        self.poll_interval = poll_interval
+        self.batch_size = max(1, batch_size)
+        self.exclude = [os.path.join(os.path.abspath(e), "") for e in exclude]
+        self.is_current = is_current or (lambda path: False)
+        self.log = log or (lambda message: None)
+        self.expire = expire
+        self.max_waiting = max(1, max_waiting)
+        # Bekleme listesi dolduğu için bırakılan dosya var mı
+        self.deferred = False
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        # Yazılması süren dosyalar: yol -> (ilk görülme, son değişiklik, imza)
+        self.candidates = {}
+        # Hazır olup kuyrukta yer bekleyen dosyalar (kuyruk doluyken izleme durmasın diye)
+        self.waiting = collections.OrderedDict()
+        # Kuyrukta veya dönüşümde olan dosyaların imzası; aynı sürüm iki kez kuyruğa alınmaz.
+        self.handled = {}
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.started = time.monotonic()
+        self.counters = {"detected": 0, "converted": 0, "failed": 0, "cancelled": 0, "batches": 0, "in_progress": 0,
+                         "expired": 0, "deferred": 0, "errors": 0}
+        self.completions = collections.deque()
+        self.latency_total = 0.0
+        self.source = None
+        self.threads = []
+
+    def accept(self, path):
+        name = os.path.basename(path)
+        if name.startswith((".", "~$")) or not name.lower().endswith(self.suffixes):
+            return False
+        return not any(path.startswith(e) for e in self.exclude)
+
+    def start(self):
+        if self.polling:
+            self.source = PollingSource(self.folders, self.recursive, self.poll_interval)
+        else:
+            self.source = InotifySource(self.folders, self.recursive)
+        self.rescan()
+        self.threads = [threading.Thread(target=self.run_watcher, daemon=True),
+                        threading.Thread(target=self.run_converter, daemon=True)]
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        # Çalışan toplu dönüşüm bitene kadar beklenir; iptali çağıran taraf ayrıca tetikler.
+        self.stopping.set()
+        for thread in self.threads:
+            thread.join()
+        self.source.close()
+
+    def rescan(self):
+        # Çıktısı güncel olan dosyalar atlanır; taşma sonrası taramalar biten dosyaları yeniden dönüştürmez.
+        for folder in self.folders:
+            for path, _ in scan_files(folder, self.recursive):
+                if self.accept(path) and not self.is_current(path):
+                    self.touch(path)
+
+    def touch(self, path):
+        now = time.monotonic()
+        first = self.candidates[path][0] if path in self.candidates else now
+        self.candidates[path] = (first, now, None)
+
+    def check_candidates(self):
+        # Son olaydan sonra imzası "settle" süresince değişmeyen ve okunabilen dosya hazırdır.
+        now = time.monotonic()
+        for path, (first, changed, signature) in list(self.candidates.items()):
+            if now - first > self.expire:
+                del self.candidates[path]
+                with self.lock:
+                    self.counters["expired"] += 1
+                continue
+            if now - changed < self.settle and signature is not None:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self.candidates[path]
+                continue
+            current = (st.st_size, st.st_mtime_ns)
+            if current != signature:
+                self.candidates[path] = (first, now, current)
+                continue
+            try:
+                # Windows'ta yazan süreç dosyayı kilitli tutar; açılamıyorsa yazma sürüyordur.
+                with open(path, "rb"):
+                    pass
+            except OSError:
+                self.candidates[path] = (first, now, current)
+                continue
+            del self.candidates[path]
+            if self.is_current(path):
+                # Tarama sırasında kuyrukta olan ve o arada dönüştürülen dosya
+                continue
+            with self.lock:
+                if self.handled.get(path) == current:
+                    continue
+                if len(self.waiting) >= self.max_waiting:
+                    self.deferred = True
+                    self.counters["deferred"] += 1
+                    continue
+                self.handled[path] = current
+                self.counters["detected"] += 1
+                self.waiting[path] = first
+        with self.lock:
+            while self.waiting and not self.queue.full():
+                self.queue.put_nowait(self.waiting.popitem(last=False))
+            rescan = self.deferred and not self.waiting
+            if rescan:
+                self.deferred = False
+        if rescan:
+            self.rescan()
+
+    def fall_back(self, error):
+        # inotify hatası (izin, izleme sınırı, kapanan tanıtıcı): izleme durmaz, klasörler taranarak sürdürülür.
+        with self.lock:
+            self.counters["errors"] += 1
+        self.log(f"Watching failed ({type(error).__name__}: {error}); scanning every {self.poll_interval}s instead")
+        try:
+            self.source.close()
+        except OSError:
+            pass
+        self.polling = True
+        self.source = PollingSource(self.folders, self.recursive, self.poll_interval)
+        self.rescan()
+
+    def run_watcher(self):
+        while not self.stopping.is_set():
+            try:
+                paths, rescan = self.source.poll(min(0.5, self.settle))
+            except OSError as e:
+                if self.polling:
+                    # Tarama hataları scan_files içinde atlanır; buraya gelen beklenmedik bir hatadır.
+                    with self.lock:
+                        self.counters["errors"] += 1
+                    self.log(f"Scanning failed: {type(e).__name__}: {e}")
+                    self.stopping.wait(self.poll_interval)
+                else:
+                    self.fall_back(e)
+                continue
+            if rescan:
+                self.rescan()
+            for path in paths:
+                if self.accept(path):
+                    self.touch(path)
+            self.check_candidates()
+
+    def run_converter(self):
+        while not self.stopping.is_set():
+            try:
+                batch = [self.queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            with self.lock:
+                self.counters["in_progress"] = len(batch)
+            try:
+                results = self.convert([path for path, _ in batch])
+            except Exception as e:
+                results = [{"status": "failed", "error": f"{type(e).__name__}: {e}"} for _ in batch]
+            now = time.monotonic()
+            with self.lock:
+                self.counters["in_progress"] = 0
+                self.counters["batches"] += 1
+                for (path, first), result in zip(batch, results):
+                    status = result["status"] if result["status"] in ("failed", "cancelled") else "converted"
+                    self.counters[status] += 1
+                    self.handled.pop(path, None)
+                    if status != "cancelled":
+                        self.completions.append(now)
+                        self.latency_total += now - first
+
+    def stats(self, window=600.0):
+        # Verim son "window" saniyedeki tamamlanmalardan, gecikme ise ilk olaydan dönüşüm sonuna kadar ölçülür.
+        now = time.monotonic()
+        with self.lock:
+            while self.completions and now - self.completions[0] > window:
+                self.completions.popleft()
+            finished = self.counters["converted"] + self.counters["failed"]
+            elapsed = min(window, now - self.started)
+            return dict(self.counters,
+                        source="polling" if self.polling else "inotify",
+                        writing=len(self.candidates),
+                        backlog=len(self.waiting) + self.queue.qsize(),
+                        files_per_minute=round(len(self.completions) * 60.0 / elapsed, 2) if elapsed > 0 else 0.0,
+                        mean_latency_seconds=round(self.latency_total / finished, 3) if finished else None,
+                        uptime_seconds=round(now - self.started, 1))
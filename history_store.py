@@ -0,0 +1,127 @@
+import os, csv, sqlite3, threading
+
+# İşlem geçmişi için SQLite deposu. Her toplu iş "batches" tablosunda, iş içindeki her dosya
+# (durum, süre, hata) "files" tablosunda tutulur. Arayüz yalnızca görünen sayfayı sorgular;
+# tarih ve tür üzerindeki indeksler sayesinde yüz binlerce kayıtta da sorgular hızlı kalır.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    conversion TEXT NOT NULL,
+    mode INTEGER NOT NULL,
+    compressed INTEGER NOT NULL,
+    files INTEGER NOT NULL,
+    output TEXT NOT NULL,
+    seconds REAL
+);
+CREATE INDEX IF NOT EXISTS batches_date ON batches (date);
+CREATE INDEX IF NOT EXISTS batches_conversion_date ON batches (conversion, date);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    batch_id INTEGER NOT NULL REFERENCES batches (id) ON DELETE CASCADE,
+    input TEXT NOT NULL,
+    output TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    seconds REAL
+);
+CREATE INDEX IF NOT EXISTS files_batch ON files (batch_id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+BATCH_COLUMNS = "id, date, conversion, mode, compressed, files, output, seconds"
+
+def _filters(conversion=None, date_from=None, date_to=None):
+    # Tarihler "YYYY-MM-DD HH:MM:SS" biçiminde saklanır; metin karşılaştırması indeksi kullanır.
+    clauses = []
+    params = []
+    if conversion:
+        clauses.append("conversion = ?")
+        params.append(conversion)
+    if date_from:
+        clauses.append("date >= ?")
+        params.append(date_from)
+    if date_to:
+        clauses.append("date <= ?")
+        params.append(date_to + " 23:59:59" if len(date_to) == 10 else date_to)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+class HistoryStore:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        # Arayüz ve dönüşüm iş parçacıkları aynı bağlantıyı kilit altında paylaşır.
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def import_csv(self, csv_path):
+        # Eski history.csv bir kez aktarılır; dosyaya dokunulmaz, aktarıldığı meta tablosuna yazılır.
+        with self.lock:
+            if self.connection.execute("SELECT 1 FROM meta WHERE key = 'csv_imported'").fetchone():
+                return 0
+            rows = []
+            if os.path.exists(csv_path):
+                with open(csv_path, "r", newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    next(reader, None)
+                    for row in reader:
+                        if len(row) != 6:
+                            continue
+                        date_str, conversion_key, mode, compressed, files, output = row
+                        try:
+                            mode = int(mode)
+                        except ValueError:
+                            mode = 1
+                        try:
+                            files = int(files)
+                        except ValueError:
+                            files = 0
+                        rows.append((date_str, conversion_key, mode, 1 if compressed == "✓" else 0, files, output))
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT INTO batches (date, conversion, mode, compressed, files, output) VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self.connection.execute("INSERT INTO meta (key, value) VALUES ('csv_imported', ?)", (os.path.abspath(csv_path),))
+            return len(rows)
+
+    def add_batch(self, date_str, conversion_key, mode, compressed, files, output_location, seconds=None, results=None):
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO batches (date, conversion, mode, compressed, files, output, seconds) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (date_str, conversion_key, mode, 1 if compressed else 0, files, output_location, seconds))
+            batch_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO files (batch_id, input, output, status, error, seconds) VALUES (?, ?, ?, ?, ?, ?)",
+                [(batch_id, r["input"], r.get("output"), r["status"], r.get("error"), r.get("seconds"))
+                 for r in results or []])
+        return batch_id
+
+    def count(self, conversion=None, date_from=None, date_to=None):
+        where, params = _filters(conversion, date_from, date_to)
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM batches" + where, params).fetchone()[0]
+
+    def page(self, offset, limit, conversion=None, date_from=None, date_to=None):
+        # En yeni kayıtlar önce gelir.
+        where, params = _filters(conversion, date_from, date_to)
+        with self.lock:
+            return self.connection.execute(
+                f"SELECT {BATCH_COLUMNS} FROM batches{where} ORDER BY date DESC, id DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]).fetchall()
+
+    def file_records(self, batch_id):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT input, output, status, error, seconds FROM files WHERE batch_id = ? ORDER BY id",
+                (batch_id,)).fetchall()
+
+    def clear(self):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM files")
+            self.connection.execute("DELETE FROM batches")
@@ -0,0 +1,228 @@
+import os, re, stat, heapq, zipfile, functools
+
+# Girdi dosyalarının bulunması ve dönüşüm sırası. Klasörler os.scandir ile yığın üzerinden gezilir (yüz binlerce
+# girdide bile özyineleme derinliği ve listdir + stat maliyeti olmaz). Sembolik bağlantılar ve aynı dosyaya
+# çıkan farklı yollar (bağlantı, sabit bağlantı, iki kez verilen klasör) tek bir girdi sayılır.
+
+GLOB_CHARS = "*?["
+
+def glob_class(pattern, start, folders=True):
+    # Köşeli ayraç fnmatch.translate gibi çevrilir: "!" tümleyendir, "a-z" aralıktır, hemen baştaki "]" ve
+    # sondaki "-" karakterin kendisidir; ters aralıklar (z-a) hiçbir şeyle eşleşmez. Klasör ayracı tümleyene girmez.
+    # Dönüş: (karakter sınıfı, sonraki konum); ayraç kapanmıyorsa None ("[" karakterin kendisidir).
+    i = start + 1
+    if pattern.startswith("!", i):
+        i += 1
+    if pattern.startswith("]", i):
+        i += 1
+    end = pattern.find("]", i)
+    if end < 0:
+        return None
+    body = pattern[start + 1:end]
+    negate = body.startswith("!")
+    if negate:
+        body = body[1:]
+    items = []
+    i = 0
+    while i < len(body):
+        if i + 2 < len(body) and body[i + 1] == "-":
+            if body[i] <= body[i + 2]:
+                items.append(re.escape(body[i]) + "-" + re.escape(body[i + 2]))
+            i += 3
+        else:
+            items.append(re.escape(body[i]))
+            i += 1
+    if negate:
+        return "[^" + ("/" if folders else "") + "".join(items) + "]", end + 1
+    return ("[" + "".join(items) + "]" if items else "(?!)"), end + 1
+
+@functools.lru_cache(maxsize=256)
+def glob_regex(pattern, folders=True):
+    # glob deseninden düzenli ifade. folders: "*" ve "?" klasör ayracını geçmez, "**/" sıfır veya daha çok
+    # klasörle eşleşir; False ise fnmatch gibi yolun tamamı tek bir ad sayılır ("*" ayracı da geçer).
+    any_char = "[^/]" if folders else "."
+    out = []
+    i = 0
+    while i < len(pattern):
+        if folders and pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif folders and pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append(any_char + "*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append(any_char)
+            i += 1
+        elif pattern[i] == "[" and glob_class(pattern, i, folders):
+            char_class, i = glob_class(pattern, i, folders)
+            out.append(char_class)
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out) + r"\Z", re.IGNORECASE if os.name == "nt" else 0)
+
+def glob_match(relative, patterns):
+    # Desenler hem köke göre göreli yola (ayraç "/") hem de yalnızca dosya adına uygulanır.
+    name = relative.rsplit("/", 1)[-1]
+    return any(glob_regex(p, False).match(relative) or glob_regex(p, False).match(name) for p in patterns)
+
+class Discovery:
+    # include boşsa her dosya kabul edilir; exclude bir klasörle eşleşirse klasörün altına inilmez.
+    def __init__(self, suffixes, recursive=False, include=(), exclude=(), follow_symlinks=False):
+        self.suffixes = tuple(s.lower() for s in suffixes)
+        self.recursive = recursive
+        self.include = [p.replace(os.sep, "/") for p in include]
+        self.exclude = [p.replace(os.sep, "/").rstrip("/") for p in exclude]
+        self.follow_symlinks = follow_symlinks
+        self.files = []
+        self.seen_files = set()
+        self.counters = {"entries": 0, "directories": 0, "duplicates": 0, "excluded": 0, "errors": 0}
+
+    def add(self, path, st):
+        key = (st.st_dev, st.st_ino)
+        if key in self.seen_files and st.st_ino:
+            self.counters["duplicates"] += 1
+            return
+        self.seen_files.add(key)
+        self.files.append(path)
+
+    def add_path(self, path):
+        # Açıkça verilen dosya süzgeçlere takılmaz; bulunamazsa dönüşüm sırasında hata olarak raporlanır.
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.files.append(path)
+            return
+        if stat.S_ISDIR(st.st_mode):
+            self.walk(path)
+        else:
+            self.add(path, st)
+
+    def add_glob(self, pattern):
+        # Desenin joker içermeyen baş kısmından itibaren gezilir (glob modülü klasör bağlantısı döngülerine girer).
+        # recursive değilse "**" tek bir klasör adı gibi ("*") yorumlanır.
+        parts = pattern.replace(os.sep, "/").split("/")
+        fixed = 0
+        while fixed < len(parts) - 1 and not any(c in parts[fixed] for c in GLOB_CHARS):
+            fixed += 1
+        base = "/".join(parts[:fixed]) or ("/" if pattern.startswith(("/", os.sep)) else "")
+        rest = "/".join(parts[fixed:])
+        if not self.recursive:
+            rest = rest.replace("**", "*")
+        depth = None if "**" in rest else rest.count("/")
+        self.walk(base, glob_regex(rest).match, depth)
+
+    def walk(self, root, match=None, max_depth=None):
+        # Yığın sırası ve ad sıralaması, çıktının os.walk gibi kararlı olmasını sağlar.
+        # match verilirse (glob) yalnızca göreli yolu eşleşen dosyalar alınır ve en çok max_depth klasör inilir.
+        recursive = self.recursive if match is None else True
+        stack = [(root, "", 0)]
+        # Gezilen klasörlerin kimliği; klasör bağlantısı döngüleri burada kesilir.
+        seen_dirs = set()
+        while stack:
+            folder, relative, depth = stack.pop()
+            try:
+                st = os.stat(folder or ".")
+                if (st.st_dev, st.st_ino) in seen_dirs and st.st_ino:
+                    continue
+                seen_dirs.add((st.st_dev, st.st_ino))
+                with os.scandir(folder or ".") as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                self.counters["errors"] += 1
+                continue
+            self.counters["directories"] += 1
+            subfolders = []
+            for entry in entries:
+                self.counters["entries"] += 1
+                entry_relative = relative + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False) or (entry.is_symlink() and entry.is_dir()):
+                        # Klasöre bağlanan sembolik bağlantı yalnızca istenirse izlenir.
+                        if recursive and (max_depth is None or depth < max_depth) \
+                                and (self.follow_symlinks or not entry.is_symlink()):
+                            if glob_match(entry_relative, self.exclude):
+                                self.counters["excluded"] += 1
+                            else:
+                                subfolders.append((os.path.join(folder, entry.name), entry_relative + "/", depth + 1))
+                        continue
+                    if not entry.name.lower().endswith(self.suffixes):
+                        continue
+                    if match is not None and not match(entry_relative):
+                        continue
+                    if entry.name.startswith("~$") or glob_match(entry_relative, self.exclude) \
+                            or (self.include and not glob_match(entry_relative, self.include)):
+                        self.counters["excluded"] += 1
+                        continue
+                    # Dosyaya bağlanan bağlantılar hedefin kimliğiyle (aygıt, inode) tekilleştirilir.
+                    st = entry.stat()
+                    if stat.S_ISREG(st.st_mode):
+                        self.add(os.path.join(folder, entry.name), st)
+                except OSError:
+                    self.counters["errors"] += 1
+            stack.extend(reversed(subfolders))
+
+def discover_files(paths, suffixes, recursive=False, include=(), exclude=(), follow_symlinks=False):
+    # Dönüş: (yollar, sayaçlar). Yollar verilen sırayla, klasör içleri ada göre sıralıdır.
+    discovery = Discovery(suffixes, recursive, include, exclude, follow_symlinks)
+    for path in paths:
+        if any(c in path for c in GLOB_CHARS) and not os.path.lexists(path):
+            discovery.add_glob(path)
+        else:
+            discovery.add_path(path)
+    return discovery.files, discovery.counters
+
+def page_count(path):
+    # Sıralama için sayfa/slayt sayısı; okunamazsa None. PPTX'te yalnızca ZIP dizini, PDF'te kök sayfa
+    # düğümünün /Count'u okunur (dosya bir kez taranır). Sayfa ağacı nesne akışına sıkıştırılmışsa PDF
+    # tamamen ayrıştırılır; bu, dosya başına bir parmak izi çıkarmak kadar sürer.
+    try:
+        if path.lower().endswith(".pptx"):
+            with zipfile.ZipFile(path) as package:
+                return sum(1 for name in package.namelist()
+                           if name.startswith("ppt/slides/slide") and name.endswith(".xml"))
+        import pdf_fingerprint
+        return pdf_fingerprint.page_count(path)
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
+
+def work_costs(paths, schedule):
+    # schedule: "size" (bayt), "pages" (sayfa sayısı, okunamazsa bayt/100 KB) ya da "input" (verilen sıra).
+    costs = []
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        if schedule == "pages":
+            pages = page_count(path)
+            costs.append(pages if pages is not None else max(1, size // (100 * 1024)))
+        else:
+            costs.append(size)
+    return costs
+
+def largest_first(items, costs):
+    # Büyük işler önce başlatılır; paralel çalışmada en büyük dosya sona kalıp süreyi uzatmaz.
+    # Eşit maliyette verilen sıra korunur.
+    return [item for _, _, item in sorted(((-costs[n], n, item) for n, item in enumerate(items)))]
+
+def balanced_groups(items, costs, count, capacity):
+    # Öğeler, büyükten küçüğe en az yüklü gruba verilir (LPT); gruplar toplam maliyete göre büyükten küçüğe döner.
+    groups = [[] for _ in range(count)]
+    heap = [(0, n) for n in range(count)]
+    for n in sorted(range(len(items)), key=lambda n: (-costs[n], n)):
+        full = []
+        while True:
+            load, g = heapq.heappop(heap)
+            if len(groups[g]) < capacity:
+                break
+            full.append((load, g))
+        groups[g].append(items[n])
+        heapq.heappush(heap, (load + costs[n], g))
+        for entry in full:
+            heapq.heappush(heap, entry)
+    loads = {g: load for load, g in heap}
+    return [groups[g] for g in sorted(range(count), key=lambda g: -loads[g]) if groups[g]]
@@ -0,0 +1,141 @@
+import os, json, datetime, hashlib, threading, tempfile
+
+# Toplu işin durum kaydı. Dosya JSON satırlarından oluşur: ilk satır işin kendisini, ardından her
+# girdi için bir "file" satırı, her tamamlanan dosya için de bir "result" satırı eklenir.
+# Yalnızca ekleme yapıldığı için süreç yarıda ölse bile kayıt tutarlı kalır; yarım kalan son satır yok sayılır.
+
+MANIFEST_NAME = ".converty-job.jsonl"
+# Yalnızca çalışan sürece ait seçenekler (iptal işareti, ölçüm, ilerleme kanalı, havuzlar, geçici sayfa önbelleği).
+# Kayda yazılmaz; sürdürmede çağıranın verdikleriyle ya da convert_files tarafından yeniden kurulur.
+RUNTIME_OPTIONS = ("cancel", "metrics", "progress", "pools", "pool", "page_cache_dir")
+
+def default_manifest_path(output_folder):
+    return os.path.join(output_folder, MANIFEST_NAME)
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _now():
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _serializable(options):
+    return {k: v for k, v in options.items()
+            if k not in RUNTIME_OPTIONS and (isinstance(v, (str, int, float, bool)) or v is None)}
+
+class JobManifest:
+    def __init__(self, path, batch, files):
+        self.path = path
+        self.batch = batch
+        self.files = files
+        self.lock = threading.Lock()
+
+    @classmethod
+    def create(cls, path, conversion_key, input_files, output_paths, output_folder, options, zip_option):
+        batch = {"type": "batch", "conversion": conversion_key, "output_folder": output_folder,
+                 "zip": bool(zip_option), "options": _serializable(options), "created": _now()}
+        files = [{"input": i, "output": o, "state": "pending", "checksum": None, "error": None}
+                 for i, o in zip(input_files, output_paths)]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(batch, ensure_ascii=False) + "\n")
+            for index, entry in enumerate(files):
+                f.write(json.dumps({"type": "file", "index": index, "input": entry["input"], "output": entry["output"]},
+                                   ensure_ascii=False) + "\n")
+        return cls(path, batch, files)
+
+    @classmethod
+    def load(cls, path):
+        batch = None
+        files = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") == "batch":
+                    batch = record
+                elif record.get("type") == "file":
+                    files.append({"input": record["input"], "output": record["output"], "state": "pending",
+                                  "checksum": None, "error": None})
+                elif record.get("type") == "result" and record["index"] < len(files):
+                    files[record["index"]].update({k: record.get(k) for k in ("state", "checksum", "error")})
+        if batch is None:
+            raise ValueError(f"Not a Converty job manifest: {path}")
+        return cls(path, batch, files)
+
+    def record(self, index, result):
+        entry = self.files[index]
+        entry["state"] = result["status"]
+        entry["error"] = result.get("error")
+        entry["checksum"] = None
+        if result["status"] == "done" and os.path.exists(entry["output"]):
+            entry["checksum"] = file_checksum(entry["output"])
+        line = json.dumps({"type": "result", "index": index, "state": entry["state"], "checksum": entry["checksum"],
+                           "error": entry["error"], "at": _now()}, ensure_ascii=False)
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def options(self):
+        # Eski sürümlerin yazdığı kayıtlarda çalışma anı seçenekleri de bulunabilir; bunlar yok sayılır.
+        return _serializable(self.batch["options"])
+
+    def remaining(self, archived=()):
+        # Bitmemiş dosyalar ve "done" olduğu halde çıktısı artık bulunmayan (ve arşivde de olmayan)
+        # ya da sağlama toplamı tutmayan dosyalar yeniden işlenir.
+        left = []
+        for index, entry in enumerate(self.files):
+            if entry["state"] != "done":
+                left.append(index)
+            elif os.path.exists(entry["output"]):
+                if entry["checksum"] and file_checksum(entry["output"]) != entry["checksum"]:
+                    left.append(index)
+            elif os.path.basename(entry["output"]) not in archived:
+                left.append(index)
+        return left
+
+    def counts(self):
+        counts = {}
+        for entry in self.files:
+            counts[entry["state"]] = counts.get(entry["state"], 0) + 1
+        return counts
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class CancelToken:
+    # İş parçacıkları ve işçi süreçler arasında paylaşılan iptal işareti. Süreçlere yalnızca bir
+    # bayrak dosyasının yolu taşınır; iptal edildiğinde dosya oluşturulur.
+    def __init__(self):
+        self.flag_path = os.path.join(tempfile.gettempdir(), f"converty-cancel-{os.getpid()}-{id(self)}")
+        self.event = threading.Event()
+
+    def __getstate__(self):
+        return {"flag_path": self.flag_path}
+
+    def __setstate__(self, state):
+        self.flag_path = state["flag_path"]
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+        open(self.flag_path, "w").close()
+
+    def cancelled(self):
+        if self.event.is_set():
+            return True
+        if os.path.exists(self.flag_path):
+            self.event.set()
+            return True
+        return False
+
+    def close(self):
+        if os.path.exists(self.flag_path):
+            os.remove(self.flag_path)
@@ -0,0 +1,132 @@
+import os, json, time, threading, contextlib
+
+# Dönüşüm aşamalarının (render, encode, assemble, save, export, zip ...) ölçümü. Ölçüm varsayılan olarak
+# kapalıdır; açıkken işçiler (süreç veya iş parçacığı) aralıkları sonuç sözlüğüne ekler, ana süreç
+# bunları Metrics üzerinden kayıt yerlerine (JSON satırları, Prometheus metin dosyası, arayüz paneli) iletir.
+
+def current_rss():
+    # Anlık yerleşik bellek (bayt). Linux'ta /proc, diğer sistemlerde psutil varsa kullanılır.
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+class Metrics:
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+        self.lock = threading.Lock()
+
+    def emit(self, record):
+        record.setdefault("ts", round(time.time(), 3))
+        with self.lock:
+            for sink in self.sinks:
+                sink.write(record)
+
+    @contextlib.contextmanager
+    def span(self, name, **fields):
+        # Ana süreçte ölçülen aralıklar için; blok içinde fields sözlüğüne alan eklenebilir.
+        started = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            fields.update(span=name, seconds=round(time.perf_counter() - started, 6))
+            self.emit(fields)
+
+    def flush(self):
+        with self.lock:
+            for sink in self.sinks:
+                sink.flush()
+
+    def close(self):
+        with self.lock:
+            for sink in self.sinks:
+                sink.close()
+
+class JsonLinesSink:
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class StatsSink:
+    # Aşama başına sayı, toplam süre ve bayt; dosya sonuçları ve son bellek örneği bellekte toplanır.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.stages = {}
+            self.files = {}
+            self.rss_bytes = None
+
+    def write(self, record):
+        with self.lock:
+            stage = self.stages.setdefault(record["span"], {"count": 0, "seconds": 0.0, "bytes": 0})
+            stage["count"] += 1
+            stage["seconds"] += record.get("seconds", 0.0)
+            stage["bytes"] += record.get("bytes") or 0
+            if record["span"] == "file":
+                key = (record.get("conversion", ""), record.get("status", ""))
+                self.files[key] = self.files.get(key, 0) + 1
+            if record.get("rss_bytes"):
+                self.rss_bytes = record["rss_bytes"]
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "stages": {name: dict(stage) for name, stage in self.stages.items()},
+                "files": dict(self.files),
+                "rss_bytes": self.rss_bytes
+            }
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+class PrometheusSink(StatsSink):
+    # node_exporter "textfile" toplayıcısının okuyabileceği metin biçimi; dosya atomik olarak değiştirilir.
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def flush(self):
+        snapshot = self.snapshot()
+        lines = []
+        for metric, key, help_text in (("converty_stage_seconds_total", "seconds", "Seconds spent per stage"),
+                                       ("converty_stage_spans_total", "count", "Spans recorded per stage"),
+                                       ("converty_stage_bytes_total", "bytes", "Bytes produced per stage")):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, stage in sorted(snapshot["stages"].items()):
+                lines.append(f'{metric}{{stage="{name}"}} {round(stage[key], 6)}')
+        lines.append("# HELP converty_files_total Converted files by result")
+        lines.append("# TYPE converty_files_total counter")
+        for (conversion, status), count in sorted(snapshot["files"].items()):
+            lines.append(f'converty_files_total{{conversion="{conversion}",status="{status}"}} {count}')
+        if snapshot["rss_bytes"] is not None:
+            lines.append("# HELP converty_resident_bytes Last sampled resident memory of a converter process")
+            lines.append("# TYPE converty_resident_bytes gauge")
+            lines.append(f"converty_resident_bytes {snapshot['rss_bytes']}")
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.path)
+
+    def close(self):
+        self.flush()
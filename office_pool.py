@@ -0,0 +1,192 @@
+import os, shutil, subprocess, tempfile, threading, time, uuid, queue, pathlib, importlib.util
+
+# Uzun ömürlü, arayüzsüz LibreOffice örneklerinden oluşan havuz. Her örnek kendi
+# -env:UserInstallation profilini kullanır ve UNO üzerinden adlandırılmış bir boru ile sürülür;
+# böylece her dosya için soffice açılış maliyeti ödenmez ve örnekler birbirini kilitlemez.
+# UNO modülü yalnızca havuz başlatılırken yüklenir (bkz. OfficePool.start).
+uno = None
+
+SOFFICE = os.environ.get("CONVERTY_SOFFICE", "soffice")
+STARTUP_TIMEOUT = 60
+
+def uno_available():
+    return uno is not None or importlib.util.find_spec("uno") is not None
+
+def load_uno():
+    global uno
+    if uno is None:
+        import uno as module
+        uno = module
+    return uno
+
+def _property(name, value):
+    from com.sun.star.beans import PropertyValue
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+class OfficeInstance:
+    def __init__(self, base_dir):
+        self.pipe_name = f"converty_{uuid.uuid4().hex}"
+        self.profile_dir = os.path.join(base_dir, self.pipe_name)
+        self.process = None
+        self.desktop = None
+        self.restarts = 0
+
+    def start(self):
+        profile_url = pathlib.Path(self.profile_dir).as_uri()
+        self.process = subprocess.Popen(
+            [SOFFICE, f"-env:UserInstallation={profile_url}", "--headless", "--invisible", "--nologo",
+             "--norestore", "--nodefault", "--nolockcheck",
+             f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("LibreOffice instance did not start")
+                time.sleep(0.25)
+        self.desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+    def restart(self):
+        self.restarts += 1
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+        self.desktop = None
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+        self.start()
+
+    def convert(self, input_path, output_path, timeout=None):
+        outcome = {}
+        def run():
+            try:
+                document = self.desktop.loadComponentFromURL(
+                    uno.systemPathToFileUrl(os.path.abspath(input_path)), "_blank", 0, (_property("Hidden", True),))
+                if document is None:
+                    raise RuntimeError(f"LibreOffice could not open {input_path}")
+                try:
+                    document.storeToURL(uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                                        (_property("FilterName", "impress_pdf_Export"),))
+                finally:
+                    document.close(True)
+            except Exception as e:
+                outcome["error"] = e
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            # Askıda kalan örnek öldürülür; UNO çağrısı bağlantı kopunca kendiliğinden sonlanır.
+            self.restart()
+            raise TimeoutError(f"LibreOffice timed out after {timeout}s on {input_path}")
+        if "error" in outcome:
+            if not self.alive():
+                self.restart()
+                raise RuntimeError(f"LibreOffice crashed while converting {input_path}") from outcome["error"]
+            raise outcome["error"]
+
+class OfficePool:
+    def __init__(self, size, timeout=None):
+        self.timeout = timeout
+        self.base_dir = tempfile.mkdtemp(prefix="converty-office-")
+        self.instances = []
+        self.idle = queue.Queue()
+        self.start(size)
+
+    def start(self, size):
+        try:
+            load_uno()
+            for _ in range(max(1, size)):
+                instance = OfficeInstance(self.base_dir)
+                instance.start()
+                self.instances.append(instance)
+                self.idle.put(instance)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def convert(self, input_path, output_path):
+        instance = self.idle.get()
+        try:
+            if not instance.alive():
+                instance.restart()
+            instance.convert(input_path, output_path, self.timeout)
+        finally:
+            self.idle.put(instance)
+
+    def stats(self):
+        return {"instances": len(self.instances), "restarts": sum(i.restarts for i in self.instances)}
+
+    def close(self):
+        for instance in self.instances:
+            instance.stop()
+        self.instances = []
+        shutil.rmtree(self.base_dir, ignore_errors=True)
+
+def convert_many(input_paths, output_paths, timeout=None):
+    # UNO yoksa: birden fazla dosya tek bir soffice çağrısıyla, kendine ait bir profille dönüştürülür.
+    # Dönüş, her girdi için None (başarılı) veya hata mesajı içeren bir listedir.
+    work_dir = tempfile.mkdtemp(prefix=".converty-", dir=os.path.dirname(os.path.abspath(output_paths[0])))
+    errors = [None] * len(input_paths)
+    try:
+        profile_url = pathlib.Path(work_dir, "profile").as_uri()
+        # Aynı ada sahip girdiler birbirinin çıktısını ezmesin diye her biri ayrı bir alt klasöre yazılır.
+        groups = {}
+        for i, input_path in enumerate(input_paths):
+            stem = os.path.splitext(os.path.basename(input_path))[0]
+            groups.setdefault(stem.lower(), []).append(i)
+        rounds = max(len(v) for v in groups.values())
+        for r in range(rounds):
+            batch = [v[r] for v in groups.values() if len(v) > r]
+            out_dir = os.path.join(work_dir, f"out{r}")
+            try:
+                subprocess.run([SOFFICE, f"-env:UserInstallation={profile_url}", "--headless", "--convert-to", "pdf",
+                                *[input_paths[i] for i in batch], "--outdir", out_dir],
+                               check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               timeout=timeout * len(batch) if timeout else None)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                for i in batch:
+                    errors[i] = f"{type(e).__name__}: {e}"
+            for i in batch:
+                produced = os.path.join(out_dir, os.path.splitext(os.path.basename(input_paths[i]))[0] + ".pdf")
+                if os.path.exists(produced):
+                    os.replace(produced, output_paths[i])
+                    errors[i] = None
+                elif errors[i] is None:
+                    errors[i] = f"LibreOffice did not produce a PDF for {input_paths[i]}"
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return errors
@@ -0,0 +1,382 @@
+import re, mmap, zlib, hashlib, collections
+
+# PDF sayfalarının parmak izi. Her sayfanın sözlüğü (üst düğümlerden devralınan Resources, MediaBox,
+# CropBox ve Rotate dahil), içerik akışları ve kaynakları (yazı tipleri, görüntüler, form nesneleri)
+# dolaylı başvurular izlenerek tek bir özete katılır. Nesne numaraları özete girmez; gece yeniden üretilen
+# ve nesneleri farklı numaralanan bir PDF'te değişmeyen sayfaların özeti aynı kalır. Sayfa dışında tanımlanıp
+# çizimi etkileyen katalog girdileri (DOCUMENT_KEYS) her sayfanın özetine katılır.
+#
+# Yalnızca sayfa ağacını okumaya yetecek kadar ayrıştırılır: dosya "N G obj" başlıkları için baştan sona
+# taranır (xref tablosuna güvenilmez; artımlı güncellemelerde sonraki tanım geçerlidir), akış verileri
+# çözülmeden özetlenir. Nesne akışları (ObjStm) yalnızca FlateDecode ile açılır.
+
+FINGERPRINT_VERSION = 1
+WHITESPACE = b"\x00\t\n\x0c\r "
+DELIMITERS = b"()<>[]{}/%"
+OBJ_HEADER = re.compile(rb"(\d+)\s+(\d+)\s+obj\b")
+TRAILER = re.compile(rb"trailer\s*<<")
+PAGES_NODE = re.compile(rb"/Type\s*/Pages(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])")
+INHERITED = ("Resources", "MediaBox", "CropBox", "Rotate")
+# Sayfadan yukarı ya da başka sayfalara giden başvurular izlenmez; aksi halde bir bağlantı sayfası
+# bağlandığı her sayfa değiştiğinde değişmiş sayılırdı.
+SKIPPED_KEYS = {"Parent", "P", "Length"}
+# Katman görünürlüğü (isteğe bağlı içerik) ve form alanlarının ortak kaynakları/görünüm ayarı; biri değişince
+# bütün sayfalar değişmiş sayılır.
+DOCUMENT_KEYS = ("OCProperties", "AcroForm")
+MAX_DEPTH = 64
+
+Ref = collections.namedtuple("Ref", "num gen")
+
+class Name(str):
+    pass
+
+class Stream:
+    # Akışın verisi kopyalanmaz; yalnızca dosyadaki konumu tutulur.
+    def __init__(self, info, start, end):
+        self.info = info
+        self.start = start
+        self.end = end
+
+class Lexer:
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+    def skip_space(self):
+        data = self.data
+        while self.pos < len(data):
+            c = data[self.pos]
+            if c in WHITESPACE:
+                self.pos += 1
+            elif c == 0x25:
+                end = self.pos
+                while end < len(data) and data[end] not in b"\r\n":
+                    end += 1
+                self.pos = end
+            else:
+                break
+
+    def token(self):
+        start = self.pos
+        data = self.data
+        while self.pos < len(data) and data[self.pos] not in WHITESPACE and data[self.pos] not in DELIMITERS:
+            self.pos += 1
+        return bytes(data[start:self.pos])
+
+    def parse(self, depth=0):
+        if depth > MAX_DEPTH:
+            raise ValueError("PDF object nesting too deep")
+        self.skip_space()
+        data = self.data
+        if self.pos >= len(data):
+            raise ValueError("Unexpected end of PDF data")
+        c = data[self.pos]
+        if c == 0x2F:
+            self.pos += 1
+            raw = self.token()
+            return Name(re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes([int(m.group(1), 16)]), raw).decode("latin-1"))
+        if data[self.pos:self.pos + 2] == b"<<":
+            self.pos += 2
+            result = {}
+            while True:
+                self.skip_space()
+                if data[self.pos:self.pos + 2] == b">>":
+                    self.pos += 2
+                    return result
+                key = self.parse(depth + 1)
+                if not isinstance(key, Name):
+                    raise ValueError("PDF dictionary key is not a name")
+                result[key] = self.parse(depth + 1)
+        if c == 0x3C:
+            end = data.find(b">", self.pos)
+            if end < 0:
+                raise ValueError("Unterminated PDF hex string")
+            value = bytes(data[self.pos + 1:end])
+            self.pos = end + 1
+            return b"<" + bytes(b for b in value if b not in WHITESPACE)
+        if c == 0x28:
+            return self.literal()
+        if c == 0x5B:
+            self.pos += 1
+            result = []
+            while True:
+                self.skip_space()
+                if data[self.pos:self.pos + 1] == b"]":
+                    self.pos += 1
+                    return result
+                result.append(self.parse(depth + 1))
+        if c in b"+-.0123456789":
+            return self.number()
+        word = self.token()
+        if not word:
+            raise ValueError(f"Unexpected PDF character at offset {self.pos}")
+        return {b"true": True, b"false": False, b"null": None}.get(word, word)
+
+    def literal(self):
+        data = self.data
+        depth = 0
+        pos = self.pos
+        while pos < len(data):
+            c = data[pos]
+            if c == 0x5C:
+                pos += 2
+                continue
+            if c == 0x28:
+                depth += 1
+            elif c == 0x29:
+                depth -= 1
+                if depth == 0:
+                    value = bytes(data[self.pos:pos + 1])
+                    self.pos = pos + 1
+                    return value
+            pos += 1
+        raise ValueError("Unterminated PDF string")
+
+    def number(self):
+        word = self.token()
+        try:
+            value = float(word) if b"." in word else int(word)
+        except ValueError:
+            raise ValueError(f"Invalid PDF number: {word!r}")
+        if isinstance(value, int) and value >= 0:
+            # "12 0 R" dolaylı başvurusu
+            saved = self.pos
+            self.skip_space()
+            generation = self.token()
+            self.skip_space()
+            if generation.isdigit() and self.data[self.pos:self.pos + 1] == b"R" and (
+                    self.pos + 1 >= len(self.data) or self.data[self.pos + 1] in WHITESPACE + DELIMITERS):
+                self.pos += 1
+                return Ref(value, int(generation))
+            self.pos = saved
+        return value
+
+class PdfDocument:
+    def __init__(self, data):
+        self.data = data
+        # nesne numarası -> (tanımın dosyadaki konumu, değer)
+        self.objects = {}
+        self.trailers = []
+        self.scan()
+        self.expand_object_streams()
+
+    def scan(self):
+        data = self.data
+        pos = 0
+        while True:
+            match = OBJ_HEADER.search(data, pos)
+            if match is None:
+                break
+            start = match.start()
+            if start and data[start - 1] not in WHITESPACE + DELIMITERS:
+                pos = match.end()
+                continue
+            lexer = Lexer(data, match.end())
+            try:
+                value = lexer.parse()
+            except (ValueError, IndexError):
+                pos = match.end()
+                continue
+            lexer.skip_space()
+            pos = lexer.pos
+            if isinstance(value, dict) and data[pos:pos + 6] == b"stream":
+                begin = pos + 6
+                if data[begin:begin + 2] == b"\r\n":
+                    begin += 2
+                elif data[begin:begin + 1] in (b"\n", b"\r"):
+                    begin += 1
+                length = value.get("Length")
+                end = begin + length if isinstance(length, int) else -1
+                if end < 0 or data.find(b"endstream", end, end + 32) < 0:
+                    # Uzunluk dolaylı ya da hatalıysa akış sonu aranır.
+                    end = data.find(b"endstream", begin)
+                    if end < 0:
+                        break
+                    while end > begin and data[end - 1] in b"\r\n":
+                        end -= 1
+                value = Stream(value, begin, end)
+                pos = data.find(b"endstream", end) + 9
+            self.objects[int(match.group(1))] = (start, value)
+        for match in TRAILER.finditer(data):
+            try:
+                self.trailers.append((match.start(), Lexer(data, match.end() - 2).parse()))
+            except (ValueError, IndexError):
+                continue
+
+    def expand_object_streams(self):
+        for position, value in list(self.objects.values()):
+            if not isinstance(value, Stream) or value.info.get("Type") != "ObjStm":
+                continue
+            try:
+                data = self.stream_data(value)
+                lexer = Lexer(data)
+                header = [lexer.parse() for _ in range(2 * int(value.info["N"]))]
+                first = int(value.info["First"])
+                for num, offset in zip(header[::2], header[1::2]):
+                    # Nesne akışındaki tanım akışın kendi konumunda yapılmış sayılır.
+                    if self.objects.get(num, (-1,))[0] < position:
+                        self.objects[num] = (position, Lexer(data, first + offset).parse())
+            except (ValueError, IndexError, KeyError, TypeError, zlib.error):
+                continue
+
+    def stream_data(self, stream):
+        raw = self.data[stream.start:stream.end]
+        filters = stream.info.get("Filter")
+        filters = filters if isinstance(filters, list) else [filters] if filters else []
+        if filters == ["FlateDecode"] and not stream.info.get("DecodeParms"):
+            return zlib.decompress(raw)
+        if not filters:
+            return bytes(raw)
+        raise ValueError(f"Unsupported object stream filter: {filters}")
+
+    def resolve(self, value):
+        seen = set()
+        while isinstance(value, Ref):
+            if value.num in seen:
+                return None
+            seen.add(value.num)
+            value = self.objects.get(value.num, (None, None))[1]
+        return value
+
+    def root(self):
+        # Son trailer ya da çapraz başvuru akışındaki /Root; bulunamazsa son /Catalog nesnesi.
+        candidates = list(self.trailers)
+        candidates.extend((position, value.info) for position, value in self.objects.values()
+                          if isinstance(value, Stream) and value.info.get("Type") == "XRef")
+        for _, trailer in sorted(candidates, key=lambda item: item[0], reverse=True):
+            root = self.resolve(trailer.get("Root"))
+            if isinstance(root, dict) and "Pages" in root:
+                return root
+        catalogs = [(position, value) for position, value in self.objects.values()
+                    if isinstance(value, dict) and value.get("Type") == "Catalog" and "Pages" in value]
+        if not catalogs:
+            raise ValueError("PDF catalog not found")
+        return max(catalogs, key=lambda item: item[0])[1]
+
+    def pages(self):
+        # Sayfa ağacı sırayla gezilir; dönüş: (sayfa nesnesinin numarası, devralınan alanlarla birleşmiş sözlük).
+        pages = []
+        visited = set()
+        stack = [(self.root()["Pages"], {})]
+        while stack:
+            ref, inherited = stack.pop()
+            key = ref.num if isinstance(ref, Ref) else id(ref)
+            node = self.resolve(ref)
+            if key in visited or not isinstance(node, dict):
+                continue
+            visited.add(key)
+            attributes = dict(inherited, **{k: node[k] for k in INHERITED if k in node})
+            kids = self.resolve(node.get("Kids"))
+            if node.get("Type") == "Pages" or (node.get("Type") != "Page" and isinstance(kids, list)):
+                stack.extend((kid, attributes) for kid in reversed(kids or []))
+            else:
+                pages.append((ref.num if isinstance(ref, Ref) else None, dict(attributes, **node)))
+        return pages
+
+class Fingerprinter:
+    def __init__(self, document):
+        self.document = document
+        self.stream_digests = {}
+        catalog = document.root()
+        digest = hashlib.sha256(b"converty-document")
+        self.feed(digest, {k: catalog[k] for k in DOCUMENT_KEYS if k in catalog}, set(), 0)
+        self.document_key = digest.digest()
+
+    def page(self, page_num, page):
+        digest = hashlib.sha256(f"converty-page-v{FINGERPRINT_VERSION}".encode())
+        digest.update(self.document_key)
+        self.feed(digest, page, {page_num}, 0)
+        return digest.hexdigest()
+
+    def feed(self, digest, value, path, depth):
+        if depth > MAX_DEPTH:
+            digest.update(b"deep")
+            return
+        if isinstance(value, Ref):
+            target = self.document.objects.get(value.num, (None, None))[1]
+            info = target.info if isinstance(target, Stream) else target
+            if value.num in path:
+                digest.update(b"cycle")
+            elif isinstance(info, dict) and info.get("Type") in ("Page", "Pages"):
+                digest.update(b"page-ref")
+            else:
+                path.add(value.num)
+                self.feed(digest, target, path, depth + 1)
+                path.discard(value.num)
+        elif isinstance(value, Stream):
+            # Paylaşılan akışlar (yazı tipleri, görüntüler) her sayfada yeniden okunmaz.
+            self.feed(digest, value.info, path, depth + 1)
+            digest.update(b"stream")
+            if value.start not in self.stream_digests:
+                self.stream_digests[value.start] = hashlib.sha256(self.document.data[value.start:value.end]).digest()
+            digest.update(self.stream_digests[value.start])
+        elif isinstance(value, dict):
+            digest.update(b"<<")
+            for name in sorted(value):
+                if name in SKIPPED_KEYS:
+                    continue
+                digest.update(b"/" + name.encode("utf-8", "surrogateescape") + b" ")
+                self.feed(digest, value[name], path, depth + 1)
+            digest.update(b">>")
+        elif isinstance(value, list):
+            digest.update(b"[")
+            for item in value:
+                self.feed(digest, item, path, depth + 1)
+            digest.update(b"]")
+        elif isinstance(value, Name):
+            digest.update(b"/" + value.encode("utf-8", "surrogateescape") + b" ")
+        elif isinstance(value, bytes):
+            digest.update(b"%d:" % len(value) + value)
+        else:
+            digest.update(repr(value).encode() + b" ")
+
+def page_fingerprints(pdf_path):
+    # Sayfa sırasıyla onaltılık özet listesi döner. Ayrıştırılamayan dosyada ValueError yükseltilir.
+    with open(pdf_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Empty PDF file: {pdf_path}")
+    try:
+        document = PdfDocument(data)
+        pages = document.pages()
+        if not pages:
+            raise ValueError(f"No pages found in {pdf_path}")
+        fingerprinter = Fingerprinter(document)
+        return [fingerprinter.page(num, page) for num, page in pages]
+    finally:
+        data.close()
+
+def page_tree_count(data):
+    # Kök sayfa düğümünün (/Parent'ı olmayan /Type /Pages) /Count'u; yalnızca bu düğüm ayrıştırılır.
+    # Artımlı güncellemelerde dosyada sonra gelen tanım geçerlidir. Düğüm nesne akışındaysa None.
+    count = None
+    for match in PAGES_NODE.finditer(data):
+        start = data.rfind(b"obj", 0, match.start())
+        if start < 0:
+            continue
+        try:
+            value = Lexer(data, start + 3).parse()
+        except (ValueError, IndexError):
+            continue
+        if isinstance(value, dict) and value.get("Type") == "Pages" and "Parent" not in value \
+                and isinstance(value.get("Count"), int) and value["Count"] > 0:
+            count = value["Count"]
+    return count
+
+def page_count(pdf_path):
+    # Sayfa ağacının kökündeki /Count; düz metinde bulunamazsa dosya ayrıştırılıp ağaç gezilerek sayılır.
+    with open(pdf_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Empty PDF file: {pdf_path}")
+    try:
+        count = page_tree_count(data)
+        if count is not None:
+            return count
+        document = PdfDocument(data)
+        count = document.resolve(document.resolve(document.root()["Pages"]).get("Count"))
+        return count if isinstance(count, int) and count > 0 else len(document.pages())
+    finally:
+        data.close()
@@ -1,32 +1,35 @@
-import os, sys, zipfile, json, subprocess, threading, csv, datetime
-try:
-    import pdf2image
-    import pptx
-    import tqdm
-    import colorama
-    import tkinter as tk
-except ImportError as e:
+import os, sys, zipfile, json, threading, datetime, time, shutil, tempfile, argparse, io, queue, hashlib, re, math
+import collections, multiprocessing, signal, contextlib, importlib, importlib.util, posixpath
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+# Dönüşüm kütüphaneleri (pdf2image, python-pptx, Pillow, comtypes) açılışta yüklenmez; ilk kullanıldıkları
+# yerde ya da pencere açıldıktan sonra arka planda (prewarm) yüklenir. Burada yalnızca kurulu oldukları denetlenir.
+REQUIRED_LIBRARIES = {"pdf2image": "pdf2image", "pptx": "python-pptx", "PIL": "pillow", "colorama": "colorama"}
+PREWARM_MODULES = ("PIL.Image", "pdf2image", "pptx", "pptx.parts.image")
+
+_missing = [package for module, package in REQUIRED_LIBRARIES.items() if importlib.util.find_spec(module) is None]
+if _missing:
     from tkinter import messagebox
     root = tk.Tk()
     root.withdraw()
-    messagebox.showerror("Missing Library", f"Required library missing: {str(e)}\nPlease use full EXE version or pip install {str(e).split()[-1]}")
+    messagebox.showerror("Missing Library", f"Required library missing: {', '.join(_missing)}\nPlease use full EXE version or pip install {' '.join(_missing)}")
     sys.exit(1)
 
-from tkinter import filedialog, ttk
-from pdf2image import convert_from_path
-from pptx import Presentation
-from tqdm import tqdm
+from pptx_writer import PptxWriter, fit_box, shapes_xml, NSDECLS
+from job_manifest import JobManifest, CancelToken, default_manifest_path
+from input_discovery import discover_files, work_costs, largest_first, balanced_groups, page_count
 from colorama import Fore, init
-from tempfile import NamedTemporaryFile
+# Yalnızca belirli yollarda gereken modüller (izleme, LibreOffice havuzu, önbellek, geçmiş, ölçüm gibi)
+# kullanıldıkları fonksiyonun içinde yüklenir.
 
 init(autoreset=True)
-try:
-    import comtypes.client
-except ImportError:
-    pass
 
 PREFERENCES_FILE = "preferences.json"
 HISTORY_FILE = "history.csv"
+HISTORY_DB = "history.db"
 
 COLORS = {
     "background": "#DAD7CD",
@@ -56,6 +59,9 @@ FONTS = {
     "button": ("Open Sans", 11, "bold")
 }
 
+# Arayüz ilerleme kanalını saniyede kaç kez boşaltır; aradaki olaylar tek bir güncellemede birleşir.
+PROGRESS_FPS = 15
+
 LANGUAGES = {
     "en": {
         "select_theme": "Select Theme:",
@@ -96,7 +102,39 @@ LANGUAGES = {
         "compressed": "Compressed",
         "mode": "Mode",
         "files_processed": "Files Processed",
-        "settings": "Settings"
+        "settings": "Settings",
+        "parallel_jobs": "Parallel jobs:",
+        "render_profile": "Image profile (PDF to PPTX):",
+        "profile_default": "Default (PNG, 200 DPI)",
+        "profile_print": "Print (PNG, 300 DPI)",
+        "profile_small": "Small (JPEG, 120 DPI)",
+        "profile_scan": "Scanned text (grayscale)",
+        "profile_auto": "Automatic (per page)",
+        "cancel": "Cancel",
+        "resume": "Resume",
+        "cancelling": "Cancelling...",
+        "cancelled": "Process cancelled. Use Resume to finish the remaining files.",
+        "no_job_found": "No unfinished job found in this folder.",
+        "duration": "Duration (s)",
+        "filter_type": "Type:",
+        "filter_all": "All",
+        "date_from": "From (YYYY-MM-DD):",
+        "date_to": "To:",
+        "apply_filter": "Filter",
+        "file": "File",
+        "status": "Status",
+        "error": "Error",
+        "show_stats": "Show stage statistics",
+        "incremental": "Only re-convert changed pages (PDF to PPTX)",
+        "vector_engine": "Keep text editable (PDF to PPTX, requires PyMuPDF)",
+        "stats_title": "Statistics",
+        "stage": "Stage",
+        "count": "Count",
+        "total_seconds": "Total (s)",
+        "average_ms": "Average (ms)",
+        "megabytes": "MB",
+        "memory": "Memory: {} MB",
+        "page_progress": "{0}/{1} pages · {2:.1f} pages/s · {3} left"
     },
     "tr": {
         "select_theme": "Tema Seçimi:",
@@ -137,7 +175,39 @@ LANGUAGES = {
         "compressed": "Sıkıştırıldı",
         "mode": "Mod",
         "files_processed": "İşlenen Dosyalar",
-        "settings": "Ayarlar"
+        "settings": "Ayarlar",
+        "parallel_jobs": "Paralel iş sayısı:",
+        "render_profile": "Görüntü profili (PDF'ten PPTX'e):",
+        "profile_default": "Varsayılan (PNG, 200 DPI)",
+        "profile_print": "Baskı (PNG, 300 DPI)",
+        "profile_small": "Küçük (JPEG, 120 DPI)",
+        "profile_scan": "Taranmış metin (gri tonlamalı)",
+        "profile_auto": "Otomatik (sayfaya göre)",
+        "cancel": "İptal",
+        "resume": "Devam Et",
+        "cancelling": "İptal ediliyor...",
+        "cancelled": "İşlem iptal edildi. Kalan dosyalar için Devam Et'i kullanın.",
+        "no_job_found": "Bu klasörde yarım kalmış iş bulunamadı.",
+        "duration": "Süre (sn)",
+        "filter_type": "Tür:",
+        "filter_all": "Tümü",
+        "date_from": "Başlangıç (YYYY-AA-GG):",
+        "date_to": "Bitiş:",
+        "apply_filter": "Filtrele",
+        "file": "Dosya",
+        "status": "Durum",
+        "error": "Hata",
+        "show_stats": "Aşama istatistiklerini göster",
+        "incremental": "Yalnızca değişen sayfaları yeniden dönüştür (PDF'den PPTX'e)",
+        "vector_engine": "Metni düzenlenebilir tut (PDF'den PPTX'e, PyMuPDF gerekir)",
+        "stats_title": "İstatistikler",
+        "stage": "Aşama",
+        "count": "Adet",
+        "total_seconds": "Toplam (sn)",
+        "average_ms": "Ortalama (ms)",
+        "megabytes": "MB",
+        "memory": "Bellek: {} MB",
+        "page_progress": "{0}/{1} sayfa · {2:.1f} sayfa/sn · {3} kaldı"
     }
 }
 
@@ -152,6 +222,11 @@ pdf_engine_options = {
     }
 }
 
+render_profile_options = {
+    key: {lang: LANGUAGES[lang][f"profile_{key}"] for lang in LANGUAGES}
+    for key in ["default", "print", "small", "scan", "auto"]
+}
+
 def load_preferences():
     if os.path.exists(PREFERENCES_FILE):
         with open(PREFERENCES_FILE, "r") as file:
@@ -162,180 +237,1628 @@ def save_preferences(preferences):
     with open(PREFERENCES_FILE, "w") as file:
         json.dump(preferences, file)
 
-def ensure_history_file():
-    if not os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Date", "ConversionKey", "Mode", "Compressed", "Files", "OutputLocation"])
+_history_store = None
+_history_lock = threading.Lock()
+
+def history_store():
+    # Depo ilk kullanımda açılır; eski history.csv varsa bir kereye mahsus içeri aktarılır.
+    global _history_store
+    with _history_lock:
+        if _history_store is None:
+            from history_store import HistoryStore
+            _history_store = HistoryStore(HISTORY_DB)
+            _history_store.import_csv(HISTORY_FILE)
+        return _history_store
 
 def clear_history_file():
-    with open(HISTORY_FILE, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Date", "ConversionKey", "Mode", "Compressed", "Files", "OutputLocation"])
-
-def add_history_entry(date_str, conversion_key, mode, compressed, files, output_location):
-    ensure_history_file()
-    with open(HISTORY_FILE, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            date_str,
-            conversion_key,
-            mode,
-            "✓" if compressed else "✗",
-            files,
-            output_location
-        ])
-
-def load_history():
-    ensure_history_file()
-    rows = []
-    with open(HISTORY_FILE, "r", newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        next(reader, None)
-        for row in reader:
-            rows.append(row)
-    return rows
-
-def get_pdf_files(mode, lang):
-    root = tk.Tk()
-    root.withdraw()
+    history_store().clear()
+
+def add_history_entry(date_str, conversion_key, mode, compressed, files, output_location, seconds=None, results=None):
+    # results: convert_files'in dosya sonuçları; her dosya durumu ve süresiyle ayrıca kaydedilir.
+    return history_store().add_batch(date_str, conversion_key, mode, compressed, files, output_location, seconds, results)
+
+def load_history(offset=0, limit=100, conversion=None, date_from=None, date_to=None):
+    return history_store().page(offset, limit, conversion, date_from, date_to)
+
+def get_pdf_files(mode, lang, parent=None):
+    # Klasör seçilirse klasörün kendisi döner; içindeki dosyalar dönüşümü yapan iş parçacığında toplanır.
+    if parent is None:
+        parent = tk.Tk()
+        parent.withdraw()
     if mode == 1:
-        pdf_path = filedialog.askopenfilename(title=LANGUAGES[lang]["select_pdf"], filetypes=[("PDF Files", "*.pdf")])
+        pdf_path = filedialog.askopenfilename(parent=parent, title=LANGUAGES[lang]["select_pdf"], filetypes=[("PDF Files", "*.pdf")])
         return [pdf_path] if pdf_path else []
     elif mode == 2:
-        pdf_paths = filedialog.askopenfilenames(title=LANGUAGES[lang]["select_multiple_pdfs"], filetypes=[("PDF Files", "*.pdf")])
+        pdf_paths = filedialog.askopenfilenames(parent=parent, title=LANGUAGES[lang]["select_multiple_pdfs"], filetypes=[("PDF Files", "*.pdf")])
         return list(pdf_paths) if pdf_paths else []
     elif mode == 3:
-        folder_path = filedialog.askdirectory(title=LANGUAGES[lang]["select_folder"])
-        return [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.lower().endswith(".pdf")] if folder_path else []
+        folder_path = filedialog.askdirectory(parent=parent, title=LANGUAGES[lang]["select_folder"])
+        return [folder_path] if folder_path else []
     return []
 
-def get_pptx_files(mode, lang):
-    root = tk.Tk()
-    root.withdraw()
+def get_pptx_files(mode, lang, parent=None):
+    if parent is None:
+        parent = tk.Tk()
+        parent.withdraw()
     if mode == 1:
-        pptx_path = filedialog.askopenfilename(title=LANGUAGES[lang]["select_pptx"], filetypes=[("PPTX Files", "*.pptx")])
+        pptx_path = filedialog.askopenfilename(parent=parent, title=LANGUAGES[lang]["select_pptx"], filetypes=[("PPTX Files", "*.pptx")])
         return [pptx_path] if pptx_path else []
     elif mode == 2:
-        pptx_paths = filedialog.askopenfilenames(title=LANGUAGES[lang]["select_multiple_pptxs"], filetypes=[("PPTX Files", "*.pptx")])
+        pptx_paths = filedialog.askopenfilenames(parent=parent, title=LANGUAGES[lang]["select_multiple_pptxs"], filetypes=[("PPTX Files", "*.pptx")])
         return list(pptx_paths) if pptx_paths else []
     elif mode == 3:
-        folder_path = filedialog.askdirectory(title=LANGUAGES[lang]["select_folder"])
-        return [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.lower().endswith(".pptx")] if folder_path else []
+        folder_path = filedialog.askdirectory(parent=parent, title=LANGUAGES[lang]["select_folder"])
+        return [folder_path] if folder_path else []
     return []
 
-def pdf_to_pptx(lang, mode, zip_option, progress_update=None):
-    pdf_files = get_pdf_files(mode, lang)
-    if not pdf_files:
+def select_inputs(conversion_key, mode, lang, parent=None):
+    # Girdi ve çıktı klasörü pencereleri. Tk yalnızca kendi iş parçacığından çağrılabildiği için arayüz bunu
+    # dönüşümü başlatmadan önce (parent=root) çağırır. Dönüş: (yollar, çıktı klasörü); vazgeçilirse None.
+    if parent is None:
+        parent = tk.Tk()
+        parent.withdraw()
+    inputs = (get_pdf_files if conversion_key == "pdf_to_pptx" else get_pptx_files)(mode, lang, parent)
+    if not inputs:
         print(Fore.RED + LANGUAGES[lang]["no_file_selected"])
-        return []
-    output_folder = filedialog.askdirectory(title=LANGUAGES[lang]["select_folder"])
+        return None
+    output_folder = filedialog.askdirectory(parent=parent, title=LANGUAGES[lang]["select_folder"])
     if not output_folder:
         print(Fore.RED + LANGUAGES[lang]["no_output_folder"])
-        return []
-    output_files = []
-    total = len(pdf_files)
-    for i, pdf_path in enumerate(pdf_files):
-        if progress_update:
-            progress_update(i+1, total, LANGUAGES[lang]["processing"].format(os.path.basename(pdf_path)))
-        output_pptx_path = os.path.join(output_folder, os.path.basename(pdf_path).replace(".pdf", ".pptx"))
-        images = convert_from_path(pdf_path)
-        presentation = Presentation()
-        for image in images:
-            slide = presentation.slides.add_slide(presentation.slide_layouts[6])
-            iw, ih = image.size
-            sw, sh = presentation.slide_width, presentation.slide_height
-            ratio = iw / ih
-            if ratio > (sw / sh):
-                nw = sw
-                nh = sw / ratio
-            else:
-                nh = sh
-                nw = sh * ratio
-            left = (sw - nw) / 2
-            top = (sh - nh) / 2
-            with NamedTemporaryFile(delete=False, suffix=".png") as tmp:
-                image.save(tmp.name)
-                slide.shapes.add_picture(tmp.name, left, top, width=nw, height=nh)
-                temp_name = tmp.name
-            os.remove(temp_name)
-        presentation.save(output_pptx_path)
-        output_files.append(output_pptx_path)
-    if zip_option:
-        zip_filename = os.path.join(output_folder, "converted_pptx_files.zip")
-        with zipfile.ZipFile(zip_filename, "w") as zipf:
-            for file in output_files:
-                zipf.write(file, os.path.basename(file))
-                os.remove(file)
-        print(Fore.GREEN + f"\n{LANGUAGES[lang]['zip_completed']} {zip_filename}")
+        return None
+    return inputs, output_folder
+
+CONVERSION_SUFFIXES = {
+    "pdf_to_pptx": (".pdf", ".pptx"),
+    "pptx_to_pdf": (".pptx", ".pdf")
+}
+
+# Görüntü profilleri: dpi, format (png/jpeg/auto), JPEG kalitesi ve gri tonlama.
+# "auto" her sayfayı içeriğine göre fotoğraf (JPEG) veya çizim (paletli PNG) olarak kodlar.
+RENDER_PROFILES = {
+    "default": {"dpi": 200, "image_format": "png", "quality": 85, "grayscale": False},
+    "print": {"dpi": 300, "image_format": "png", "quality": 95, "grayscale": False},
+    "small": {"dpi": 120, "image_format": "jpeg", "quality": 70, "grayscale": False},
+    "scan": {"dpi": 150, "image_format": "png", "quality": 85, "grayscale": True},
+    "auto": {"dpi": 150, "image_format": "auto", "quality": 80, "grayscale": False}
+}
+
+IMAGE_FORMATS = ["png", "jpeg", "auto"]
+# "raster" her sayfayı görüntü olarak gömer; "vector" metni, çizimleri ve resimleri yerel şekil olarak yazar ve
+# yalnızca taşınamayan sayfaları rasterleştirir (PyMuPDF gerekir, bkz. pdf_vector).
+PPTX_ENGINES = ["raster", "vector"]
+
+DEFAULT_OPTIONS = {
+    "pdf_engine": "libreoffice",
+    "jobs": 1,
+    "pool": None,
+    "page_window": 8,
+    "profile": "default",
+    "writer": "direct",
+    "timeout": 300,
+    "office_pool": True,
+    "cache": False,
+    "cache_dir": None,
+    "cache_max_mb": 2048,
+    "zip_method": "deflated",
+    "zip_level": None,
+    "dedupe": True,
+    "page_jobs": 1,
+    "memory_budget_mb": 1024,
+    "page_cache_dir": None,
+    "manifest": True,
+    "cancel": None,
+    "metrics": None,
+    "incremental": False,
+    "pools": None,
+    "schedule": "size",
+    "progress": None,
+    "pptx_engine": "raster"
+}
+
+def conversion_options(options=None):
+    merged = dict(DEFAULT_OPTIONS)
+    explicit = {k: v for k, v in (options or {}).items() if v is not None}
+    profile = explicit.get("profile", merged["profile"])
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile: {profile}")
+    merged.update(RENDER_PROFILES[profile])
+    merged.update(explicit)
+    if merged["image_format"] not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {merged['image_format']}")
+    if merged["pptx_engine"] not in PPTX_ENGINES:
+        raise ValueError(f"Unknown PPTX engine: {merged['pptx_engine']}")
+    return merged
+
+def collect_input_files(paths, suffix, recursive=False, include=(), exclude=(), follow_symlinks=False):
+    # Klasörler (recursive ise alt klasörleriyle) ve glob desenleri genişletilir; aynı dosya bir kez alınır.
+    return discover_files(paths, (suffix,), recursive, include, exclude, follow_symlinks)[0]
+
+def assign_output_paths(input_files, output_folder, suffix):
+    used = set()
+    output_paths = []
+    for path in input_files:
+        base = os.path.splitext(os.path.basename(path))[0]
+        name = base + suffix
+        n = 2
+        while name.lower() in used:
+            name = f"{base} ({n}){suffix}"
+            n += 1
+        used.add(name.lower())
+        output_paths.append(os.path.join(output_folder, name))
+    return output_paths
+
+def record_span(stats, name, seconds, **fields):
+    # Ölçüm kapalıyken stats içinde "spans" listesi yoktur ve çağrı hiçbir şey yapmaz.
+    spans = stats.get("spans") if stats else None
+    if spans is not None:
+        fields.update(span=name, seconds=round(seconds, 6))
+        spans.append(fields)
+
+class ConversionCancelled(Exception):
+    pass
+
+def check_cancelled(options):
+    # İptal yalnızca sayfa ve dosya sınırlarında uygulanır; yarım kalan çıktı silinir.
+    cancel = options.get("cancel")
+    if cancel is not None and cancel.cancelled():
+        raise ConversionCancelled("Conversion cancelled")
+
+ZIP_METHODS = {
+    "stored": zipfile.ZIP_STORED,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA
+}
+
+class ZipStream:
+    # Biten her çıktı kuyruk üzerinden arka plandaki bir iş parçacığına verilir; bu iş parçacığı
+    # dosyayı arşive sıkıştırıp hemen siler. Sıkıştırma devam eden dönüşümlerle paralel yürür ve
+    # diskte bir anda arşiv dışında yalnızca birkaç bitmiş dosya bulunur.
+    def __init__(self, zip_filename, method="deflated", level=None, mode="w", on_write=None):
+        # on_write(dosya yolu, süre, girdi baytı, sıkıştırılmış bayt) her arşivlenen dosyadan sonra çağrılır.
+        self.zip_filename = zip_filename
+        self.on_write = on_write
+        self.zipf = zipfile.ZipFile(zip_filename, mode, ZIP_METHODS[method], compresslevel=level)
+        self.queue = queue.Queue()
+        self.error = None
+        self.bytes_in = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def add(self, path, arcname=None):
+        self.queue.put((path, arcname or os.path.basename(path)))
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            path, arcname = item
+            try:
+                if self.error is None:
+                    started = time.perf_counter()
+                    size = os.path.getsize(path)
+                    self.bytes_in += size
+                    self.zipf.write(path, arcname)
+                    os.remove(path)
+                    if self.on_write is not None:
+                        self.on_write(path, time.perf_counter() - started, size, self.zipf.getinfo(arcname).compress_size)
+            except Exception as e:
+                self.error = e
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.zipf.close()
+        if self.error is not None:
+            raise self.error
+        return {"path": self.zip_filename, "bytes_in": self.bytes_in, "bytes": os.path.getsize(self.zip_filename)}
+
+def convert_from_path(*args, **kwargs):
+    from pdf2image import convert_from_path as convert
+    return convert(*args, **kwargs)
+
+def pdfinfo_from_path(*args, **kwargs):
+    from pdf2image import pdfinfo_from_path as pdfinfo
+    return pdfinfo(*args, **kwargs)
+
+def prewarm():
+    # Pencere gösterildikten sonra arka plan iş parçacığında çağrılır; ilk dönüşüm kütüphane yüklemesini beklemez.
+    for module in PREWARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+def render_kwargs(options):
+    kwargs = {"dpi": options["dpi"], "grayscale": options["grayscale"]}
+    if options["image_format"] == "jpeg":
+        kwargs["fmt"] = "jpeg"
+        kwargs["jpegopt"] = {"quality": options["quality"], "progressive": False, "optimize": True}
     else:
-        print(Fore.GREEN + f"\n{LANGUAGES[lang]['completed']}")
-        for out in output_files:
-            print(Fore.CYAN + out)
-    return output_files
+        kwargs["fmt"] = "png"
+    return kwargs
 
-def pptx_to_pdf(lang, mode, zip_option, pdf_engine, progress_update=None):
-    pptx_files = get_pptx_files(mode, lang)
-    if not pptx_files:
-        print(Fore.RED + LANGUAGES[lang]["no_file_selected"])
-        return []
-    output_folder = filedialog.askdirectory(title=LANGUAGES[lang]["select_folder"])
-    if not output_folder:
-        print(Fore.RED + LANGUAGES[lang]["no_output_folder"])
-        return []
-    output_files = []
-    total = len(pptx_files)
-    if pdf_engine == "powerpoint_com":
+LETTER_PAGE_POINTS = (612.0, 792.0)
+
+def page_sizes(pdf_path):
+    # pdfinfo -f 1 -l N her sayfanın kutusunu punto cinsinden verir ("Page    3 size: 595 x 842 pts").
+    info = pdfinfo_from_path(pdf_path, first_page=1, last_page=2 ** 31 - 1)
+    sizes = [None] * info["Pages"]
+    for key, value in info.items():
+        match = re.match(r"Page\s+(\d+) size$", key)
+        if not match:
+            continue
+        numbers = re.findall(r"[\d.]+", value)
+        if len(numbers) >= 2 and int(match.group(1)) <= len(sizes):
+            sizes[int(match.group(1)) - 1] = (float(numbers[0]), float(numbers[1]))
+    fallback = next((size for size in sizes if size), LETTER_PAGE_POINTS)
+    return [size or fallback for size in sizes]
+
+def plan_render(pdf_path, options, page_window, budget_bytes, pages=None, stats=None):
+    # Her sayfanın çözülmüş piksel maliyeti (genişlik x yükseklik x kanal) dpi ve sayfa kutusundan
+    # hesaplanır. Sayfalar page_window boyutunda aralıklara toplanır; tek başına bütçeyi aşan bir sayfa
+    # (ör. A0 poster) bütçeye sığacak daha düşük bir dpi ile ayrı olarak rasterleştirilir.
+    # Dönüş: (ilk sayfa, son sayfa, dpi, maliyet) listesi. pdftoppm sayfaları sırayla işlediği için
+    # bir aralığın maliyeti en büyük sayfasının maliyetidir. pages verilirse yalnızca o sayfalar planlanır.
+    # stats verilirse belgenin sayfa sayısı "page_total" olarak yazılır (ilerleme bildirimi için).
+    dpi = options["dpi"]
+    channels = 1 if options["grayscale"] else 3
+    groups = []
+    current = None
+    sizes = page_sizes(pdf_path)
+    if stats is not None:
+        stats["page_total"] = len(sizes)
+    for number, (width_pt, height_pt) in enumerate(sizes, 1):
+        if pages is not None and number not in pages:
+            if current:
+                groups.append(current)
+                current = None
+            continue
+        cost = int(width_pt / 72 * dpi * height_pt / 72 * dpi * channels)
+        if budget_bytes and cost > budget_bytes:
+            if current:
+                groups.append(current)
+                current = None
+            page_dpi = max(1, int(dpi * math.sqrt(budget_bytes / cost)))
+            groups.append((number, number, page_dpi, int(cost * (page_dpi / dpi) ** 2)))
+            continue
+        if current and (not page_window or page_window <= 0 or current[1] - current[0] + 1 < page_window):
+            current = (current[0], number, dpi, max(current[3], cost))
+        else:
+            if current:
+                groups.append(current)
+            current = (number, number, dpi, cost)
+    if current:
+        groups.append(current)
+    return groups
+
+class MemoryBudget:
+    # Piksel maliyetine göre iş kabul eden sayaç. Yeni bir iş ancak toplam bütçenin altında kalıyorsa
+    # başlar; bütçeden büyük tek bir iş, başka hiçbir iş yokken tek başına kabul edilir.
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self.peak = 0
+        self.cond = threading.Condition()
+
+    def acquire(self, cost):
+        if not cost:
+            return
+        with self.cond:
+            while self.used and self.used + cost > self.limit:
+                self.cond.wait()
+            self.used += cost
+            self.peak = max(self.peak, self.used)
+
+    def release(self, cost):
+        if not cost:
+            return
+        with self.cond:
+            self.used -= cost
+            self.cond.notify_all()
+
+def render_group(pdf_path, output_folder, options, group):
+    first_page, last_page, dpi, _ = group
+    kwargs = dict(render_kwargs(options), dpi=dpi)
+    started = time.perf_counter()
+    paths = convert_from_path(pdf_path, first_page=first_page, last_page=last_page,
+                              output_folder=output_folder, paths_only=True, **kwargs)
+    return paths, time.perf_counter() - started
+
+def record_plan(stats, plan, options):
+    stats["downscaled_pages"] = sum(1 for group in plan if group[2] < options["dpi"])
+
+def iter_pdf_pages(pdf_path, page_window=8, output_folder=None, options=None, stats=None, pages=None):
+    # Sayfalar page_window boyutunda parçalar halinde işlenir. pdftoppm her sayfayı doğrudan
+    # output_folder içine son formatında yazar; görüntüler PIL ile açılıp yeniden kodlanmaz.
+    # Dönen dosyayı kullandıktan sonra silmek çağıranın sorumluluğundadır.
+    options = conversion_options(options)
+    plan = plan_render(pdf_path, options, page_window, options["memory_budget_mb"] * 1024 * 1024, pages, stats)
+    if stats is not None:
+        record_plan(stats, plan, options)
+        stats["peak_pixel_bytes"] = max((group[3] for group in plan), default=0)
+    for group in plan:
+        paths, seconds = render_group(pdf_path, output_folder, options, group)
+        if stats is not None:
+            stats["render_seconds"] = stats.get("render_seconds", 0.0) + seconds
+            record_span(stats, "render", seconds, first_page=group[0], last_page=group[1], dpi=group[2], pages=len(paths))
+        for path in paths:
+            yield path
+
+def classify_page(image):
+    # Nokta örnekleme yeni renk karışımları üretmez. Birkaç baskın renk (zemin, metin) ve
+    # ilk 256 renk sayfanın neredeyse tamamını kaplıyorsa sayfa çizim/metin, aksi halde fotoğraf kabul edilir.
+    from PIL import Image
+    sample = image.convert("RGB")
+    if sample.width * sample.height > 256 * 256:
+        scale = max(sample.width, sample.height) / 256
+        sample = sample.resize((max(1, int(sample.width / scale)), max(1, int(sample.height / scale))), Image.NEAREST)
+    pixels = sample.width * sample.height
+    colors = sorted(sample.getcolors(maxcolors=pixels), reverse=True)
+    dominant = sum(count for count, _ in colors[:8])
+    covered = sum(count for count, _ in colors[:256])
+    return "line_art" if dominant >= 0.6 * pixels and covered >= 0.97 * pixels else "photo"
+
+def encode_page(rendered, options):
+    # rendered: pdftoppm çıktısının baytları. Dönüş: (slayta eklenecek baytlar, kullanılan format)
+    if options["image_format"] != "auto":
+        return rendered, options["image_format"]
+    from PIL import Image
+    with Image.open(io.BytesIO(rendered)) as image:
+        buffer = io.BytesIO()
+        if classify_page(image) == "photo":
+            image.convert("L" if image.mode == "L" else "RGB").save(buffer, "JPEG", quality=options["quality"], optimize=True)
+            encoding = "jpeg"
+        else:
+            source = image.convert("L" if image.mode == "L" else "RGB")
+            source.quantize(colors=256, dither=Image.Dither.NONE).save(buffer, "PNG", optimize=True)
+            encoding = "png"
+    if encoding == "png" and buffer.tell() >= len(rendered):
+        return rendered, "png"
+    return buffer.getvalue(), encoding
+
+def encode_page_shared(rendered, digest, options):
+    # Toplu işte birden fazla dosyada tekrar eden sayfalar (ortak ekler, ayraçlar) için kodlanmış
+    # görüntü page_cache_dir altında paylaşılır; işçi süreçler aynı klasörü kullanır.
+    # Dönüş: (baytlar, format, önbellekten mi geldi)
+    cache_dir = options.get("page_cache_dir")
+    if not cache_dir or options["image_format"] != "auto":
+        return (*encode_page(rendered, options), False)
+    base = os.path.join(cache_dir, f"{digest}-q{options['quality']}")
+    for encoding in ("png", "jpeg"):
         try:
-            powerpoint = comtypes.client.CreateObject("PowerPoint.Application")
-            powerpoint.Visible = 1
-        except Exception as e:
-            print(Fore.RED + f"PowerPoint başlatılamadı: {e}")
-            return []
-        for i, pptx_path in enumerate(pptx_files):
-            if progress_update:
-                progress_update(i+1, total, LANGUAGES[lang]["processing"].format(os.path.basename(pptx_path)))
-            pptx_path = os.path.abspath(pptx_path)
-            if not os.path.exists(pptx_path):
-                print(Fore.RED + f"Dosya bulunamadı: {pptx_path}")
+            with open(f"{base}.{encoding}", "rb") as f:
+                return f.read(), encoding, True
+        except FileNotFoundError:
+            pass
+    blob, encoding = encode_page(rendered, options)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, f"{base}.{encoding}")
+    return blob, encoding, False
+
+def add_image_slide(presentation, image_file):
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    picture = slide.shapes.add_picture(image_file, 0, 0)
+    iw, ih = picture.image.size
+    picture.left, picture.top, picture.width, picture.height = fit_box(iw, ih, presentation.slide_width, presentation.slide_height)
+    return slide
+
+class PresentationDeck:
+    # python-pptx nesne modeli üzerinden yazan, PptxWriter ile aynı arayüze sahip yol.
+    def __init__(self, output_path):
+        from pptx import Presentation
+        self.output_path = output_path
+        self.presentation = Presentation()
+        self.slide_width = self.presentation.slide_width
+        self.slide_height = self.presentation.slide_height
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.presentation.save(self.output_path)
+        return False
+
+    def add_image_slide(self, blob):
+        # python-pptx aynı görüntüyü zaten tek bir parça olarak saklar; tanıtıcı baytların kendisidir.
+        add_image_slide(self.presentation, io.BytesIO(blob))
+        return blob
+
+    def repeat_slide(self, handle):
+        add_image_slide(self.presentation, io.BytesIO(handle))
+
+    def add_vector_slide(self, shapes):
+        # Şekiller PptxWriter ile aynı XML'den kurulur; resim parçaları python-pptx üzerinden eklenir.
+        from pptx.oxml import parse_xml
+        slide = self.presentation.slides.add_slide(self.presentation.slide_layouts[6])
+        rel_ids = [slide.part.get_or_add_image_part(io.BytesIO(shape["blob"]))[1]
+                   for shape in shapes if shape["kind"] == "picture"]
+        tree = parse_xml(f"<p:spTree {NSDECLS}>{shapes_xml(shapes, rel_ids)}</p:spTree>")
+        for element in list(tree):
+            slide.shapes._spTree.append(element)
+
+def open_deck(output_pptx_path, options):
+    if options["writer"] == "direct":
+        return PptxWriter(output_pptx_path)
+    return PresentationDeck(output_pptx_path)
+
+def prepare_page(image_file, options, claimed):
+    # Kodlama aşaması: pdftoppm çıktısını okur, siler ve kodlar. claimed, aynı görüntünün yalnızca
+    # bir kez kodlanması için özet -> ilk sahibini tutar; sonraki kopyalar kodlanmadan döner.
+    started = time.perf_counter()
+    with open(image_file, "rb") as f:
+        rendered = f.read()
+    os.remove(image_file)
+    page = {"digest": None, "rendered": rendered, "blob": None, "encoding": None, "shared": False}
+    if options["dedupe"]:
+        page["digest"] = hashlib.sha1(rendered).hexdigest()
+        if claimed.setdefault(page["digest"], image_file) != image_file:
+            page["seconds"] = time.perf_counter() - started
+            return page
+    page["blob"], page["encoding"], page["shared"] = encode_page_shared(rendered, page["digest"], options)
+    page["seconds"] = time.perf_counter() - started
+    return page
+
+def iter_prepared_pages(pdf_path, render_dir, options, stats, pages=None):
+    claimed = {}
+    for image_file in iter_pdf_pages(pdf_path, options["page_window"], render_dir, options, stats, pages):
+        yield prepare_page(image_file, options, claimed)
+
+def iter_pipelined_pages(pdf_path, render_dir, options, stats, workers, pages=None):
+    # Tek büyük PDF için üç aşamalı hat: sayfa aralıkları paralel pdftoppm süreçleriyle
+    # rasterleştirilir, kodlama ayrı bir havuzda yürür, slaytlar ise sırayla yazılır.
+    # Aşamalar arasındaki kuyruklar sınırlıdır; sayfa 40 işlenirken 39 kodlanır ve 38 yazılır.
+    # Aynı anda çalışan işler ayrıca çözülmüş piksel maliyetine göre bellek bütçesinden geçer.
+    chunk = max(1, (options["page_window"] or 8 * workers) // workers)
+    plan = collections.deque(plan_render(pdf_path, options, chunk, options["memory_budget_mb"] * 1024 * 1024, pages, stats))
+    record_plan(stats, plan, options)
+    budget = MemoryBudget(options["memory_budget_mb"] * 1024 * 1024)
+    # Yalnızca "auto" kodlama sayfayı PIL ile yeniden açar; diğer formatlar sıkıştırılmış baytlarla çalışır.
+    decodes = options["image_format"] == "auto"
+    claimed = {}
+
+    def admit(pool, cost, fn, *args):
+        budget.acquire(cost)
+        future = pool.submit(fn, *args)
+        future.add_done_callback(lambda f: budget.release(cost))
+        return future
+
+    with ThreadPoolExecutor(max_workers=workers) as render_pool, ThreadPoolExecutor(max_workers=workers) as encode_pool:
+        renders = collections.deque()
+        encodes = collections.deque()
+        try:
+            while plan or renders or encodes:
+                while plan and len(renders) < workers:
+                    group = plan.popleft()
+                    renders.append((admit(render_pool, group[3], render_group, pdf_path, render_dir, options, group), group))
+                if renders and len(encodes) < 2 * workers:
+                    future, group = renders.popleft()
+                    paths, seconds = future.result()
+                    stats["render_seconds"] += seconds
+                    record_span(stats, "render", seconds, first_page=group[0], last_page=group[1], dpi=group[2], pages=len(paths))
+                    page_cost = group[3] if decodes else 0
+                    for path in paths:
+                        encodes.append(admit(encode_pool, page_cost, prepare_page, path, options, claimed))
+                else:
+                    yield encodes.popleft().result()
+        finally:
+            for future in [f for f, _ in renders] + list(encodes):
+                future.cancel()
+            stats["peak_pixel_bytes"] = budget.peak
+
+PAGE_INDEX_VERSION = 1
+# Slayt görüntüsünün baytlarını belirleyen seçenekler; biri değişirse önceki destenin medyası kullanılmaz.
+PAGE_INDEX_OPTIONS = ("dpi", "grayscale", "image_format", "quality")
+REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+PML_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+def page_index_path(output_pptx_path):
+    # Önceki çıktının yanındaki gizli dosya: sayfa parmak izi -> destedeki medya parçası.
+    folder, name = os.path.split(output_pptx_path)
+    return os.path.join(folder, f".{name}.converty-pages.json")
+
+def deck_signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+def deck_media(pptx_path):
+    # Sunum sırasıyla her slaytın görüntü parçasının adı (ör. "ppt/media/image3.png"); görüntüsüz slaytta None.
+    import xml.etree.ElementTree as ET
+    def targets(package, part):
+        folder, name = posixpath.split(part)
+        rels_part = posixpath.join(folder, "_rels", name + ".rels")
+        if rels_part not in package.namelist():
+            return {}
+        return {rel.get("Id"): (rel.get("Type"), posixpath.normpath(posixpath.join(folder, rel.get("Target"))))
+                for rel in ET.fromstring(package.read(rels_part)).iter(REL_NS + "Relationship")}
+    media = []
+    with zipfile.ZipFile(pptx_path) as package:
+        presentation_rels = targets(package, "ppt/presentation.xml")
+        for slide_id in ET.fromstring(package.read("ppt/presentation.xml")).iter(PML_NS + "sldId"):
+            slide_part = presentation_rels[slide_id.get(R_ID)][1]
+            images = [target for kind, target in targets(package, slide_part).values() if kind.endswith("/image")]
+            media.append(images[0] if len(images) == 1 else None)
+    return media
+
+def load_page_index(pdf_path, output_pptx_path, options, stats):
+    # Dönüş: (sayfa parmak izleri, parmak izi -> önceki destedeki medya). PDF ayrıştırılamazsa parmak izi
+    # listesi None olur ve dosya baştan dönüştürülür. Önceki deste sonradan değiştirilmiş, seçenekler
+    # farklı ya da kayıt okunamıyorsa eşleme boş kalır (dosya baştan dönüştürülür, kayıt yenilenir).
+    import pdf_fingerprint
+    started = time.perf_counter()
+    try:
+        fingerprints = pdf_fingerprint.page_fingerprints(pdf_path)
+    except (ValueError, OSError, RecursionError):
+        return None, {}
+    record_span(stats, "fingerprint", time.perf_counter() - started, pages=len(fingerprints))
+    if len(fingerprints) != pdfinfo_from_path(pdf_path)["Pages"]:
+        return None, {}
+    try:
+        with open(page_index_path(output_pptx_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != PAGE_INDEX_VERSION or index.get("deck") != deck_signature(output_pptx_path) \
+                or index.get("options") != {k: options[k] for k in PAGE_INDEX_OPTIONS}:
+            return fingerprints, {}
+        return fingerprints, {page["fingerprint"]: page["media"] for page in index["pages"] if page["media"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return fingerprints, {}
+
+def save_page_index(output_pptx_path, fingerprints, options):
+    import pdf_fingerprint
+    media = deck_media(output_pptx_path)
+    if len(media) != len(fingerprints):
+        return
+    index = {"version": PAGE_INDEX_VERSION, "fingerprint_version": pdf_fingerprint.FINGERPRINT_VERSION,
+             "deck": deck_signature(output_pptx_path), "options": {k: options[k] for k in PAGE_INDEX_OPTIONS},
+             "pages": [{"fingerprint": f, "media": m} for f, m in zip(fingerprints, media)]}
+    path = page_index_path(output_pptx_path)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(path + ".tmp", path)
+
+def iter_patched_pages(pages, fingerprints, reusable, previous_deck):
+    # Değişmeyen sayfaların görüntüsü önceki destenin ZIP'inden olduğu gibi okunur (rasterleştirme ve
+    # kodlama yok); değişen ya da eklenen sayfalar sırayla işlenmiş sayfalar akışından gelir.
+    with zipfile.ZipFile(previous_deck) as package:
+        for fingerprint in fingerprints:
+            media = reusable.get(fingerprint)
+            if media is None:
+                yield next(pages)
                 continue
-            output_pdf_path = os.path.join(output_folder, os.path.basename(pptx_path).replace(".pptx", ".pdf"))
-            try:
-                presentation = powerpoint.Presentations.Open(pptx_path, WithWindow=False)
-                presentation.ExportAsFixedFormat(output_pdf_path, 2, Intent=2)
-                presentation.Close()
-                output_files.append(output_pdf_path)
-            except Exception as e:
-                print(Fore.RED + f"{pptx_path} dönüştürülürken hata oluştu: {e}")
-        powerpoint.Quit()
-    elif pdf_engine == "libreoffice":
-        for i, pptx_path in enumerate(pptx_files):
-            if progress_update:
-                progress_update(i+1, total, LANGUAGES[lang]["processing"].format(os.path.basename(pptx_path)))
-            try:
-                subprocess.run(["soffice", "--headless", "--convert-to", "pdf", pptx_path, "--outdir", output_folder],
-                               check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                output_pdf_path = os.path.join(output_folder, os.path.basename(pptx_path).replace(".pptx", ".pdf"))
-                output_files.append(output_pdf_path)
-            except subprocess.CalledProcessError as e:
-                print(Fore.RED + f"{pptx_path} dönüştürülürken hata oluştu: {e}")
+            blob = package.read(media)
+            encoding = media.rsplit(".", 1)[-1].lower().replace("jpg", "jpeg")
+            yield {"digest": "reused:" + media, "rendered": blob, "blob": blob, "encoding": encoding, "shared": False,
+                   "seconds": 0.0, "reused": True}
+
+def iter_vector_pages(pdf_path, deck, options, stats, render):
+    # Metin korumalı motor: önce her sayfanın düzeni çıkarılır; slayta taşınamayan sayfalar render(sayfalar) ile
+    # tek planda rasterleştirilir (ardışık olanlar aynı pdftoppm aralığına düşer) ve slaytlar sırayla döner.
+    # Hiç raster sayfa yoksa pdfinfo/pdftoppm çağrılmaz. Resim baytları slayt yazılırken alınır; birden çok sayfada
+    # kullanılan resim son kullanımına kadar bellekte tutulur.
+    import pdf_vector
+    with pdf_vector.open_document(pdf_path) as document:
+        stats["page_total"] = document.page_count
+        layouts = []
+        uses = collections.Counter()
+        for page in document:
+            check_cancelled(options)
+            started = time.perf_counter()
+            shapes, reason = pdf_vector.layout_page(page, deck.slide_width, deck.slide_height)
+            seconds = time.perf_counter() - started
+            stats["layout_seconds"] += seconds
+            if reason is not None:
+                stats["fallbacks"][reason] = stats["fallbacks"].get(reason, 0) + 1
+            else:
+                uses.update(shape["xref"] for shape in shapes if shape["kind"] == "picture")
+            record_span(stats, "layout", seconds, page=page.number + 1, shapes=len(shapes or ()), fallback=reason)
+            layouts.append(shapes)
+        stats["raster_pages"] = sum(1 for shapes in layouts if shapes is None)
+        stats["vector_pages"] = len(layouts) - stats["raster_pages"]
+        rasters = render({n for n, shapes in enumerate(layouts, 1) if shapes is None})
+        blobs = {}
+        for shapes in layouts:
+            if shapes is None:
+                yield next(rasters)
+                continue
+            started = time.perf_counter()
+            for shape in shapes:
+                if shape["kind"] != "picture":
+                    continue
+                xref = shape["xref"]
+                if xref not in blobs:
+                    blobs[xref] = pdf_vector.picture_blob(document, xref, shape["smask"])
+                shape["blob"] = blobs[xref]
+                uses[xref] -= 1
+                if not uses[xref]:
+                    del blobs[xref]
+            yield {"shapes": shapes, "digest": None, "seconds": time.perf_counter() - started}
+
+def convert_pdf(pdf_path, output_pptx_path, options=None):
+    options = conversion_options(options)
+    vector = options["pptx_engine"] == "vector"
+    if vector:
+        import pdf_vector
+        if not pdf_vector.vector_available():
+            raise RuntimeError("The vector PPTX engine requires PyMuPDF (pip install pymupdf)")
+    stats = {"pages": 0, "media_bytes": 0, "render_seconds": 0.0, "encode_seconds": 0.0, "assemble_seconds": 0.0,
+             "encodings": {}, "duplicate_pages": 0, "bytes_saved": 0, "encodes_saved": 0}
+    if vector:
+        stats.update({"layout_seconds": 0.0, "vector_pages": 0, "raster_pages": 0, "fallbacks": {}})
+    # Aynı şekilde rasterleştirilmiş sayfalar (boş ayraçlar, tekrar eden başlıklar) bir kez kodlanır
+    # ve destede tek bir medya parçasına bağlanır.
+    seen = {}
+    if options["metrics"]:
+        stats["spans"] = []
+    workers = max(1, int(options["page_jobs"]) or os.cpu_count() or 1)
+    fingerprints, reusable = None, {}
+    # Sayfa kaydı görüntü medyasını eşler; metin korumalı destede artımlı mod yalnızca geçici dosyaya yazmayı korur.
+    if options["incremental"] and not vector:
+        fingerprints, reusable = load_page_index(pdf_path, output_pptx_path, options, stats)
+        stats["reused_pages"] = 0
+        if fingerprints is not None:
+            # Hiçbir sayfa değişmediyse rasterleştirme (ve sayfa sayısını yazan plan) hiç çalışmaz.
+            stats["page_total"] = len(fingerprints)
+    # Yalnızca parmak izi önceki destede bulunmayan sayfalar rasterleştirilir.
+    changed = {n for n, f in enumerate(fingerprints, 1) if f not in reusable} if reusable else None
+    # Deste önce geçici dosyaya yazılır; iş yarıda kalırsa (iptal, hata) önceki çıktı yerinde kalır.
+    deck_path = output_pptx_path + ".partial"
+    with tempfile.TemporaryDirectory(prefix="converty-") as render_dir:
+        def render(numbers):
+            if workers > 1:
+                return iter_pipelined_pages(pdf_path, render_dir, options, stats, workers, numbers)
+            return iter_prepared_pages(pdf_path, render_dir, options, stats, numbers)
+        deck = open_deck(deck_path, options)
+        if vector:
+            pages = iter_vector_pages(pdf_path, deck, options, stats, render)
+        else:
+            pages = render(changed)
+            if reusable:
+                pages = iter_patched_pages(pages, fingerprints, reusable, output_pptx_path)
+        progress = options["progress"]
+        with deck:
+            for page in pages:
+                check_cancelled(options)
+                started = time.perf_counter()
+                stats["pages"] += 1
+                if progress is not None:
+                    # Tek bir bellek yazması; arayüz sayaçları kendi kare hızında okur.
+                    progress.update(stats["pages"], stats.get("page_total", 0))
+                stats["encode_seconds"] += page["seconds"]
+                if page.get("shapes") is not None:
+                    deck.add_vector_slide(page["shapes"])
+                    media_bytes = sum(len(shape["blob"]) for shape in page["shapes"] if shape["kind"] == "picture")
+                    stats["media_bytes"] += media_bytes
+                    stats["assemble_seconds"] += time.perf_counter() - started
+                    record_span(stats, "assemble", time.perf_counter() - started, page=stats["pages"],
+                                shapes=len(page["shapes"]), bytes=media_bytes)
+                    continue
+                if page.get("reused"):
+                    stats["reused_pages"] += 1
+                digest = page["digest"]
+                if digest in seen:
+                    handle, size = seen[digest]
+                    deck.repeat_slide(handle)
+                    stats["duplicate_pages"] += 1
+                    stats["bytes_saved"] += size
+                    stats["encodes_saved"] += 1
+                    stats["assemble_seconds"] += time.perf_counter() - started
+                    record_span(stats, "encode", page["seconds"], page=stats["pages"], bytes_in=len(page["rendered"]),
+                                bytes=0, duplicate=True)
+                    record_span(stats, "assemble", time.perf_counter() - started, page=stats["pages"], bytes=0, duplicate=True)
+                    continue
+                encode_seconds = page["seconds"]
+                if page["blob"] is None:
+                    # Hatta sonraki bir kopya özeti önce sahiplenmiş olabilir; ilk görülen burada kodlanır.
+                    page["blob"], page["encoding"], page["shared"] = encode_page_shared(page["rendered"], digest, options)
+                    stats["encode_seconds"] += time.perf_counter() - started
+                    encode_seconds += time.perf_counter() - started
+                    started = time.perf_counter()
+                if not page.get("reused"):
+                    record_span(stats, "encode", encode_seconds, page=stats["pages"], bytes_in=len(page["rendered"]),
+                                bytes=len(page["blob"]), encoding=page["encoding"], shared=page["shared"])
+                handle = deck.add_image_slide(page["blob"])
+                if digest is not None:
+                    seen[digest] = (handle, len(page["blob"]))
+                stats["assemble_seconds"] += time.perf_counter() - started
+                record_span(stats, "assemble", time.perf_counter() - started, page=stats["pages"], bytes=len(page["blob"]))
+                stats["encodes_saved"] += 1 if page["shared"] else 0
+                stats["media_bytes"] += len(page["blob"])
+                stats["encodings"][page["encoding"]] = stats["encodings"].get(page["encoding"], 0) + 1
+            started = time.perf_counter()
+        os.replace(deck_path, output_pptx_path)
+        stats["save_seconds"] = time.perf_counter() - started
+    if fingerprints is not None:
+        save_page_index(output_pptx_path, fingerprints, options)
+    stats["output_bytes"] = os.path.getsize(output_pptx_path)
+    record_span(stats, "save", stats["save_seconds"], bytes=stats["output_bytes"], writer=options["writer"])
+    for key in ("render_seconds", "encode_seconds", "assemble_seconds", "save_seconds", "layout_seconds"):
+        if key in stats:
+            stats[key] = round(stats[key], 3)
+    stats.update({"dpi": options["dpi"], "image_format": options["image_format"], "writer": options["writer"],
+                  "page_jobs": workers, "pptx_engine": options["pptx_engine"]})
+    return stats
+
+def soffice_convert(pptx_path, output_pdf_path, timeout=None):
+    # Her çağrı kendi profilini kullanır, böylece paralel soffice süreçleri çakışmaz.
+    import office_pool
+    error = office_pool.convert_many([pptx_path], [output_pdf_path], timeout)[0]
+    if error:
+        raise RuntimeError(error)
+
+def convert_pptx(pptx_path, output_pdf_path, options=None, office=None):
+    # office: açık bir PowerPoint COM uygulaması veya office_pool.OfficePool (yoksa tek seferlik soffice).
+    options = conversion_options(options)
+    check_cancelled(options)
+    if not os.path.exists(pptx_path):
+        raise FileNotFoundError(f"File not found: {pptx_path}")
+    stats = {"spans": []} if options["metrics"] else {}
+    started = time.perf_counter()
+    if options["pdf_engine"] == "powerpoint_com":
+        presentation = office.Presentations.Open(os.path.abspath(pptx_path), WithWindow=False)
+        try:
+            presentation.ExportAsFixedFormat(os.path.abspath(output_pdf_path), 2, Intent=2)
+        finally:
+            presentation.Close()
+    elif options["pdf_engine"] == "libreoffice":
+        if office is not None:
+            office.convert(pptx_path, output_pdf_path)
+        else:
+            soffice_convert(pptx_path, output_pdf_path, options["timeout"])
     else:
-        print(Fore.RED + "Tanımlı PDF dönüşüm motoru bulunamadı!")
-        return []
+        raise ValueError(f"Unknown PDF engine: {options['pdf_engine']}")
+    record_span(stats, "export", time.perf_counter() - started, engine=options["pdf_engine"],
+                pooled=office is not None, bytes_in=os.path.getsize(pptx_path), bytes=os.path.getsize(output_pdf_path))
+    return stats
+
+def convert_pptx_chunk(pptx_paths, output_pdf_paths, options):
+    # UNO bulunmadığında kullanılan yol: birkaç dosya tek bir soffice çağrısında dönüştürülür.
+    import office_pool
+    if options["cancel"] is not None and options["cancel"].cancelled():
+        return [cancelled_result(p) for p in pptx_paths]
+    started = time.perf_counter()
+    missing = [p for p in pptx_paths if not os.path.exists(p)]
+    present = [(p, o) for p, o in zip(pptx_paths, output_pdf_paths) if p not in missing]
+    errors = {}
+    if present:
+        for (p, o), error in zip(present, office_pool.convert_many([p for p, _ in present], [o for _, o in present], options["timeout"])):
+            errors[p] = error
+    seconds = (time.perf_counter() - started) / len(pptx_paths)
+    results = []
+    for pptx_path, output_pdf_path in zip(pptx_paths, output_pdf_paths):
+        if pptx_path in missing:
+            results.append(failed_result(pptx_path, f"FileNotFoundError: File not found: {pptx_path}"))
+        elif errors[pptx_path]:
+            results.append(failed_result(pptx_path, errors[pptx_path], seconds))
+        else:
+            results.append({"input": pptx_path, "output": output_pdf_path, "status": "done", "error": None, "seconds": round(seconds, 3)})
+            if options["metrics"]:
+                # Tek soffice çağrısının süresi dosyalara eşit paylaştırılır.
+                results[-1]["spans"] = []
+                record_span(results[-1], "export", seconds, engine="soffice_batch", batch=len(pptx_paths),
+                            bytes_in=os.path.getsize(pptx_path), bytes=os.path.getsize(output_pdf_path))
+    if options["metrics"]:
+        from metrics import current_rss
+        for result in results:
+            result["rss_bytes"] = current_rss()
+    return results
+
+def failed_result(input_path, error, seconds=0.0):
+    return {"input": input_path, "output": None, "status": "failed", "error": error, "seconds": round(seconds, 3)}
+
+def cancelled_result(input_path, seconds=0.0):
+    return {"input": input_path, "output": None, "status": "cancelled", "error": None, "seconds": round(seconds, 3)}
+
+def convert_file(conversion_key, input_path, output_path, options=None, office=None):
+    result = {"input": input_path, "output": None, "status": "done", "error": None}
+    started = time.perf_counter()
+    cancel = (options or {}).get("cancel")
+    progress = (options or {}).get("progress")
+    existed = os.path.exists(output_path)
+    try:
+        if conversion_key == "pdf_to_pptx":
+            result.update(convert_pdf(input_path, output_path, options))
+        else:
+            result.update(convert_pptx(input_path, output_path, options, office))
+        result["output"] = output_path
+    except Exception as e:
+        # Ctrl+C alt süreçleri (pdftoppm, soffice) de öldürür; iptal edilmiş bir işte bu hata sayılmaz.
+        if isinstance(e, ConversionCancelled) or (cancel is not None and cancel.cancelled()):
+            # Yalnızca bu çağrının oluşturduğu çıktı silinir; önceki bir çalıştırmanın tam çıktısı yerinde kalır.
+            if not existed and os.path.exists(output_path):
+                os.remove(output_path)
+            return cancelled_result(input_path, time.perf_counter() - started)
+        return failed_result(input_path, f"{type(e).__name__}: {e}", time.perf_counter() - started)
+    finally:
+        # Dosyanın sayaç yuvası (PageSlot) bu süreçte açtığı eşlemeyi bırakır.
+        if progress is not None:
+            progress.close()
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    if (options or {}).get("metrics"):
+        # Bellek örneği dosyayı dönüştüren süreçte alınır.
+        from metrics import current_rss
+        result["rss_bytes"] = current_rss()
+    return result
+
+def ignore_interrupts():
+    # İşçi süreçler Ctrl+C'yi ana süreçle birlikte alır; iptal kararı yalnızca ana süreçte verilir.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+class WorkerPools:
+    # Servis modunda toplu işler arasında paylaşılan sıcak havuzlar: rasterleştirme için işçi süreçler,
+    # iş parçacıkları ve LibreOffice örnekleri. Bir işçi süreci çöküp havuz bozulursa bir sonraki istekte yeniden kurulur.
+    def __init__(self, jobs, office_instances=0, timeout=None):
+        self.jobs = max(1, jobs)
+        self.office_instances = office_instances
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.executors = {}
+        self.office = None
+
+    def executor(self, pool):
+        with self.lock:
+            if pool not in self.executors:
+                if pool == "process":
+                    self.executors[pool] = ProcessPoolExecutor(max_workers=self.jobs, initializer=ignore_interrupts)
+                else:
+                    self.executors[pool] = ThreadPoolExecutor(max_workers=self.jobs)
+            return self.executors[pool]
+
+    def discard(self, pool, executor):
+        with self.lock:
+            if self.executors.get(pool) is executor:
+                del self.executors[pool]
+        executor.shutdown(wait=False)
+
+    def office_pool(self):
+        # UNO yoksa None döner; dosyalar o zaman her toplu işte soffice ile dönüştürülür.
+        import office_pool
+        with self.lock:
+            if self.office is None and self.office_instances and office_pool.uno_available():
+                self.office = office_pool.OfficePool(self.office_instances, self.timeout)
+            return self.office
+
+    def warm(self):
+        # İşçi süreçler açılıp dönüşüm kütüphanelerini yükler; ilk istek bu maliyeti ödemez.
+        executor = self.executor("process")
+        wait([executor.submit(prewarm) for _ in range(self.jobs)])
+        self.office_pool()
+
+    def stats(self):
+        with self.lock:
+            return {"jobs": self.jobs, "executors": sorted(self.executors),
+                    "office": self.office.stats() if self.office is not None else None}
+
+    def close(self):
+        with self.lock:
+            executors, self.executors = list(self.executors.values()), {}
+            office, self.office = self.office, None
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if office is not None:
+            office.close()
+
+def run_parallel(tasks, jobs, pool, on_result, cancelled=None, pools=None):
+    # tasks: (fonksiyon, argümanlar) listesi. on_result(index, sonuç, hata) tamamlanma sırasıyla çağrılır.
+    # Bir işçi süreci çökerse havuz bozulur; o anda çalışan işler tek tek yeniden denenir,
+    # böylece yalnızca çökmeye sebep olan dosya başarısız sayılır.
+    # cancelled() doğru döndüğünde yeni iş başlatılmaz, çalışanların bitmesi beklenir.
+    # pools: paylaşılan WorkerPools; verilirse havuz her çağrıda yeniden kurulmaz (yalıtılmış denemeler hariç).
+    stopped = cancelled or (lambda: False)
+    if pool == "process":
+        executor_class = lambda max_workers: ProcessPoolExecutor(max_workers=max_workers, initializer=ignore_interrupts)
+    else:
+        executor_class = ThreadPoolExecutor
+    queue = collections.deque(range(len(tasks)))
+    isolate = collections.deque()
+    while (queue or isolate) and not stopped():
+        source = isolate if isolate else queue
+        width = 1 if source is isolate else jobs
+        shared = pools.executor(pool) if pools is not None and source is queue else None
+        with contextlib.nullcontext(shared) if shared is not None else executor_class(max_workers=width) as executor:
+            running = {}
+            broken = False
+            while (running or (source and not stopped())) and not broken:
+                while source and len(running) < width and not stopped():
+                    i = source.popleft()
+                    fn, args = tasks[i]
+                    running[executor.submit(fn, *args)] = i
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    try:
+                        on_result(i, future.result(), None)
+                    except BrokenProcessPool:
+                        broken = True
+                        if width == 1:
+                            on_result(i, None, "Worker process crashed")
+                        else:
+                            isolate.append(i)
+                    except Exception as e:
+                        on_result(i, None, f"{type(e).__name__}: {e}")
+            if broken:
+                isolate.extend(running.values())
+                if shared is not None:
+                    pools.discard(pool, shared)
+
+class PowerPointUnavailable(Exception):
+    # PowerPoint COM ile açılamadı (kurulu değil, Windows değil, lisans sorunu); dosyaya değil toplu işe ait hata.
+    pass
+
+def start_powerpoint():
+    try:
+        import comtypes.client
+        powerpoint = comtypes.client.CreateObject("PowerPoint.Application")
+        powerpoint.Visible = 1
+    except Exception as e:
+        raise PowerPointUnavailable(str(e)) from e
+    return powerpoint
+
+def emit_file_metrics(metrics, conversion_key, result):
+    # İşçiden gelen aralıklar dosya bilgisiyle etiketlenir, ardından dosyanın kendisi için bir kayıt eklenir.
+    for span in result.get("spans") or []:
+        span.update(file=result["input"], conversion=conversion_key)
+        metrics.emit(span)
+    output = result.get("output")
+    metrics.emit({"span": "file", "file": result["input"], "conversion": conversion_key, "status": result["status"],
+                  "seconds": result.get("seconds", 0.0), "cached": bool(result.get("cached")),
+                  "bytes": os.path.getsize(output) if output and os.path.exists(output) else None,
+                  "rss_bytes": result.get("rss_bytes")})
+
+def convert_files(conversion_key, input_files, output_folder, options=None, zip_option=False, progress_update=None, lang="en",
+                  manifest=None):
+    # manifest: yarım kalmış bir işi sürdürmek için yüklenmiş JobManifest. Verilmezse çıktı klasöründe
+    # yeni bir iş kaydı açılır; her biten dosya oraya yazılır, iş tamamen bitince kayıt silinir.
+    batch_started = time.perf_counter()
+    # Sayfa işçisi sayısı çağıran tarafından verilmediyse tek dosyalık işte --jobs'tan alınır.
+    page_jobs_given = (options or {}).get("page_jobs") is not None
+    options = conversion_options(options)
+    metrics = None
+    if options["metrics"]:
+        from metrics import Metrics, current_rss
+        metrics = options["metrics"] if isinstance(options["metrics"], Metrics) else None
+    if metrics is not None:
+        # İşçilere yalnızca ölçümün açık olduğu bildirilir; aralıkları ana süreç kayıt yerlerine iletir.
+        options = dict(options, metrics=True)
+    pools = options["pools"]
+    if pools is not None:
+        options = dict(options, pools=None)
+    channel = options["progress"]
+    if channel is not None:
+        options = dict(options, progress=None)
+    if zip_option and options["incremental"]:
+        # Arşive alınan desteler diskten silinir; sonraki çalıştırmada yama yapılacak deste kalmaz.
+        options = dict(options, incremental=False)
+    in_suffix, out_suffix = CONVERSION_SUFFIXES[conversion_key]
+    os.makedirs(output_folder, exist_ok=True)
+    total = len(input_files)
+    results = [None] * total
+    zip_filename = os.path.join(output_folder, f"converted_{out_suffix[1:]}_files.zip")
+    zip_mode = "w"
+    archived = ()
+    if manifest is None:
+        output_paths = assign_output_paths(input_files, output_folder, out_suffix)
+        if options["manifest"] and total:
+            manifest = JobManifest.create(default_manifest_path(output_folder), conversion_key, input_files,
+                                          output_paths, output_folder, options, zip_option)
+    else:
+        output_paths = [entry["output"] for entry in manifest.files]
+        if zip_option and zipfile.is_zipfile(zip_filename):
+            # Arşive alınan çıktılar diskten silinmiştir; arşivdekiler yeniden dönüştürülmez.
+            with zipfile.ZipFile(zip_filename) as zipf:
+                archived = set(zipf.namelist())
+            zip_mode = "a"
+        left = set(manifest.remaining(archived))
+        for i in range(total):
+            if i not in left:
+                results[i] = {"input": input_files[i], "output": output_paths[i], "status": "done", "error": None,
+                              "seconds": 0.0, "resumed": True}
+    cancel = options["cancel"]
+    cancelled = (lambda: cancel.cancelled()) if cancel is not None else None
+    jobs = max(1, int(options["jobs"]) or os.cpu_count() or 1)
+    pool = options["pool"]
+    if pool is None:
+        # Rasterleştirme ve python-pptx CPU'ya bağlı, soffice ise zaten ayrı bir süreç.
+        pool = "process" if conversion_key == "pdf_to_pptx" else "thread"
+    completed = [sum(1 for r in results if r is not None)]
+    zip_stream = None
     if zip_option:
-        zip_filename = os.path.join(output_folder, "converted_pdf_files.zip")
-        with zipfile.ZipFile(zip_filename, "w") as zipf:
-            for file in output_files:
-                zipf.write(file, os.path.basename(file))
-                os.remove(file)
-        print(Fore.GREEN + f"\n{LANGUAGES[lang]['zip_completed']} {zip_filename}")
+        on_write = None
+        if metrics is not None:
+            on_write = lambda path, seconds, size, packed: metrics.emit(
+                {"span": "zip", "file": path, "seconds": round(seconds, 6), "bytes_in": size, "bytes": packed})
+        zip_stream = ZipStream(zip_filename, options["zip_method"], options["zip_level"], zip_mode, on_write)
+        for i in range(total):
+            if results[i] is not None and os.path.exists(output_paths[i]) \
+                    and os.path.basename(output_paths[i]) not in archived:
+                zip_stream.add(output_paths[i])
+
+    # Sayfa sayaçları dosya başına bir yuvadır; işçilere yalnızca kendi yuvaları verilir.
+    counters = channel.start(total) if channel is not None else None
+    file_options = (lambda i: dict(options, progress=counters.slot(i))) if counters is not None else (lambda i: options)
+
+    def notify(i):
+        if channel is not None:
+            result = results[i]
+            if result["status"] == "done":
+                pages = result.get("pages") or (conversion_key == "pptx_to_pdf" and page_count(input_files[i])) or 0
+                counters.update(i, pages, pages)
+            else:
+                # Başarısız veya iptal edilen dosyanın kalan sayfaları tahmine katılmaz.
+                done = counters.read_slot(i)[0]
+                counters.update(i, done, done)
+            channel.post("file", completed=completed[0], total=total, status=result["status"],
+                         message=LANGUAGES[lang]["processing"].format(os.path.basename(input_files[i])))
+
+    def report(i):
+        completed[0] += 1
+        notify(i)
+        if progress_update:
+            progress_update(completed[0], total, LANGUAGES[lang]["processing"].format(os.path.basename(input_files[i])))
+
+    for i in range(total):
+        if results[i] is not None:
+            notify(i)
+
+    cache = None
+    keys = [None] * total
+    if options["cache"]:
+        from conversion_cache import ConversionCache
+        cache = ConversionCache(options["cache_dir"], options["cache_max_mb"] * 1024 * 1024)
+        keys = cache.keys(conversion_key, input_files, options, jobs)
+        for i in range(total):
+            if results[i] is not None:
+                continue
+            hit = cache.fetch(keys[i], output_paths[i])
+            if hit is not None:
+                results[i] = dict(hit, input=input_files[i], output=output_paths[i])
+                if metrics is not None:
+                    emit_file_metrics(metrics, conversion_key, results[i])
+                if manifest is not None:
+                    manifest.record(i, results[i])
+                if zip_stream is not None:
+                    zip_stream.add(output_paths[i])
+                report(i)
+    pending = [i for i in range(total) if results[i] is None]
+    costs = None
+    if options["schedule"] != "input" and len(pending) > 1 and (jobs > 1 or pools is not None):
+        # Paralel çalışmada büyük dosyalar önce başlatılır; son dosya tek başına uzun süre çalışmaz.
+        with metrics.span("schedule", files=len(pending), schedule=options["schedule"]) if metrics else contextlib.nullcontext():
+            costs = dict(zip(pending, work_costs([input_files[i] for i in pending], options["schedule"])))
+        pending = largest_first(pending, [costs[i] for i in pending])
+    if conversion_key == "pdf_to_pptx" and len(pending) == 1 and jobs > 1 and not page_jobs_given:
+        # Tek dosyada dosya düzeyinde paralellik işe yaramaz; çekirdekler sayfa hattına verilir.
+        # Açıkça verilen sayfa işçisi sayısı (1 dahil) olduğu gibi kullanılır.
+        options = dict(options, page_jobs=jobs)
+    if conversion_key == "pdf_to_pptx" and len(pending) > 1 and jobs > 1:
+        # Bellek bütçesi aynı anda çalışan dosyalar arasında paylaştırılır.
+        options = dict(options, memory_budget_mb=options["memory_budget_mb"] / min(jobs, len(pending)))
+    page_cache = None
+    if conversion_key == "pdf_to_pptx" and options["dedupe"] and options["image_format"] == "auto" \
+            and not options["page_cache_dir"] and len(pending) > 1:
+        page_cache = tempfile.TemporaryDirectory(prefix="converty-pages-")
+        options = dict(options, page_cache_dir=page_cache.name)
+
+    def finish(i, result, error=None):
+        results[i] = result if error is None else failed_result(input_files[i], error)
+        if metrics is not None:
+            emit_file_metrics(metrics, conversion_key, results[i])
+        results[i].pop("spans", None)
+        # Sağlama toplamı, ZIP iş parçacığı çıktıyı silmeden önce hesaplanmalı.
+        if manifest is not None:
+            manifest.record(i, results[i])
+        if results[i]["status"] == "done":
+            if cache is not None:
+                cache.store(keys[i], output_paths[i], results[i])
+            if zip_stream is not None:
+                zip_stream.add(output_paths[i])
+
+    office = None
+    own_office = True
+    chunks = None
+    powerpoint = conversion_key == "pptx_to_pdf" and options["pdf_engine"] == "powerpoint_com" and pending
+    if powerpoint:
+        # PowerPoint tek bir COM uygulaması, dosyalar sırayla işlenmeli. Uygulama aşağıda, açılamazsa
+        # ZIP ve ilerleme kanalı kapatılabilsin diye try içinde başlatılır.
+        jobs = 1
+    elif conversion_key == "pptx_to_pdf" and pending and pools is not None and options["office_pool"] \
+            and pools.office_pool() is not None:
+        office = pools.office_pool()
+        own_office = False
+        pool = "thread"
+    elif conversion_key == "pptx_to_pdf" and len(pending) > 1:
+        import office_pool
+        if options["office_pool"] and office_pool.uno_available():
+            # Sıcak LibreOffice örnekleri iş parçacıklarından sürülür, süreç havuzuna gerek yok.
+            size = min(jobs, len(pending))
+            with metrics.span("office_start", instances=size) if metrics else contextlib.nullcontext():
+                office = office_pool.OfficePool(size, options["timeout"])
+            pool = "thread"
+        else:
+            size = min(20, -(-len(pending) // jobs))
+            if costs is not None:
+                # Gruplar toplam boyutça dengelenir.
+                chunks = balanced_groups(pending, [costs[i] for i in pending], -(-len(pending) // size), size)
+            else:
+                chunks = [pending[start:start + size] for start in range(0, len(pending), size)]
+    try:
+        if powerpoint:
+            office = start_powerpoint()
+        if chunks is not None:
+            def on_chunk(c, chunk_results, error):
+                for i, result in zip(chunks[c], chunk_results or [None] * len(chunks[c])):
+                    finish(i, result, error)
+                    report(i)
+            tasks = [(convert_pptx_chunk, ([input_files[i] for i in chunk], [output_paths[i] for i in chunk], options))
+                     for chunk in chunks]
+            run_parallel(tasks, min(jobs, len(chunks)), "thread", on_chunk, cancelled)
+        elif (jobs == 1 or len(pending) <= 1) and pools is None:
+            for i in pending:
+                if cancelled and cancelled():
+                    break
+                if progress_update:
+                    progress_update(completed[0] + 1, total, LANGUAGES[lang]["processing"].format(os.path.basename(input_files[i])))
+                finish(i, convert_file(conversion_key, input_files[i], output_paths[i], file_options(i), office))
+                completed[0] += 1
+                notify(i)
+        else:
+            def on_result(n, result, error):
+                finish(pending[n], result, error)
+                report(pending[n])
+            tasks = [(convert_file, (conversion_key, input_files[i], output_paths[i], file_options(i), office)) for i in pending]
+            run_parallel(tasks, max(1, min(jobs, len(pending))), pool, on_result, cancelled, pools)
+    finally:
+        if office is not None and own_office:
+            if options["pdf_engine"] == "powerpoint_com":
+                office.Quit()
+            else:
+                office.close()
+        zip_info = zip_stream.close() if zip_stream is not None else None
+        if page_cache is not None:
+            page_cache.cleanup()
+        if channel is not None:
+            channel.post("done", succeeded=sum(1 for r in results if r is not None and r["status"] == "done"), total=total)
+        if metrics is not None:
+            metrics.emit({"span": "batch", "conversion": conversion_key, "files": total,
+                          "seconds": round(time.perf_counter() - batch_started, 6),
+                          "bytes": zip_info["bytes"] if zip_info else None, "rss_bytes": current_rss()})
+            metrics.flush()
+    for i in range(total):
+        if results[i] is None:
+            results[i] = cancelled_result(input_files[i])
+    if manifest is not None and all(r["status"] == "done" for r in results):
+        manifest.remove()
+        manifest = None
+    return {
+        "conversion": conversion_key,
+        "output_folder": output_folder,
+        "zip": zip_info["path"] if zip_info else None,
+        "zip_bytes": zip_info["bytes"] if zip_info else None,
+        "results": results,
+        "succeeded": sum(1 for r in results if r["status"] == "done"),
+        "failed": sum(1 for r in results if r["status"] == "failed"),
+        "cancelled": sum(1 for r in results if r["status"] == "cancelled"),
+        "manifest": manifest.path if manifest is not None else None,
+        "cache": cache.stats() if cache is not None else None,
+        "bytes_saved": sum(r.get("bytes_saved", 0) for r in results if not r.get("cached")),
+        "encodes_saved": sum(r.get("encodes_saved", 0) for r in results if not r.get("cached")),
+        "seconds": round(time.perf_counter() - batch_started, 3)
+    }
+
+def resume_batch(path, progress_update=None, lang="en", options=None):
+    # path: iş kaydının kendisi veya yarım kalan işin çıktı klasörü. options yalnızca kayıttaki
+    # seçeneklerin üzerine yazılacak ayarları (iş sayısı, iptal işareti, ölçüm, ilerleme kanalı) içerir.
+    if os.path.isdir(path):
+        path = default_manifest_path(path)
+    manifest = JobManifest.load(path)
+    batch = manifest.batch
+    merged = dict(manifest.options(), **{k: v for k, v in (options or {}).items() if v is not None})
+    input_files = [entry["input"] for entry in manifest.files]
+    return convert_files(batch["conversion"], input_files, batch["output_folder"], merged, batch["zip"],
+                         progress_update, lang, manifest)
+
+def print_batch(batch, lang):
+    for r in batch["results"]:
+        if r["status"] == "failed":
+            print(Fore.RED + f"{r['input']}: {r['error']}")
+    if batch["cancelled"]:
+        print(Fore.YELLOW + LANGUAGES[lang]["cancelled"])
+        return
+    if batch["zip"]:
+        print(Fore.GREEN + f"\n{LANGUAGES[lang]['zip_completed']} {batch['zip']}")
     else:
         print(Fore.GREEN + f"\n{LANGUAGES[lang]['completed']}")
-        for out in output_files:
-            print(Fore.CYAN + out)
-    return output_files
+        for r in batch["results"]:
+            if r["status"] == "done":
+                print(Fore.CYAN + r["output"])
+
+def pdf_to_pptx(lang, mode, zip_option, progress_update=None, options=None, selection=None):
+    # selection: select_inputs'un önceden seçtiği (yollar, çıktı klasörü); verilmezse pencereler burada açılır.
+    selection = selection or select_inputs("pdf_to_pptx", mode, lang)
+    if selection is None:
+        return None
+    inputs, output_folder = selection
+    pdf_files = collect_input_files(inputs, ".pdf")
+    if not pdf_files:
+        print(Fore.RED + LANGUAGES[lang]["no_file_selected"])
+        return None
+    batch = convert_files("pdf_to_pptx", pdf_files, output_folder, options, zip_option, progress_update, lang)
+    print_batch(batch, lang)
+    return batch
+
+def pptx_to_pdf(lang, mode, zip_option, pdf_engine, progress_update=None, options=None, selection=None):
+    selection = selection or select_inputs("pptx_to_pdf", mode, lang)
+    if selection is None:
+        return None
+    inputs, output_folder = selection
+    pptx_files = collect_input_files(inputs, ".pptx")
+    if not pptx_files:
+        print(Fore.RED + LANGUAGES[lang]["no_file_selected"])
+        return None
+    if pdf_engine not in pdf_engine_options:
+        print(Fore.RED + "Tanımlı PDF dönüşüm motoru bulunamadı!")
+        return None
+    try:
+        batch = convert_files("pptx_to_pdf", pptx_files, output_folder, dict(options or {}, pdf_engine=pdf_engine),
+                              zip_option, progress_update, lang)
+    except PowerPointUnavailable as e:
+        print(Fore.RED + f"PowerPoint başlatılamadı: {e}")
+        return None
+    print_batch(batch, lang)
+    return batch
+
+def add_metrics_arguments(command):
+    command.add_argument("--metrics-jsonl", help="Append per-stage timing spans to this JSON lines file")
+    command.add_argument("--metrics-prom", help="Write per-stage totals to this Prometheus text exposition file")
+
+def build_metrics(args):
+    from metrics import Metrics, JsonLinesSink, PrometheusSink
+    sinks = []
+    if args.metrics_jsonl:
+        sinks.append(JsonLinesSink(args.metrics_jsonl))
+    if args.metrics_prom:
+        sinks.append(PrometheusSink(args.metrics_prom))
+    return Metrics(sinks) if sinks else None
+
+def jpeg_quality(value):
+    # Pillow 95'in üzerini önermez (dosya büyür, kalite artmaz); 0 ve altı geçersizdir.
+    quality = int(value)
+    if not 1 <= quality <= 95:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 95, got {quality}")
+    return quality
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="converty", description="Converty headless batch converter.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for key in CONVERSION_SUFFIXES:
+        command = commands.add_parser(key, help=LANGUAGES["en"][key])
+        command.add_argument("inputs", nargs="+", help="Input files, folders or glob patterns")
+        command.add_argument("-o", "--output", required=True, help="Output folder")
+        command.add_argument("-r", "--recursive", action="store_true", help="Descend into sub folders and expand ** globs")
+        command.add_argument("--include", action="append", default=[],
+                             help="Only take files in folders whose relative path or name matches this glob (repeatable)")
+        command.add_argument("--exclude", action="append", default=[],
+                             help="Skip files and sub folders whose relative path or name matches this glob (repeatable)")
+        command.add_argument("--follow-symlinks", action="store_true", help="Descend into symbolic links to folders")
+        command.add_argument("--schedule", choices=["size", "pages", "input"], default=DEFAULT_OPTIONS["schedule"],
+                             help="Order of parallel work: largest files first by bytes or pages, or as given")
+        command.add_argument("-j", "--jobs", type=int, default=1, help="Files converted concurrently (0 = CPU count)")
+        command.add_argument("--pool", choices=["process", "thread"], help="Worker type used when --jobs > 1")
+        command.add_argument("--zip", action="store_true", help="Store the results in a single ZIP file")
+        if key == "pdf_to_pptx":
+            command.add_argument("--page-window", type=int, default=DEFAULT_OPTIONS["page_window"],
+                                 help="Pages rendered at once per file (0 = whole document, uses the most memory)")
+            command.add_argument("--profile", choices=list(RENDER_PROFILES), default=DEFAULT_OPTIONS["profile"],
+                                 help="Rendering profile; the options below override its values")
+            command.add_argument("--dpi", type=int, help="Rendering resolution")
+            command.add_argument("--format", dest="image_format", choices=IMAGE_FORMATS, help="Slide image encoding")
+            command.add_argument("--quality", type=jpeg_quality, help="JPEG quality (1-95)")
+            command.add_argument("--grayscale", action="store_true", default=None, help="Render pages in grayscale")
+            command.add_argument("--page-jobs", type=int,
+                                 help="Render/encode workers inside each PDF (0 = CPU count; default 1, or --jobs for a single input)")
+            command.add_argument("--memory-budget", type=int, default=DEFAULT_OPTIONS["memory_budget_mb"],
+                                 help="MB of decoded page pixels allowed in flight; larger pages are rendered at a lower DPI")
+            command.add_argument("--no-dedupe", dest="dedupe", action="store_false", default=None,
+                                 help="Store repeated pages as separate images")
+            command.add_argument("--writer", choices=["direct", "python-pptx"], default=DEFAULT_OPTIONS["writer"],
+                                 help="PPTX writer: streamed package (fast) or the python-pptx object model")
+            command.add_argument("--incremental", action="store_true",
+                                 help="Re-render only pages that changed since the previous output (ignored with --zip)")
+            command.add_argument("--engine", dest="pptx_engine", choices=PPTX_ENGINES, default=DEFAULT_OPTIONS["pptx_engine"],
+                                 help="raster: every page as an image; vector: editable text, shapes and pictures, "
+                                      "rendering only pages that cannot be reproduced (requires PyMuPDF)")
+        command.add_argument("--zip-method", choices=list(ZIP_METHODS), default=DEFAULT_OPTIONS["zip_method"],
+                             help="Compression used inside the ZIP file")
+        command.add_argument("--zip-level", type=int, help="Compression level (deflated 0-9, bzip2 1-9)")
+        command.add_argument("--no-history", action="store_true", help="Do not record the batch in the history")
+        command.add_argument("--no-manifest", action="store_true",
+                             help="Do not keep a job record in the output folder (the batch cannot be resumed)")
+        command.add_argument("--cache", action="store_true",
+                             help="Reuse and keep results in the conversion cache (skips inputs converted before with the same settings)")
+        command.add_argument("--cache-dir", help="Conversion cache folder")
+        command.add_argument("--cache-size", type=int, default=DEFAULT_OPTIONS["cache_max_mb"],
+                             help="Cache size limit in MB; least recently used entries are evicted")
+        command.add_argument("--purge-cache", action="store_true", help="Empty the conversion cache before converting")
+        command.add_argument("-q", "--quiet", action="store_true", help="Do not report progress on stderr")
+        add_metrics_arguments(command)
+        if key == "pptx_to_pdf":
+            command.add_argument("--engine", choices=list(pdf_engine_options), default=DEFAULT_OPTIONS["pdf_engine"])
+            command.add_argument("--timeout", type=float, default=DEFAULT_OPTIONS["timeout"], help="Seconds allowed per file")
+            command.add_argument("--no-office-pool", action="store_true",
+                                 help="Do not keep LibreOffice running between files (one soffice call per group of files)")
+    command = commands.add_parser("resume", help="Finish an interrupted or cancelled batch")
+    command.add_argument("job", help="Output folder of the batch or its .converty-job.jsonl file")
+    command.add_argument("-j", "--jobs", type=int, help="Files converted concurrently (default: as recorded)")
+    command.add_argument("--no-history", action="store_true", help="Do not record the batch in the history")
+    command.add_argument("-q", "--quiet", action="store_true", help="Do not report progress on stderr")
+    add_metrics_arguments(command)
+    command = commands.add_parser("watch", help="Convert files as they appear in hot folders until interrupted")
+    command.add_argument("folders", nargs="+", help="Folders to watch")
+    command.add_argument("-o", "--output", required=True, help="Output folder (sub folders are mirrored)")
+    command.add_argument("-r", "--recursive", action="store_true", help="Watch sub folders too")
+    command.add_argument("--conversion", choices=list(CONVERSION_SUFFIXES), action="append",
+                         help="Only run this conversion (default: both, chosen by file extension)")
+    command.add_argument("-j", "--jobs", type=int, default=1, help="Files converted concurrently (0 = CPU count)")
+    command.add_argument("--profile", choices=list(RENDER_PROFILES), default=DEFAULT_OPTIONS["profile"])
+    command.add_argument("--incremental", action="store_true",
+                         help="Re-render only the pages of a PDF that changed since its previous output")
+    command.add_argument("--engine", choices=list(pdf_engine_options), default=DEFAULT_OPTIONS["pdf_engine"])
+    command.add_argument("--pptx-engine", choices=PPTX_ENGINES, default=DEFAULT_OPTIONS["pptx_engine"],
+                         help="PDF to PPTX engine (see pdf_to_pptx --engine)")
+    command.add_argument("--timeout", type=float, default=DEFAULT_OPTIONS["timeout"], help="Seconds allowed per file")
+    command.add_argument("--settle", type=float, default=2.0,
+                         help="Seconds a file must stay unchanged before it is considered completely written")
+    command.add_argument("--polling", action="store_true",
+                         help="Scan the folders instead of using inotify (required for network shares)")
+    command.add_argument("--poll-interval", type=float, default=2.0, help="Seconds between scans when polling")
+    command.add_argument("--queue-size", type=int, default=64, help="Ready files handed to the converter at most")
+    command.add_argument("--batch-size", type=int, default=8, help="Files converted together per batch")
+    command.add_argument("--stats-interval", type=float, default=60.0, help="Seconds between statistics reports")
+    command.add_argument("--stats-file", help="Also write the latest statistics to this JSON file")
+    command.add_argument("--no-history", action="store_true", help="Do not record the batches in the history")
+    command.add_argument("-q", "--quiet", action="store_true", help="Do not report progress on stderr")
+    add_metrics_arguments(command)
+    command = commands.add_parser("serve", help="Accept conversion jobs over a local HTTP or Unix socket API")
+    command.add_argument("--host", default="127.0.0.1", help="Loopback address to listen on")
+    command.add_argument("--port", type=int, default=8765, help="TCP port (0 = any free port)")
+    command.add_argument("--socket", help="Listen on this Unix socket instead of TCP")
+    command.add_argument("-j", "--jobs", type=int, default=0, help="Shared worker processes (0 = CPU count)")
+    command.add_argument("--concurrent-jobs", type=int, default=2, help="Jobs converted at the same time")
+    command.add_argument("--office-instances", type=int, default=1,
+                         help="LibreOffice instances kept running for PPTX to PDF jobs (0 = one soffice call per job)")
+    command.add_argument("--timeout", type=float, default=DEFAULT_OPTIONS["timeout"], help="Seconds allowed per file")
+    command.add_argument("--spool", help="Folder for uploads and default outputs (default: a temporary folder)")
+    command.add_argument("--input-root", action="append", default=[],
+                         help="Folder whose files may be submitted by path (repeatable; without it only uploads are accepted)")
+    command.add_argument("--output-root", help="Folder under which jobs may choose an output folder (default: inside --spool)")
+    command.add_argument("--token", help="Key required in the X-Converty-Token header of uploads "
+                                         "(default: $CONVERTY_SERVICE_TOKEN or a random key printed at startup)")
+    command.add_argument("--no-history", action="store_true", help="Do not record the jobs in the history")
+    command.add_argument("-q", "--quiet", action="store_true", help="Do not log requests on stderr")
+    add_metrics_arguments(command)
+    return parser
+
+def cli_main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    cancel = CancelToken()
+    def interrupt(signum, frame):
+        # İlk Ctrl+C işi sayfa/dosya sınırında durdurur (kalan dosyalar "resume" ile sürdürülür),
+        # ikincisi hemen çıkar.
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        print(Fore.YELLOW + LANGUAGES["en"]["cancelling"], file=sys.stderr)
+        cancel.cancel()
+    signal.signal(signal.SIGINT, interrupt)
+    progress_update = None
+    if not args.quiet:
+        progress_update = lambda c, t, m: print(f"[{c}/{t}] {m}", file=sys.stderr)
+    metrics = build_metrics(args)
+    try:
+        if args.command == "watch":
+            return cli_watch(args, cancel, metrics)
+        if args.command == "serve":
+            return cli_serve(args, cancel, metrics)
+        if args.command == "resume":
+            batch = resume_batch(args.job, progress_update, options={"jobs": args.jobs, "cancel": cancel, "metrics": metrics})
+            if not args.no_history and batch["results"]:
+                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                add_history_entry(now, batch["conversion"], 2 if len(batch["results"]) > 1 else 1, batch["zip"] is not None,
+                                  batch["succeeded"], os.path.abspath(batch["output_folder"]), batch["seconds"], batch["results"])
+        else:
+            batch = cli_convert(args, cancel, progress_update, metrics)
+    finally:
+        cancel.close()
+        if metrics is not None:
+            metrics.close()
+    json.dump(batch, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    if batch["cancelled"]:
+        return 130
+    return 0 if batch["failed"] == 0 else 1
+
+def watch_output_folder(path, folders, output_folder):
+    # İzlenen klasörün alt klasör yapısı çıktı klasöründe korunur.
+    for folder in folders:
+        relative = os.path.relpath(os.path.dirname(os.path.abspath(path)), os.path.abspath(folder))
+        if not relative.startswith(os.pardir):
+            return os.path.normpath(os.path.join(output_folder, relative))
+    return output_folder
+
+def cli_watch(args, cancel, metrics=None):
+    from folder_watch import HotFolder
+    output_root = os.path.join(os.path.abspath(args.output), "")
+    if any(os.path.join(os.path.abspath(f), "").startswith(output_root) for f in args.folders):
+        # Çıktılar yeniden girdi olarak algılanırdı.
+        raise SystemExit("The output folder must not be a watched folder or contain one")
+    conversions = args.conversion or list(CONVERSION_SUFFIXES)
+    by_suffix = {CONVERSION_SUFFIXES[key][0]: key for key in conversions}
+    options = {"jobs": args.jobs, "profile": args.profile, "pdf_engine": args.engine, "pptx_engine": args.pptx_engine,
+               "timeout": args.timeout, "incremental": args.incremental, "manifest": False, "cancel": cancel, "metrics": metrics}
+
+    def output_path(path):
+        conversion_key = by_suffix[os.path.splitext(path)[1].lower()]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(watch_output_folder(path, args.folders, args.output), stem + CONVERSION_SUFFIXES[conversion_key][1])
+
+    def is_current(path):
+        target = output_path(path)
+        return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path)
+
+    def convert(paths):
+        groups = {}
+        for i, path in enumerate(paths):
+            conversion_key = by_suffix[os.path.splitext(path)[1].lower()]
+            groups.setdefault((conversion_key, watch_output_folder(path, args.folders, args.output)), []).append(i)
+        results = [None] * len(paths)
+        for (conversion_key, output_folder), indexes in groups.items():
+            batch = convert_files(conversion_key, [paths[i] for i in indexes], output_folder, options)
+            for i, result in zip(indexes, batch["results"]):
+                results[i] = result
+                if not args.quiet:
+                    print(f"[{result['status']}] {paths[i]}", file=sys.stderr)
+            if not args.no_history:
+                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                add_history_entry(now, conversion_key, 3, False, batch["succeeded"], os.path.abspath(output_folder),
+                                  batch["seconds"], batch["results"])
+        return results
+
+    def report():
+        stats = watcher.stats()
+        if args.stats_file:
+            with open(args.stats_file + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(stats, f)
+            os.replace(args.stats_file + ".tmp", args.stats_file)
+        return stats
+
+    watcher = HotFolder(args.folders, list(by_suffix), convert, args.recursive, args.settle, args.polling,
+                        args.poll_interval, args.queue_size, args.batch_size, exclude=[args.output], is_current=is_current,
+                        log=lambda message: print(Fore.YELLOW + message, file=sys.stderr))
+    watcher.start()
+    next_report = time.monotonic() + args.stats_interval
+    while not cancel.cancelled():
+        time.sleep(0.5)
+        if time.monotonic() >= next_report:
+            stats = report()
+            if not args.quiet:
+                print(json.dumps(stats), file=sys.stderr)
+            next_report = time.monotonic() + args.stats_interval
+    watcher.stop()
+    json.dump(report(), sys.stdout, indent=2)
+    print()
+    return 0
+
+# Servise istemcilerin verebileceği seçenekler: yalnızca çıktının biçimini belirleyen ayarlar. Klasör, önbellek,
+# havuz ve iş kaydı ayarları servisi başlatana aittir.
+SERVICE_OPTIONS = {"dpi", "image_format", "quality", "grayscale", "pptx_engine", "writer", "profile"}
+
+def cli_serve(args, cancel, metrics=None):
+    import conversion_service
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    pools = WorkerPools(jobs, args.office_instances, args.timeout)
+
+    def validate(conversion_key, inputs, options):
+        if conversion_key not in CONVERSION_SUFFIXES:
+            raise ValueError(f"Unknown conversion: {conversion_key}")
+        unknown = set(options) - SERVICE_OPTIONS
+        if unknown:
+            raise ValueError(f"Unsupported options: {', '.join(sorted(unknown))}")
+        conversion_options(options)
+        if not inputs or not all(isinstance(p, str) for p in inputs):
+            raise ValueError("inputs must be a non-empty list of paths")
+        # Yollar servisin çalışma klasörüne göre değil, olduğu gibi yorumlanır.
+        missing = [p for p in inputs if not os.path.isabs(p) or not (any(c in p for c in "*?[") or os.path.exists(p))]
+        if missing:
+            raise ValueError(f"Inputs must be existing absolute paths: {', '.join(missing)}")
+        if not job_inputs(conversion_key, inputs):
+            raise ValueError(f"No {CONVERSION_SUFFIXES[conversion_key][0]} files found in the inputs")
+
+    def job_inputs(conversion_key, inputs):
+        # Klasör ve glob içinden bulunan dosyalar da (bağlantılar çözülerek) izin verilen köklerde olmalı.
+        files = collect_input_files(inputs, CONVERSION_SUFFIXES[conversion_key][0])
+        return [p for p in files if service.readable(p) or conversion_service.within(p, [os.path.realpath(spool)])]
+
+    def run_job(job, progress):
+        input_files = job_inputs(job.conversion, job.inputs)
+        options = dict(job.options, jobs=jobs, pools=pools, cancel=job.cancel, metrics=metrics)
+        batch = convert_files(job.conversion, input_files, job.output_folder, options, job.zip, progress)
+        if not args.no_history and batch["results"]:
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            add_history_entry(now, job.conversion, 2 if len(batch["results"]) > 1 else 1, job.zip, batch["succeeded"],
+                              job.output_folder, batch["seconds"], batch["results"])
+        if metrics is not None:
+            metrics.flush()
+        return batch
+
+    spool = os.path.abspath(args.spool or os.path.join(tempfile.gettempdir(), f"converty-service-{os.getpid()}"))
+    service = conversion_service.ConversionService(run_job, spool, args.concurrent_jobs, validate, CancelToken,
+                                                   input_roots=args.input_root, output_root=args.output_root)
+    log = None if args.quiet else (lambda line: print(line, file=sys.stderr))
+    try:
+        server = conversion_service.create_server(service, args.host, args.port, args.socket, pools.stats, log,
+                                                  args.token or os.environ.get("CONVERTY_SERVICE_TOKEN"))
+    except (ValueError, OSError) as e:
+        service.close()
+        raise SystemExit(str(e))
+    # Havuzlar ilk istekten önce ısıtılır.
+    pools.warm()
+    address = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{server.server_address[1]}"
+    print(json.dumps({"listening": address, "jobs": jobs, "concurrent_jobs": args.concurrent_jobs, "token": server.token,
+                      "input_roots": service.input_roots, "output_root": service.output_root}), flush=True)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.5}, daemon=True)
+    thread.start()
+    try:
+        while not cancel.cancelled():
+            time.sleep(0.5)
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+        pools.close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+        if not args.spool:
+            shutil.rmtree(spool, ignore_errors=True)
+    json.dump(service.status(), sys.stdout, indent=2)
+    print()
+    return 0
+
+def cli_convert(args, cancel, progress_update, metrics=None):
+    conversion_key = args.command
+    in_suffix = CONVERSION_SUFFIXES[conversion_key][0]
+    input_files = collect_input_files(args.inputs, in_suffix, args.recursive, args.include, args.exclude, args.follow_symlinks)
+    options = {"jobs": args.jobs, "pool": args.pool, "schedule": args.schedule, "cache": args.cache,
+               "cache_dir": args.cache_dir, "cache_max_mb": args.cache_size,
+               "zip_method": args.zip_method, "zip_level": args.zip_level,
+               "manifest": not args.no_manifest, "cancel": cancel, "metrics": metrics}
+    if args.purge_cache:
+        from conversion_cache import ConversionCache
+        ConversionCache(args.cache_dir, args.cache_size * 1024 * 1024).purge()
+    if conversion_key == "pdf_to_pptx":
+        options.update({"page_window": args.page_window, "profile": args.profile, "dpi": args.dpi,
+                        "image_format": args.image_format, "quality": args.quality, "grayscale": args.grayscale,
+                        "writer": args.writer, "dedupe": args.dedupe, "page_jobs": args.page_jobs,
+                        "memory_budget_mb": args.memory_budget, "incremental": args.incremental,
+                        "pptx_engine": args.pptx_engine})
+    if conversion_key == "pptx_to_pdf":
+        options.update({"pdf_engine": args.engine, "timeout": args.timeout, "office_pool": not args.no_office_pool})
+    batch = convert_files(conversion_key, input_files, args.output, options, args.zip, progress_update)
+    if not args.no_history and input_files:
+        if any(os.path.isdir(p) or any(c in p for c in "*?[") for p in args.inputs):
+            mode = 3
+        else:
+            mode = 2 if len(input_files) > 1 else 1
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        add_history_entry(now, conversion_key, mode, args.zip, batch["succeeded"], os.path.abspath(args.output),
+                          batch["seconds"], batch["results"])
+    return batch
 
 def main_app():
+    import pdf_vector
+    from progress_channel import ProgressChannel
+    from metrics import Metrics, StatsSink
     prefs = load_preferences()
     root = tk.Tk()
     root.title("Converty")
@@ -360,6 +1883,12 @@ def main_app():
     default_engine = prefs.get("pdf_engine", "libreoffice")
     pdf_engine_var_display.set(pdf_engine_options[default_engine][lang_var.get()])
     theme_var = tk.StringVar(value=prefs.get("theme", "Default"))
+    stats_var = tk.BooleanVar(value=prefs.get("show_stats", False))
+    incremental_var = tk.BooleanVar(value=prefs.get("incremental", False))
+    vector_var = tk.BooleanVar(value=prefs.get("pptx_engine") == "vector" and pdf_vector.vector_available())
+    jobs_var = tk.IntVar(value=prefs.get("jobs", os.cpu_count() or 1))
+    profile_var_display = tk.StringVar()
+    profile_var_display.set(render_profile_options[prefs.get("render_profile", "default")][lang_var.get()])
 
     main_frame = ttk.Frame(root)
     main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -412,11 +1941,44 @@ def main_app():
     pdf_engine_combo = ttk.Combobox(pdf_eng_frame, textvariable=pdf_engine_var_display, state="readonly", width=20)
     pdf_engine_combo.pack(side="left", padx=5)
 
+    jobs_frame = ttk.Frame(pref_frame)
+    jobs_frame.pack(anchor="w", padx=5, pady=5)
+    jobs_label = ttk.Label(jobs_frame, text="")
+    jobs_label.pack(side="left", padx=5)
+    jobs_spin = ttk.Spinbox(jobs_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=jobs_var, state="readonly", width=5)
+    jobs_spin.pack(side="left", padx=5)
+
+    profile_frame = ttk.Frame(pref_frame)
+    profile_frame.pack(anchor="w", padx=5, pady=5)
+    profile_label = ttk.Label(profile_frame, text="")
+    profile_label.pack(side="left", padx=5)
+    profile_combo = ttk.Combobox(profile_frame, textvariable=profile_var_display, state="readonly", width=30)
+    profile_combo.pack(side="left", padx=5)
+
+    incremental_check = ttk.Checkbutton(pref_frame, text="", variable=incremental_var)
+    incremental_check.pack(anchor="w", padx=5, pady=5)
+
+    vector_check = ttk.Checkbutton(pref_frame, text="", variable=vector_var)
+    vector_check.pack(anchor="w", padx=5, pady=5)
+    if not pdf_vector.vector_available():
+        vector_check.state(["disabled"])
+
+    stats_check = ttk.Checkbutton(pref_frame, text="", variable=stats_var)
+    stats_check.pack(anchor="w", padx=5, pady=5)
+
     save_pref_check = ttk.Checkbutton(pref_frame, text="", variable=save_pref_var)
     save_pref_check.pack(anchor="w", padx=5, pady=5)
 
-    convert_btn = ttk.Button(main_frame, text="")
-    convert_btn.pack(pady=10)
+    button_frame = ttk.Frame(main_frame)
+    button_frame.pack(pady=10)
+    convert_btn = ttk.Button(button_frame, text="")
+    convert_btn.pack(side="left", padx=5)
+    cancel_btn = ttk.Button(button_frame, text="", state="disabled")
+    cancel_btn.pack(side="left", padx=5)
+    resume_btn = ttk.Button(button_frame, text="")
+    resume_btn.pack(side="left", padx=5)
+    # Çalışan dönüşümün iş parçacığı ve iptal işareti
+    worker = {"thread": None, "cancel": None}
 
     progress_frame = ttk.LabelFrame(main_frame, text="")
     progress_frame.pack(fill="x", pady=10)
@@ -424,18 +1986,52 @@ def main_app():
     progress_label.pack(pady=5)
     progress_bar = ttk.Progressbar(progress_frame, length=400, mode="determinate")
     progress_bar.pack(pady=5)
+    rate_label = ttk.Label(progress_frame, text="")
+    rate_label.pack(pady=5)
+    # Dönüştürücü iş parçacıkları ve süreçlerden gelen ilerleme ile arayüz çağrıları bu kanaldan geçer;
+    # pencere öğelerine yalnızca pump() (Tk iş parçacığı) dokunur.
+    channel = ProgressChannel()
+
+    # Ölçüm yalnızca panel açıkken toplanır; kapalıyken dönüştürücülere hiçbir kayıt yeri verilmez.
+    stats_frame = ttk.LabelFrame(main_frame, text="")
+    stats_tree = ttk.Treeview(stats_frame, columns=("stage", "count", "seconds", "average", "megabytes"), show="headings", height=6)
+    stats_tree.pack(fill="x", padx=5, pady=5)
+    memory_label = ttk.Label(stats_frame, text="")
+    memory_label.pack(anchor="w", padx=5)
+    stats_sink = StatsSink()
+    stats_metrics = Metrics([stats_sink])
+    stats_poll = {"active": False}
 
     history_frame = ttk.LabelFrame(main_frame, text="")
     history_frame.pack(fill="both", expand=True, pady=10)
-    tree = ttk.Treeview(history_frame, columns=("date", "conversion", "mode", "zip", "files", "output"), show="headings")
-    vsb = ttk.Scrollbar(history_frame, orient="vertical", command=tree.yview)
-    tree.configure(yscrollcommand=vsb.set)
-    tree.grid(row=0, column=0, sticky="nsew")
-    vsb.grid(row=0, column=1, sticky="ns")
+    filter_frame = ttk.Frame(history_frame)
+    filter_frame.grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
+    filter_type_label = ttk.Label(filter_frame, text="")
+    filter_type_label.pack(side="left", padx=5)
+    filter_type_combo = ttk.Combobox(filter_frame, state="readonly", width=18)
+    filter_type_combo.pack(side="left", padx=5)
+    filter_from_var = tk.StringVar()
+    filter_from_label = ttk.Label(filter_frame, text="")
+    filter_from_label.pack(side="left", padx=5)
+    ttk.Entry(filter_frame, textvariable=filter_from_var, width=12).pack(side="left", padx=5)
+    filter_to_var = tk.StringVar()
+    filter_to_label = ttk.Label(filter_frame, text="")
+    filter_to_label.pack(side="left", padx=5)
+    ttk.Entry(filter_frame, textvariable=filter_to_var, width=12).pack(side="left", padx=5)
+    filter_btn = ttk.Button(filter_frame, text="")
+    filter_btn.pack(side="left", padx=5)
+    tree = ttk.Treeview(history_frame, columns=("date", "conversion", "mode", "zip", "files", "output", "seconds"),
+                        show="headings", selectmode="browse")
+    # Kaydırma çubuğu ağaca değil sayfalamaya bağlıdır: ağaçta yalnızca görünen satırlar bulunur.
+    vsb = ttk.Scrollbar(history_frame, orient="vertical")
+    tree.grid(row=1, column=0, sticky="nsew")
+    vsb.grid(row=1, column=1, sticky="ns")
     history_frame.grid_columnconfigure(0, weight=1)
-    history_frame.grid_rowconfigure(0, weight=1)
+    history_frame.grid_rowconfigure(1, weight=1)
     clear_btn = ttk.Button(history_frame, text="")
-    clear_btn.grid(row=1, column=0, pady=5, sticky="e")
+    clear_btn.grid(row=2, column=0, pady=5, sticky="e")
+    # "ready": geçmiş deposu arka planda açılana kadar sorgu yapılmaz (bkz. warm_up).
+    history_view = {"offset": 0, "total": 0, "rows": 10, "filters": {}, "ready": False}
 
     def update_style():
         if theme_var.get().lower() in ["koyu", "dark"]:
@@ -451,20 +2047,59 @@ def main_app():
         style.configure("Horizontal.TProgressbar", troughcolor=current_colors["secondary"], background=current_colors["success"])
         root.configure(bg=current_colors["background"])
 
+    def refresh_stats():
+        if not stats_var.get():
+            stats_poll["active"] = False
+            return
+        snapshot = stats_sink.snapshot()
+        stats_tree.delete(*stats_tree.get_children())
+        for name, stage in sorted(snapshot["stages"].items()):
+            average = stage["seconds"] / stage["count"] * 1000 if stage["count"] else 0
+            stats_tree.insert("", "end", values=(name, stage["count"], f"{stage['seconds']:.2f}", f"{average:.1f}",
+                                                 f"{stage['bytes'] / 2 ** 20:.1f}"))
+        rss = snapshot["rss_bytes"]
+        memory_label.config(text=LANGUAGES[lang_var.get()]["memory"].format(f"{rss / 2 ** 20:.0f}" if rss else "-"))
+        root.after(1000, refresh_stats)
+
+    def toggle_stats(*args):
+        if stats_var.get():
+            stats_frame.pack(fill="x", pady=10, after=progress_frame)
+            if not stats_poll["active"]:
+                stats_poll["active"] = True
+                refresh_stats()
+        else:
+            stats_frame.pack_forget()
+
+    def history_filters():
+        conversion = [None, "pdf_to_pptx", "pptx_to_pdf"][max(filter_type_combo.current(), 0)]
+        return {"conversion": conversion, "date_from": filter_from_var.get().strip() or None,
+                "date_to": filter_to_var.get().strip() or None}
+
     def refresh_history():
-        for item in tree.get_children():
-            tree.delete(item)
+        # Filtreye uyan kayıt sayısı yeniden sayılır ve ilk sayfa gösterilir.
+        if not history_view["ready"]:
+            return
+        history_view["filters"] = history_filters()
+        history_view["total"] = history_store().count(**history_view["filters"])
+        history_view["offset"] = 0
+        show_history_page()
+
+    def show_history_page():
+        # Yalnızca görünen satırlar veritabanından okunur ve ağaca eklenir.
+        if not history_view["ready"]:
+            return
+        total = history_view["total"]
+        rows = history_view["rows"]
+        offset = max(0, min(history_view["offset"], total - rows))
+        history_view["offset"] = offset
+        tree.delete(*tree.get_children())
         current_lang = lang_var.get()
-        for row in load_history():
-            date_str, conversion_key, mode_num, compressed, files, output = row
+        for row in load_history(offset, rows, **history_view["filters"]):
+            batch_id, date_str, conversion_key, mode_int, compressed, files, output, seconds = row
             try:
                 translated_conversion = LANGUAGES[current_lang][conversion_key]
             except KeyError:
                 translated_conversion = conversion_key
-            try:
-                mode_int = int(mode_num)
-            except ValueError:
-                mode_int = 1
             if conversion_key == "pdf_to_pptx":
                 mode_options = ["select_pdf", "select_multiple_pdfs", "select_folder"]
             else:
@@ -473,12 +2108,62 @@ def main_app():
                 mode_desc = LANGUAGES[current_lang][mode_options[mode_int - 1]]
             else:
                 mode_desc = "Unknown"
-            tree.insert("", "end", values=(date_str, translated_conversion, mode_desc, compressed, files, output))
+            duration = "" if seconds is None else f"{seconds:.1f}"
+            tree.insert("", "end", iid=str(batch_id),
+                        values=(date_str, translated_conversion, mode_desc, "✓" if compressed else "✗", files, output, duration))
+        if total:
+            vsb.set(offset / total, min(1.0, (offset + rows) / total))
+        else:
+            vsb.set(0, 1)
+
+    def scroll_history(*args):
+        if args[0] == "moveto":
+            history_view["offset"] = int(float(args[1]) * history_view["total"])
+        else:
+            step = history_view["rows"] if args[2] == "pages" else 1
+            history_view["offset"] += int(args[1]) * step
+        show_history_page()
+
+    def wheel_history(event):
+        scroll_history("scroll", -3 if event.num == 4 or event.delta > 0 else 3, "units")
+        return "break"
+
+    def resize_history(event):
+        # Başlık satırı da bir satır yüksekliğinde sayılır.
+        rows = max(1, event.height // 25 - 1)
+        if rows != history_view["rows"]:
+            history_view["rows"] = rows
+            show_history_page()
+
+    def show_history_files(event):
+        item = tree.focus()
+        if not item:
+            return
+        lang = lang_var.get()
+        window = tk.Toplevel(root)
+        window.title(tree.item(item, "values")[0])
+        window.configure(bg=root["bg"])
+        files_tree = ttk.Treeview(window, columns=("file", "status", "seconds", "error"), show="headings")
+        for column, key in (("file", "file"), ("status", "status"), ("seconds", "duration"), ("error", "error")):
+            files_tree.heading(column, text=LANGUAGES[lang][key])
+        files_vsb = ttk.Scrollbar(window, orient="vertical", command=files_tree.yview)
+        files_tree.configure(yscrollcommand=files_vsb.set)
+        files_tree.pack(side="left", fill="both", expand=True)
+        files_vsb.pack(side="right", fill="y")
+        for input_path, output, status, error, seconds in history_store().file_records(int(item)):
+            files_tree.insert("", "end", values=(input_path, status, "" if seconds is None else f"{seconds:.1f}", error or ""))
 
     def clear_history():
         clear_history_file()
         refresh_history()
 
+    def selected_render_profile():
+        selected_display = profile_var_display.get()
+        for key, translations in render_profile_options.items():
+            if selected_display in translations.values():
+                return key
+        return "default"
+
     def update_labels(*args):
         lang = lang_var.get()
         # Update frame ve label başlıkları
@@ -491,8 +2176,19 @@ def main_app():
         mode_label.config(text=LANGUAGES[lang]["select_mode"])
         zip_check.config(text=LANGUAGES[lang]["select_zip"])
         pdf_eng_label.config(text=LANGUAGES[lang]["select_pdf_engine"])
+        jobs_label.config(text=LANGUAGES[lang]["parallel_jobs"])
+        profile_label.config(text=LANGUAGES[lang]["render_profile"])
+        incremental_check.config(text=LANGUAGES[lang]["incremental"])
+        vector_check.config(text=LANGUAGES[lang]["vector_engine"])
+        stats_check.config(text=LANGUAGES[lang]["show_stats"])
+        stats_frame.config(text=LANGUAGES[lang]["stats_title"])
+        for column, key in (("stage", "stage"), ("count", "count"), ("seconds", "total_seconds"),
+                            ("average", "average_ms"), ("megabytes", "megabytes")):
+            stats_tree.heading(column, text=LANGUAGES[lang][key])
         save_pref_check.config(text=LANGUAGES[lang]["save_preferences"])
         convert_btn.config(text=LANGUAGES[lang]["start_conversion"])
+        cancel_btn.config(text=LANGUAGES[lang]["cancel"])
+        resume_btn.config(text=LANGUAGES[lang]["resume"])
         progress_frame.config(text=LANGUAGES[lang]["progress_title"])
         clear_btn.config(text=LANGUAGES[lang]["clear_history"])
         tree.heading("date", text=LANGUAGES[lang]["date"])
@@ -501,6 +2197,14 @@ def main_app():
         tree.heading("zip", text=LANGUAGES[lang]["compressed"])
         tree.heading("files", text=LANGUAGES[lang]["processed_files"])
         tree.heading("output", text=LANGUAGES[lang]["output_location"])
+        tree.heading("seconds", text=LANGUAGES[lang]["duration"])
+        filter_type_label.config(text=LANGUAGES[lang]["filter_type"])
+        filter_from_label.config(text=LANGUAGES[lang]["date_from"])
+        filter_to_label.config(text=LANGUAGES[lang]["date_to"])
+        filter_btn.config(text=LANGUAGES[lang]["apply_filter"])
+        selected_filter = max(filter_type_combo.current(), 0)
+        filter_type_combo['values'] = [LANGUAGES[lang]["filter_all"], LANGUAGES[lang]["pdf_to_pptx"], LANGUAGES[lang]["pptx_to_pdf"]]
+        filter_type_combo.current(selected_filter)
 
         # Güncel dil için tema combobox değerleri
         if lang == "tr":
@@ -513,6 +2217,10 @@ def main_app():
             pdf_engine_options["powerpoint_com"][lang],
             pdf_engine_options["libreoffice"][lang]
         ]
+        # Seçili profil yeni dilde gösterilir
+        selected_profile = selected_render_profile()
+        profile_combo['values'] = [render_profile_options[key][lang] for key in render_profile_options]
+        profile_var_display.set(render_profile_options[selected_profile][lang])
         # Mode radio button'ları yeniden oluşturuluyor
         for widget in mode_frame.winfo_children():
             widget.destroy()
@@ -533,14 +2241,108 @@ def main_app():
         refresh_history()
         update_style()
 
-    def start_conversion():
+    def show_pages():
+        snapshot = channel.snapshot()
+        if snapshot is None:
+            return
+        if snapshot["pages_total"]:
+            progress_bar["maximum"] = snapshot["pages_total"]
+            progress_bar["value"] = snapshot["pages_done"]
+        else:
+            # Sayfa sayısı henüz bilinmiyor (ör. PPTX dosyaları); çubuk dosya sayısını gösterir.
+            progress_bar["maximum"] = max(1, snapshot["files_total"])
+            progress_bar["value"] = snapshot["files_done"]
+        eta = snapshot["eta_seconds"]
+        rate_label.config(text=LANGUAGES[lang_var.get()]["page_progress"].format(
+            snapshot["pages_done"], snapshot["pages_total"] or "?", snapshot["pages_per_second"],
+            str(datetime.timedelta(seconds=round(eta))) if eta is not None else "-"))
+
+    def pump():
+        # Bir çağrı hata verse de kanal boşaltılmaya devam etsin diye sonraki kare önce kurulur.
+        root.after(1000 // PROGRESS_FPS, pump)
+        events = channel.drain()
+        for kind, fields in events:
+            if kind == "call":
+                fields["fn"]()
+            elif kind == "file":
+                if fields["completed"] == fields["total"]:
+                    progress_label.config(text=LANGUAGES[lang_var.get()]["finished"])
+                else:
+                    progress_label.config(text=fields["message"])
+        if worker["thread"] is not None or events:
+            show_pages()
+
+    def run_worker(job):
+        # job iptal işaretini alıp dönüşümü yürütür; düğmeler iş süresince kilitlenir.
+        cancel = CancelToken()
+        worker["cancel"] = cancel
         convert_btn.config(state="disabled")
+        resume_btn.config(state="disabled")
+        cancel_btn.config(state="normal")
         progress_bar["value"] = 0
         progress_label.config(text="")
+        rate_label.config(text="")
+        def run():
+            try:
+                job(cancel)
+            finally:
+                if cancel.cancelled():
+                    channel.call(lambda: progress_label.config(text=LANGUAGES[lang_var.get()]["cancelled"]))
+                cancel.close()
+                channel.call(finish_worker)
+        worker["thread"] = threading.Thread(target=run, daemon=True)
+        worker["thread"].start()
+
+    def finish_worker():
+        worker["thread"] = None
+        worker["cancel"] = None
+        convert_btn.config(state="normal")
+        resume_btn.config(state="normal")
+        cancel_btn.config(state="disabled")
+        refresh_history()
+
+    def cancel_conversion():
+        if worker["cancel"] is not None:
+            worker["cancel"].cancel()
+            cancel_btn.config(state="disabled")
+            progress_label.config(text=LANGUAGES[lang_var.get()]["cancelling"])
+
+    def resume_conversion():
+        lang = lang_var.get()
+        folder = filedialog.askdirectory(parent=root, title=LANGUAGES[lang]["select_folder"])
+        if not folder:
+            return
+        if not os.path.exists(default_manifest_path(folder)):
+            progress_label.config(text=LANGUAGES[lang]["no_job_found"])
+            return
+        def job(cancel):
+            batch = resume_batch(folder, None, lang, {"cancel": cancel, "progress": channel})
+            print_batch(batch, lang)
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            add_history_entry(now, batch["conversion"], 3, batch["zip"] is not None, batch["succeeded"], folder,
+                              batch["seconds"], batch["results"])
+        run_worker(job)
+
+    def close_window():
+        # Pencere kapanırken çalışan dönüşüm iptal edilir ve yarım çıktı bırakmadan bitmesi beklenir.
+        if worker["thread"] is None:
+            root.destroy()
+            return
+        cancel_conversion()
+        root.after(100, close_window)
+
+    def start_conversion():
         lang = lang_var.get()
         conversion = conv_type_var.get()
         mode = mode_var.get()
         zip_option = zip_var.get()
+        render_profile = selected_render_profile()
+        pptx_engine = "vector" if vector_var.get() else "raster"
+        options = {"jobs": jobs_var.get(), "profile": render_profile, "incremental": incremental_var.get(),
+                   "pptx_engine": pptx_engine}
+        if stats_var.get():
+            stats_sink.reset()
+            options["metrics"] = stats_metrics
         pdf_engine = None
         if conversion == "pptx_to_pdf":
             selected_display = pdf_engine_var_display.get()
@@ -555,38 +2357,68 @@ def main_app():
                 "mode": mode,
                 "zip_option": zip_option,
                 "pdf_engine": pdf_engine,
-                "theme": theme_var.get()
+                "theme": theme_var.get(),
+                "jobs": jobs_var.get(),
+                "render_profile": render_profile,
+                "show_stats": stats_var.get(),
+                "incremental": incremental_var.get(),
+                "pptx_engine": pptx_engine
             }
             save_preferences(new_prefs)
-        def update_progress(current, total, message):
-            progress_bar["maximum"] = total
-            progress_bar["value"] = current
-            progress_label.config(text=message)
-            if current == total:
-                progress_label.config(text=LANGUAGES[lang]["finished"])
-        def run_conv():
-            try:
-                if conversion == "pdf_to_pptx":
-                    result = pdf_to_pptx(lang, mode, zip_option, lambda c, t, m: root.after(0, lambda: update_progress(c, t, m)))
-                else:
-                    result = pptx_to_pdf(lang, mode, zip_option, pdf_engine, lambda c, t, m: root.after(0, lambda: update_progress(c, t, m)))
-                now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                output_location = os.path.dirname(result[0]) if result else ""
-                conversion_key = "pdf_to_pptx" if conversion == "pdf_to_pptx" else "pptx_to_pdf"
-                add_history_entry(now, conversion_key, mode, zip_option, len(result) if result else 0, output_location)
-                refresh_history()
-            finally:
-                root.after(0, lambda: convert_btn.config(state="normal"))
-        threading.Thread(target=run_conv, daemon=True).start()
+        # Dosya pencereleri arayüz iş parçacığında açılır; dönüşüm iş parçacığına yalnızca seçilen yollar geçer.
+        selection = select_inputs(conversion, mode, lang, root)
+        if selection is None:
+            return
+        def run_conv(cancel):
+            run_options = dict(options, cancel=cancel, progress=channel)
+            if conversion == "pdf_to_pptx":
+                batch = pdf_to_pptx(lang, mode, zip_option, None, run_options, selection)
+            else:
+                batch = pptx_to_pdf(lang, mode, zip_option, pdf_engine, None, run_options, selection)
+            if batch is None:
+                return
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            add_history_entry(now, batch["conversion"], mode, zip_option, batch["succeeded"],
+                              os.path.abspath(batch["output_folder"]), batch["seconds"], batch["results"])
+        run_worker(run_conv)
 
     lang_var.trace_add("write", update_labels)
     conv_type_var.trace_add("write", update_labels)
     theme_var.trace_add("write", update_labels)
+    stats_var.trace_add("write", toggle_stats)
     convert_btn.configure(command=start_conversion)
+    cancel_btn.configure(command=cancel_conversion)
+    resume_btn.configure(command=resume_conversion)
+    root.protocol("WM_DELETE_WINDOW", close_window)
     clear_btn.configure(command=clear_history)
+    filter_btn.configure(command=refresh_history)
+    vsb.configure(command=scroll_history)
+    tree.bind("<MouseWheel>", wheel_history)
+    tree.bind("<Button-4>", wheel_history)
+    tree.bind("<Button-5>", wheel_history)
+    tree.bind("<Configure>", resize_history)
+    tree.bind("<Double-1>", show_history_files)
     update_labels()
-    refresh_history()
+    toggle_stats()
+
+    def history_ready():
+        history_view["ready"] = True
+        refresh_history()
+
+    def warm_up():
+        # Geçmiş deposu (ilk açılıştaki history.csv aktarımı dahil) ve dönüşüm kütüphaneleri arka planda
+        # hazırlanır; pencere bunları beklemeden çizilir, geçmiş hazır olunca doldurulur.
+        history_store()
+        channel.call(history_ready)
+        prewarm()
+
+    root.after_idle(lambda: threading.Thread(target=warm_up, daemon=True).start())
+    pump()
     root.mainloop()
+    channel.close()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        sys.exit(cli_main())
     main_app()
@@ -0,0 +1,362 @@
+import math, re, functools, importlib.util
+
+# Metni koruyan PDF -> PPTX düzeni. Sayfanın metin satırları, vektör yolları ve gömülü görüntüleri PyMuPDF ile
+# okunur ve slayt koordinatlarına (EMU) taşınır; pptx_writer bunları yerel metin kutusu, serbest şekil ve resim
+# olarak yazar. Slayta aynı görünümle taşınamayan sayfalar için layout_page bir neden döner ve o sayfa
+# rasterleştirilir: gölgelendirme, Type3 yazı tipi, kırpılmış çizim, saydamlık grubu ya da çok sayıda yol gibi.
+# PyMuPDF isteğe bağlıdır; yalnızca bu motor seçildiğinde yüklenir.
+
+# Bu sayıdan fazla yol ya da yol parçası içeren sayfa karmaşık çizim kabul edilir; şekil olarak hem yavaş
+# açılır hem de görüntüden büyük olur.
+MAX_PATHS = 500
+MAX_SEGMENTS = 20000
+EMU_PER_POINT = 12700
+# Aynı satırdaki iki parça arasındaki boşluk yazı boyunun bu katını aşarsa ayrı kutuya yazılır (tablo sütunları).
+COLUMN_GAP = 1.0
+WORD_GAP = 0.15
+# Sayfa kutusu ve kırpma kontrollerinde punto cinsinden tolerans.
+TOLERANCE = 1.0
+
+# PDF'deki PostScript adları -> Office'te karşılığı olan aile adları.
+FONT_ALIASES = {
+    "Helvetica": "Arial", "Times": "Times New Roman", "TimesNewRoman": "Times New Roman", "Courier": "Courier New",
+    "CourierNew": "Courier New", "ArialNarrow": "Arial Narrow", "ZapfDingbats": "Wingdings", "DejaVuSans": "DejaVu Sans",
+    "DejaVuSerif": "DejaVu Serif", "DejaVuSansMono": "DejaVu Sans Mono",
+    # Ghostscript/TeX çıktılarındaki URW yazı tipleri ölçü uyumlu oldukları ailelerle değiştirilir.
+    "NimbusSanL": "Arial", "NimbusSans": "Arial", "NimbusRomNo9L": "Times New Roman", "NimbusRoman": "Times New Roman",
+    "NimbusMonL": "Courier New", "NimbusMono": "Courier New", "NimbusMonoPS": "Courier New"
+}
+BOLD_WORDS = ("Bold", "Black", "Heavy", "Semibold", "Demi")
+ITALIC_WORDS = ("Italic", "Oblique")
+# Geçerli bir Unicode karşılığı olmayan glifler (ToUnicode eksik) ve özel kullanım alanı.
+UNMAPPED = re.compile("[\ufffd\ue000-\uf8ff]")
+
+class RasterFallback(Exception):
+    # Sayfanın neden rasterleştirileceği (kısa bir anahtar, ör. "shading").
+    pass
+
+def vector_available():
+    return importlib.util.find_spec("pymupdf") is not None or importlib.util.find_spec("fitz") is not None
+
+def load():
+    # PyMuPDF 1.24'ten önce yalnızca "fitz" adıyla kurulur.
+    try:
+        import pymupdf
+    except ImportError:
+        import fitz as pymupdf
+    return pymupdf
+
+def open_document(pdf_path):
+    return load().open(pdf_path)
+
+def slide_matrix(page, slide_width, slide_height):
+    # Sayfa (döndürülmüş haliyle) slayta görüntülü slaytlardaki fit_box ile aynı şekilde ortalanır.
+    # Dönüş: döndürülmemiş sayfa koordinatlarından EMU'ya matris ve punto başına EMU.
+    from pptx_writer import fit_box
+    pymupdf = load()
+    rect = page.rect
+    left, top, width, _ = fit_box(rect.width, rect.height, slide_width, slide_height)
+    scale = width / rect.width
+    return page.rotation_matrix * pymupdf.Matrix(scale, 0, 0, scale, left, top), scale
+
+def color_hex(color):
+    # PyMuPDF çizim renkleri 0-1 aralığında gri, RGB ya da CMYK demetleridir.
+    if len(color) == 1:
+        rgb = color * 3
+    elif len(color) == 4:
+        c, m, y, k = color
+        rgb = ((1 - c) * (1 - k), (1 - m) * (1 - k), (1 - y) * (1 - k))
+    else:
+        rgb = color[:3]
+    return "".join(f"{round(max(0.0, min(1.0, v)) * 255):02X}" for v in rgb)
+
+def opacity(value):
+    # DrawingML saydamlığı 0-100000 arasıdır; tam opak renkte öğe yazılmaz (None).
+    if value is None or value >= 1:
+        return None
+    return max(0, round(value * 100000))
+
+@functools.lru_cache(maxsize=None)
+def typeface(font):
+    # "ABCDEF+Calibri-Bold" -> "Calibri", "TimesNewRomanPSMT" -> "Times New Roman", "MinionPro-Regular" -> "Minion Pro"
+    name = font.split("+", 1)[1] if re.match(r"[A-Z]{6}\+", font) else font
+    base = re.split(r"[-,]", name)[0]
+    base = re.sub(r"(PSMT|PS|MT)$", "", base) or base
+    return FONT_ALIASES.get(base, re.sub(r"(?<=[a-z])(?=[A-Z])", " ", base))
+
+def span_run(span, scale):
+    font = span["font"]
+    return {"text": span["text"], "font": typeface(font),
+            "size": max(100, min(400000, round(span["size"] * scale / EMU_PER_POINT * 100))),
+            "bold": bool(span["flags"] & 16) or any(w in font for w in BOLD_WORDS),
+            "italic": bool(span["flags"] & 2) or any(w in font for w in ITALIC_WORDS),
+            "color": f"{span['color'] & 0xFFFFFF:06X}",
+            # alpha 0 görünmez metindir (ör. taranmış sayfanın OCR katmanı); aranabilir kalması için saydam yazılır.
+            "alpha": opacity(span.get("alpha", 255) / 255)}
+
+def quarter_turns(direction, rotation):
+    # Satır yönü + sayfa dönüşü 90 derecenin katı değilse metin kutusuna birebir taşınamaz.
+    angle = (math.degrees(math.atan2(direction[1], direction[0])) + rotation) % 360
+    turns = round(angle / 90)
+    if abs(angle - turns * 90) > 0.5:
+        raise RasterFallback("skewed_text")
+    return turns % 4
+
+def rotated_box(rect, turns):
+    # rect: slayttaki eksene hizalı kutu. DrawingML kutuyu döndürmeden önceki boyutuyla ve merkez etrafında döndürür.
+    width, height = (rect.height, rect.width) if turns % 2 else (rect.width, rect.height)
+    cx, cy = (rect.x0 + rect.x1) / 2, (rect.y0 + rect.y1) / 2
+    return (round(cx - width / 2), round(cy - height / 2), max(1, round(width)), max(1, round(height)))
+
+def line_shapes(line, matrix, scale, rotation, counts):
+    # Bir satırın parçaları (span) yazı yönündeki konumlarına göre gruplanır: aradaki boşluk COLUMN_GAP'i aşarsa
+    # yeni metin kutusu açılır, kelime aralığı kadarsa ve metinde boşluk yoksa araya boşluk eklenir.
+    pymupdf = load()
+    dx, dy = line["dir"]
+    turns = quarter_turns(line["dir"], rotation)
+    segments = []
+    end = None
+    for span in line["spans"]:
+        if not span["text"]:
+            continue
+        counts["chars"] += len(span["text"])
+        counts["unmapped"] += len(UNMAPPED.findall(span["text"]))
+        x0, y0, x1, y1 = span["bbox"]
+        along = [x * dx + y * dy for x in (x0, x1) for y in (y0, y1)]
+        gap = min(along) - end if end is not None else 0
+        run = span_run(span, scale)
+        if not segments or gap > COLUMN_GAP * span["size"]:
+            segments.append({"bbox": [x0, y0, x1, y1], "runs": [run]})
+        else:
+            segment = segments[-1]
+            bbox = segment["bbox"]
+            segment["bbox"] = [min(bbox[0], x0), min(bbox[1], y0), max(bbox[2], x1), max(bbox[3], y1)]
+            last = segment["runs"][-1]
+            if gap > WORD_GAP * span["size"] and not last["text"][-1:].isspace() and not run["text"][:1].isspace():
+                last["text"] += " "
+            if all(last[k] == run[k] for k in run if k != "text"):
+                last["text"] += run["text"]
+            else:
+                segment["runs"].append(run)
+        end = max(along)
+    shapes = []
+    for segment in segments:
+        if not "".join(run["text"] for run in segment["runs"]).strip():
+            continue
+        shapes.append({"kind": "text", "box": rotated_box(pymupdf.Rect(segment["bbox"]) * matrix, turns), "rotation": turns * 90,
+                       "runs": segment["runs"]})
+    return shapes
+
+def contains(outer, inner, tolerance=TOLERANCE):
+    return inner.x0 >= outer.x0 - tolerance and inner.y0 >= outer.y0 - tolerance \
+        and inner.x1 <= outer.x1 + tolerance and inner.y1 <= outer.y1 + tolerance
+
+def path_commands(path, matrix):
+    # PDF yolu -> DrawingML komutları: ("M", p), ("L", p), ("C", p1, p2, p3), ("Z",). Noktalar slayt EMU'sundadır.
+    commands = []
+    current = None
+    for item in path["items"]:
+        kind = item[0]
+        if kind in ("re", "qu"):
+            quad = item[1].quad if kind == "re" else item[1]
+            corners = [p * matrix for p in (quad.ul, quad.ur, quad.lr, quad.ll)]
+            commands += [("M", corners[0])] + [("L", p) for p in corners[1:]] + [("Z",)]
+            current = None
+            continue
+        start = item[1] * matrix
+        if current is None or abs(start.x - current.x) > 1 or abs(start.y - current.y) > 1:
+            commands.append(("M", start))
+        if kind == "l":
+            current = item[2] * matrix
+            commands.append(("L", current))
+        else:
+            current = item[4] * matrix
+            commands.append(("C", item[2] * matrix, item[3] * matrix, current))
+    if path.get("closePath"):
+        commands.append(("Z",))
+    return commands
+
+def path_shape(path, matrix, scale, scissor):
+    # scissor: yola uygulanan kırpma kutusu (döndürülmemiş sayfa koordinatlarında). Yalnızca dolgulu dikdörtgenler
+    # kutuya göre kesilebilir; kırpmadan taşan diğer yollar sayfayı rasterleştirir.
+    pymupdf = load()
+    fill = color_hex(path["fill"]) if "f" in path["type"] and path.get("fill") is not None else None
+    stroke = color_hex(path["color"]) if "s" in path["type"] and path.get("color") is not None else None
+    if fill is None and stroke is None:
+        return None
+    rect = pymupdf.Rect(path["rect"])
+    if stroke is not None:
+        rect = rect + (-path["width"] / 2, -path["width"] / 2, path["width"] / 2, path["width"] / 2)
+    preset = len(path["items"]) == 1 and path["items"][0][0] == "re"
+    if scissor is not None and not contains(scissor, rect):
+        if not (preset and stroke is None):
+            raise RasterFallback("clipped_art")
+        rect = pymupdf.Rect(path["items"][0][1]) & scissor
+        if rect.is_empty:
+            return None
+        path = dict(path, items=[("re", rect, 1)])
+    commands = path_commands(path, matrix)
+    points = [p for command in commands for p in command[1:]]
+    left = min(p.x for p in points)
+    top = min(p.y for p in points)
+    width = max(1, round(max(p.x for p in points) - left))
+    height = max(1, round(max(p.y for p in points) - top))
+    line = None
+    if stroke is not None:
+        dashes = path.get("dashes") or ""
+        line = {"color": stroke, "alpha": opacity(path.get("stroke_opacity")),
+                "width": max(3175, round((path.get("width") or 0) * scale)),
+                "dashed": bool(re.search(r"\d", dashes.split("]")[0]))}
+    shape = {"kind": "path", "box": (round(left), round(top), width, height), "preset": preset,
+             "fill": fill and {"color": fill, "alpha": opacity(path.get("fill_opacity"))}, "line": line}
+    if not preset:
+        shape["commands"] = [(c[0], *((round(p.x - left), round(p.y - top)) for p in c[1:])) for c in commands]
+    return shape
+
+def drawing_shapes(page, matrix, scale, page_rect):
+    # Kırpma yolları "level" ile iç içedir: level L'deki kırpma, kendisinden sonra gelen ve level'ı L'den büyük
+    # öğelere uygulanır. Dönüş: ((seqno, şekil) listesi, sayfanın tamamını kapsamayan kırpma kutuları).
+    clips = []
+    shapes = []
+    scissors = []
+    segments = 0
+    for entry in page.get_drawings(extended=True):
+        level = entry.get("level", 0)
+        while clips and clips[-1][0] >= level:
+            clips.pop()
+        kind = entry["type"]
+        if kind == "clip":
+            scissor = entry["scissor"] & (clips[-1][1] if clips else page_rect)
+            clips.append((level, scissor))
+            if not contains(scissor, page_rect):
+                scissors.append(scissor)
+            continue
+        if kind == "group":
+            if (entry.get("opacity") or 1) < 1 or entry.get("blendmode", "Normal") not in ("Normal", None):
+                raise RasterFallback("transparency_group")
+            continue
+        segments += len(entry["items"])
+        if segments > MAX_SEGMENTS:
+            raise RasterFallback("vector_art")
+        shape = path_shape(entry, matrix, scale, clips[-1][1] if clips else page_rect)
+        if shape is not None:
+            shapes.append((entry["seqno"], shape))
+    return shapes, scissors
+
+def image_shapes(page, matrix, page_rect, scissors, sequence):
+    # sequence: get_bboxlog'daki "fill-image" sıra numaraları (yollarla birlikte çizim sırasını korumak için).
+    pymupdf = load()
+    document = page.parent
+    infos = page.get_image_info(xrefs=True)
+    if len(infos) != len(sequence):
+        raise RasterFallback("unsupported_image")
+    shapes = []
+    for seqno, info in zip(sequence, infos):
+        xref = info["xref"]
+        if not xref:
+            raise RasterFallback("inline_image")
+        smask = 0
+        if info["has-mask"]:
+            kind, value = document.xref_get_key(xref, "SMask")
+            if kind != "xref":
+                raise RasterFallback("masked_image")
+            smask = int(value.split()[0])
+        bbox = pymupdf.Rect(info["bbox"])
+        crop = (0, 0, 0, 0)
+        # Kırpma kutusunun hangi görüntüye uygulandığı bilinmez; görüntüyü kesen bir kutu varsa sayfa rasterleştirilir.
+        # Yalnızca sayfa kenarından taşan (ör. taşmalı arka plan) düz görüntü srcRect ile kesilir.
+        if any(s.intersects(bbox) and not contains(s, bbox) for s in scissors):
+            raise RasterFallback("clipped_image")
+        if not contains(page_rect, bbox):
+            visible = bbox & page_rect
+            a, b, c, d = info["transform"][:4]
+            if visible.is_empty or b or c or a < 0 or d < 0:
+                raise RasterFallback("clipped_image")
+            crop = tuple(round(v * 100000) for v in ((visible.x0 - bbox.x0) / bbox.width, (visible.y0 - bbox.y0) / bbox.height,
+                                                     (bbox.x1 - visible.x1) / bbox.width, (bbox.y1 - visible.y1) / bbox.height))
+            bbox = visible
+        # transform birim kareyi sayfaya taşır; slayt matrisiyle birleşince eksene hizalı olmalıdır (dönüş 90'ın katı).
+        a, b, c, d, _, _ = pymupdf.Matrix(info["transform"]) * matrix
+        size = max(abs(a), abs(b), abs(c), abs(d))
+        if abs(b) < size * 1e-3 and abs(c) < size * 1e-3:
+            turns, flip_h, flip_v = 0, a < 0, d < 0
+        elif abs(a) < size * 1e-3 and abs(d) < size * 1e-3:
+            turns, flip_h, flip_v = 1, b < 0, c > 0
+        else:
+            raise RasterFallback("skewed_image")
+        shapes.append((seqno, {"kind": "picture", "box": rotated_box(bbox * matrix, turns), "rotation": turns * 90,
+                               "flip_h": flip_h, "flip_v": flip_v, "crop": crop, "xref": xref, "smask": smask}))
+    return shapes
+
+def covered_text(log):
+    # Metnin üzerine sonradan dolgu ya da görüntü çizilmişse (ör. beyaz kutuyla gizlenmiş metin) metin kutuları
+    # en üstte yazıldığı için görünür olurdu. Alt çizgi gibi ince dolgular metnin yarısını örtmez.
+    texts = []
+    for kind, bbox in log:
+        if kind in ("fill-text", "stroke-text"):
+            texts.append(bbox)
+        elif kind in ("fill-path", "fill-image") and texts:
+            x0, y0, x1, y1 = bbox
+            for tx0, ty0, tx1, ty1 in texts:
+                w = min(x1, tx1) - max(x0, tx0)
+                h = min(y1, ty1) - max(y0, ty0)
+                if w > 0 and h > 0 and w * h > 0.5 * (tx1 - tx0) * (ty1 - ty0):
+                    return True
+    return False
+
+def layout_page(page, slide_width, slide_height):
+    # Dönüş: (şekiller, None) ya da (None, rasterleştirme nedeni). Şekiller çizim sırasıyla (yollar ve resimler)
+    # ve en üstte metin kutularıyla döner; resimler bayt yerine (xref, smask) taşır, bkz. picture_blob.
+    pymupdf = load()
+    try:
+        log = page.get_bboxlog()
+        kinds = [kind for kind, _ in log]
+        if "fill-shade" in kinds:
+            raise RasterFallback("shading")
+        if "fill-imgmask" in kinds or "clip-imgmask" in kinds:
+            raise RasterFallback("image_mask")
+        if "stroke-text" in kinds or any(k.startswith("clip-") and k.endswith("text") for k in kinds):
+            raise RasterFallback("outlined_text")
+        if sum(1 for k in kinds if k in ("fill-path", "stroke-path")) > MAX_PATHS:
+            raise RasterFallback("vector_art")
+        if any(font[2] == "Type3" for font in page.get_fonts()):
+            raise RasterFallback("type3_font")
+        if page.first_widget is not None or any(a.type[1] != "Popup" for a in page.annots()):
+            raise RasterFallback("annotations")
+        if covered_text(log):
+            raise RasterFallback("covered_text")
+        matrix, scale = slide_matrix(page, slide_width, slide_height)
+        page_rect = page.rect * page.derotation_matrix
+        drawings, scissors = drawing_shapes(page, matrix, scale, page_rect)
+        pictures = image_shapes(page, matrix, page_rect, scissors,
+                                [n for n, kind in enumerate(kinds) if kind == "fill-image"])
+        counts = {"chars": 0, "unmapped": 0}
+        texts = []
+        flags = pymupdf.TEXT_PRESERVE_WHITESPACE | pymupdf.TEXT_MEDIABOX_CLIP
+        for block in page.get_text("dict", flags=flags)["blocks"]:
+            for line in block.get("lines", ()):
+                texts += line_shapes(line, matrix, scale, page.rotation, counts)
+        if counts["unmapped"] > max(3, 0.05 * counts["chars"]):
+            raise RasterFallback("unmapped_glyphs")
+    except RasterFallback as e:
+        return None, str(e)
+    return [shape for _, shape in sorted(drawings + pictures, key=lambda item: item[0])] + texts, None
+
+def picture_blob(document, xref, smask):
+    # PNG ve RGB/gri JPEG olduğu gibi gömülür; diğerleri (JPX, JBIG2, CCITT, CMYK, yumuşak maskeli) PNG'ye çevrilir.
+    pymupdf = load()
+    info = document.extract_image(xref)
+    if info["ext"] in ("png", "jpeg") and not smask and info.get("colorspace") in (1, 3):
+        return info["image"]
+    pixmap = pymupdf.Pixmap(document, xref)
+    if pixmap.alpha:
+        pixmap = pymupdf.Pixmap(pixmap, 0)
+    if pixmap.colorspace is None or pixmap.colorspace.n not in (1, 3):
+        pixmap = pymupdf.Pixmap(pymupdf.csRGB, pixmap)
+    if smask:
+        mask = pymupdf.Pixmap(document, smask)
+        if (mask.width, mask.height) != (pixmap.width, pixmap.height):
+            # Maske görüntüden farklı çözünürlükte olabilir; görüntü maskenin boyutuna ölçeklenir.
+            pixmap = pymupdf.Pixmap(pixmap, mask.width, mask.height, None)
+        pixmap = pymupdf.Pixmap(pixmap, mask)
+    return pixmap.tobytes("png")
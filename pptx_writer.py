@@ -0,0 +1,300 @@
+import io, re, zipfile, os, hashlib
+
+# python-pptx'in nesne modelini kurmadan yalnızca görüntü içeren PPTX yazar.
+# Boş şablonun parçaları bir kez hazırlanır, her slayt (XML, ilişkiler ve medya)
+# geldiği anda ZIP'e akıtılır; bellek ve süre slayt başına sabit kalır.
+
+SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+REL_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+REL_SLIDE_LAYOUT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+REL_IMAGE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+
+# Sonda yeniden yazılan parçalar; diğer şablon parçaları olduğu gibi kopyalanır.
+FINAL_PARTS = ("[Content_Types].xml", "ppt/presentation.xml", "ppt/_rels/presentation.xml.rels", "docProps/app.xml")
+
+NSDECLS = ('xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+           'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+           'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"')
+
+SLIDE_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<p:sld ' + NSDECLS + '>'
+    '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+    '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/><a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+)
+SLIDE_TAIL = '</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>'
+
+SLIDE_XML = (
+    SLIDE_HEAD +
+    '<p:pic><p:nvPicPr><p:cNvPr id="2" name="Picture 1"/><p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="rId2"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>' +
+    SLIDE_TAIL
+)
+
+SLIDE_RELS_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="' + REL_SLIDE_LAYOUT + '" Target={layout}/>'
+)
+IMAGE_REL_XML = '<Relationship Id="{rid}" Type="' + REL_IMAGE + '" Target={media}/>'
+
+SLIDE_RELS_XML = SLIDE_RELS_HEAD + IMAGE_REL_XML.replace("{rid}", "rId2") + '</Relationships>'
+
+# XML 1.0'da geçersiz karakterler (PDF metninde denetim karakterleri olabilir).
+INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+_skeleton = None
+
+def load_skeleton():
+    # python-pptx'in varsayılan şablonu bir kez kaydedilip süreç boyunca tekrar kullanılır.
+    global _skeleton
+    if _skeleton is None:
+        from pptx import Presentation
+        presentation = Presentation()
+        layout_partname = presentation.slide_layouts[6].part.partname
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        with zipfile.ZipFile(buffer) as package:
+            parts = {name: package.read(name) for name in package.namelist()}
+        _skeleton = {
+            "parts": parts,
+            "layout": "../slideLayouts/" + layout_partname.split("/")[-1],
+            "slide_width": presentation.slide_width,
+            "slide_height": presentation.slide_height
+        }
+    return _skeleton
+
+def image_info(blob):
+    # python-pptx yalnızca ilk slayt yazılırken yüklenir.
+    from pptx.parts.image import Image as PptxImage
+    return PptxImage.from_blob(blob)
+
+def fit_box(image_width, image_height, slide_width, slide_height):
+    ratio = image_width / image_height
+    if ratio > (slide_width / slide_height):
+        nw = slide_width
+        nh = slide_width / ratio
+    else:
+        nh = slide_height
+        nw = slide_height * ratio
+    return int((slide_width - nw) / 2), int((slide_height - nh) / 2), int(nw), int(nh)
+
+# Metin korumalı slaytların şekilleri (bkz. pdf_vector.layout_page). Konum ve boyutlar EMU, dönüş derecedir.
+# "text": box, rotation, runs (text, font, size [1/100 pt], bold, italic, color, alpha)
+# "picture": box, rotation, flip_h, flip_v, crop (l, t, r, b; 1/1000 yüzde), blob
+# "path": box, preset (dikdörtgen) ya da commands (kutuya göre M/L/C/Z), fill, line
+
+def color_xml(color, alpha):
+    if alpha is None:
+        return f'<a:srgbClr val="{color}"/>'
+    return f'<a:srgbClr val="{color}"><a:alpha val="{alpha}"/></a:srgbClr>'
+
+def xfrm_xml(shape):
+    left, top, width, height = shape["box"]
+    attributes = ""
+    if shape.get("rotation"):
+        attributes += f' rot="{shape["rotation"] * 60000}"'
+    if shape.get("flip_h"):
+        attributes += ' flipH="1"'
+    if shape.get("flip_v"):
+        attributes += ' flipV="1"'
+    return f'<a:xfrm{attributes}><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+
+def run_xml(run):
+    from xml.sax.saxutils import escape, quoteattr
+    typeface = quoteattr(run["font"])
+    return (f'<a:r><a:rPr sz="{run["size"]}"' + (' b="1"' if run["bold"] else '') + (' i="1"' if run["italic"] else '') +
+            f' dirty="0"><a:solidFill>{color_xml(run["color"], run["alpha"])}</a:solidFill>'
+            f'<a:latin typeface={typeface}/><a:cs typeface={typeface}/></a:rPr>'
+            f'<a:t>{escape(INVALID_XML.sub("", run["text"]))}</a:t></a:r>')
+
+def text_xml(shape_id, shape):
+    # Kaydırma ve otomatik sığdırma kapalı, iç boşluk sıfır: satır PDF'teki yerinde ve tek satır kalır.
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{xfrm_xml(shape)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+            '<p:txBody><a:bodyPr wrap="none" lIns="0" tIns="0" rIns="0" bIns="0" rtlCol="0" anchor="t"><a:noAutofit/></a:bodyPr>'
+            '<a:lstStyle/><a:p>' + "".join(run_xml(run) for run in shape["runs"]) + '</a:p></p:txBody></p:sp>')
+
+def picture_xml(shape_id, shape, rel_id):
+    crop = ""
+    if any(shape["crop"]):
+        crop = '<a:srcRect l="{}" t="{}" r="{}" b="{}"/>'.format(*shape["crop"])
+    return (f'<p:pic><p:nvPicPr><p:cNvPr id="{shape_id}" name="Picture {shape_id}"/><p:cNvPicPr><a:picLocks noChangeAspect="1"/>'
+            f'</p:cNvPicPr><p:nvPr/></p:nvPicPr><p:blipFill><a:blip r:embed="{rel_id}"/>{crop}<a:stretch><a:fillRect/></a:stretch>'
+            f'</p:blipFill><p:spPr>{xfrm_xml(shape)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>')
+
+def path_xml(shape_id, shape):
+    _, _, width, height = shape["box"]
+    if shape["preset"]:
+        geometry = '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    else:
+        commands = []
+        for command in shape["commands"]:
+            points = "".join(f'<a:pt x="{x}" y="{y}"/>' for x, y in command[1:])
+            if command[0] == "M":
+                commands.append(f"<a:moveTo>{points}</a:moveTo>")
+            elif command[0] == "L":
+                commands.append(f"<a:lnTo>{points}</a:lnTo>")
+            elif command[0] == "C":
+                commands.append(f"<a:cubicBezTo>{points}</a:cubicBezTo>")
+            else:
+                commands.append("<a:close/>")
+        geometry = ('<a:custGeom><a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/><a:rect l="l" t="t" r="r" b="b"/>'
+                    f'<a:pathLst><a:path w="{width}" h="{height}">' + "".join(commands) + '</a:path></a:pathLst></a:custGeom>')
+    fill = shape["fill"]
+    fill_xml = f'<a:solidFill>{color_xml(fill["color"], fill["alpha"])}</a:solidFill>' if fill else '<a:noFill/>'
+    line = shape["line"]
+    if line:
+        line_xml = (f'<a:ln w="{line["width"]}"><a:solidFill>{color_xml(line["color"], line["alpha"])}</a:solidFill>' +
+                    ('<a:prstDash val="dash"/>' if line["dashed"] else '') + '</a:ln>')
+    else:
+        line_xml = '<a:ln><a:noFill/></a:ln>'
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="Freeform {shape_id}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+            f'<p:spPr>{xfrm_xml(shape)}{geometry}{fill_xml}{line_xml}</p:spPr></p:sp>')
+
+def shapes_xml(shapes, rel_ids):
+    # rel_ids: resim şekillerinin sırasıyla ilişki kimlikleri.
+    parts = []
+    rel_ids = iter(rel_ids)
+    for shape_id, shape in enumerate(shapes, 2):
+        if shape["kind"] == "text":
+            parts.append(text_xml(shape_id, shape))
+        elif shape["kind"] == "picture":
+            parts.append(picture_xml(shape_id, shape, next(rel_ids)))
+        else:
+            parts.append(path_xml(shape_id, shape))
+    return "".join(parts)
+
+class PptxWriter:
+    def __init__(self, output_path):
+        self.skeleton = load_skeleton()
+        self.output_path = output_path
+        self.slide_width = self.skeleton["slide_width"]
+        self.slide_height = self.skeleton["slide_height"]
+        self.slide_count = 0
+        self.media_count = 0
+        self.media_types = {}
+        # Aynı bayt dizisine sahip görüntüler tek bir medya parçası olarak saklanır.
+        self.media_by_hash = {}
+        self.duplicate_media = 0
+        self.bytes_saved = 0
+        self.package = zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED)
+        for name, data in self.skeleton["parts"].items():
+            if name not in FINAL_PARTS:
+                self.package.writestr(name, data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def add_media(self, blob, image=None):
+        image = image or image_info(blob)
+        self.media_count += 1
+        name = f"image{self.media_count}.{image.ext}"
+        self.media_types[image.ext] = image.content_type
+        # PNG/JPEG zaten sıkıştırılmış; tekrar deflate etmek yalnızca zaman kaybı.
+        self.package.writestr(f"ppt/media/{name}", blob, compress_type=zipfile.ZIP_STORED)
+        return name
+
+    def add_image_slide(self, image_source):
+        # image_source: dosya yolu, bayt dizisi veya okunabilir akış. Dönen tanıtıcı repeat_slide ile
+        # aynı görüntüyü yeniden kodlamadan başka bir slaytta kullanmaya yarar.
+        if isinstance(image_source, (str, os.PathLike)):
+            with open(image_source, "rb") as f:
+                blob = f.read()
+        elif isinstance(image_source, (bytes, bytearray)):
+            blob = bytes(image_source)
+        else:
+            blob = image_source.read()
+        digest = hashlib.sha1(blob).digest()
+        if digest in self.media_by_hash:
+            handle = self.media_by_hash[digest]
+            self.duplicate_media += 1
+            self.bytes_saved += len(blob)
+        else:
+            image = image_info(blob)
+            handle = (self.add_media(blob, image), *image.size)
+            self.media_by_hash[digest] = handle
+        self.add_slide(*handle)
+        return handle
+
+    def repeat_slide(self, handle):
+        self.add_slide(*handle)
+
+    def add_vector_slide(self, shapes):
+        # Aynı görüntü (ör. her sayfadaki logo) destede tek medya parçasıdır; slayt başına bir ilişki yazılır.
+        from xml.sax.saxutils import quoteattr
+        rel_ids = []
+        rels = {}
+        for shape in shapes:
+            if shape["kind"] != "picture":
+                continue
+            digest = hashlib.sha1(shape["blob"]).digest()
+            if digest not in self.media_by_hash:
+                image = image_info(shape["blob"])
+                self.media_by_hash[digest] = (self.add_media(shape["blob"], image), *image.size)
+            media_name = self.media_by_hash[digest][0]
+            rels.setdefault(media_name, f"rId{len(rels) + 2}")
+            rel_ids.append(rels[media_name])
+        self.slide_count += 1
+        n = self.slide_count
+        self.package.writestr(f"ppt/slides/slide{n}.xml", SLIDE_HEAD + shapes_xml(shapes, rel_ids) + SLIDE_TAIL)
+        image_rels = "".join(IMAGE_REL_XML.format(rid=rid, media=quoteattr(f"../media/{name}")) for name, rid in rels.items())
+        self.package.writestr(f"ppt/slides/_rels/slide{n}.xml.rels",
+                              SLIDE_RELS_HEAD.format(layout=quoteattr(self.skeleton["layout"])) + image_rels + "</Relationships>")
+
+    def add_slide(self, media_name, image_width, image_height):
+        # xml.sax.saxutils urllib'i de yüklediği için açılışta değil ilk slaytta içe aktarılır.
+        from xml.sax.saxutils import quoteattr
+        left, top, width, height = fit_box(image_width, image_height, self.slide_width, self.slide_height)
+        self.slide_count += 1
+        n = self.slide_count
+        self.package.writestr(f"ppt/slides/slide{n}.xml",
+                              SLIDE_XML.format(left=left, top=top, width=width, height=height))
+        self.package.writestr(f"ppt/slides/_rels/slide{n}.xml.rels",
+                              SLIDE_RELS_XML.format(layout=quoteattr(self.skeleton["layout"]),
+                                                    media=quoteattr(f"../media/{media_name}")))
+
+    def close(self):
+        parts = self.skeleton["parts"]
+        rels = parts["ppt/_rels/presentation.xml.rels"].decode("utf-8")
+        next_rid = max(int(n) for n in re.findall(r'Id="rId(\d+)"', rels)) + 1
+        slide_rels = []
+        slide_ids = []
+        for n in range(1, self.slide_count + 1):
+            rid = f"rId{next_rid + n - 1}"
+            slide_rels.append(f'<Relationship Id="{rid}" Type="{REL_SLIDE}" Target="slides/slide{n}.xml"/>')
+            slide_ids.append(f'<p:sldId id="{255 + n}" r:id="{rid}"/>')
+        rels = rels.replace("</Relationships>", "".join(slide_rels) + "</Relationships>")
+        presentation_xml = parts["ppt/presentation.xml"].decode("utf-8")
+        if slide_ids:
+            presentation_xml = presentation_xml.replace(
+                "</p:sldMasterIdLst>", "</p:sldMasterIdLst><p:sldIdLst>" + "".join(slide_ids) + "</p:sldIdLst>", 1)
+        content_types = parts["[Content_Types].xml"].decode("utf-8")
+        extra_types = []
+        for ext, content_type in sorted(self.media_types.items()):
+            if f'Extension="{ext}"' not in content_types:
+                extra_types.append(f'<Default Extension="{ext}" ContentType="{content_type}"/>')
+        for n in range(1, self.slide_count + 1):
+            extra_types.append(f'<Override PartName="/ppt/slides/slide{n}.xml" ContentType="{SLIDE_CONTENT_TYPE}"/>')
+        content_types = content_types.replace("</Types>", "".join(extra_types) + "</Types>")
+        app_xml = re.sub(r"<Slides>\d+</Slides>", f"<Slides>{self.slide_count}</Slides>",
+                         parts["docProps/app.xml"].decode("utf-8"))
+        self.package.writestr("ppt/presentation.xml", presentation_xml)
+        self.package.writestr("ppt/_rels/presentation.xml.rels", rels)
+        self.package.writestr("docProps/app.xml", app_xml)
+        self.package.writestr("[Content_Types].xml", content_types)
+        self.package.close()
+
+    def abort(self):
+        self.package.close()
+        if os.path.exists(self.output_path):
+            os.remove(self.output_path)
@@ -0,0 +1,141 @@
+import os, time, mmap, queue, array, struct, tempfile, threading, collections
+
+# Dönüştürücülerden arayüze ilerleme kanalı. Dosya düzeyindeki olaylar ve arayüz çağrıları iş parçacığı güvenli
+# bir kuyruğa yazılır; arayüz kuyruğu kendi döngüsünde sabit aralıklarla boşaltır, böylece saniyede yüzlerce
+# olay gelse de pencere yalnızca kare başına bir kez güncellenir. Sayfa sayaçları ise her dosya için bir
+# (biten, toplam) çiftidir ve geçici bir dosyaya eşlenmiş bellekte tutulur: işçi süreçlere yalnızca dosya yolu
+# taşınır (bkz. CancelToken), her sayfa tek bir yazma ile bildirilir, okuyan taraf toplamları kare başına bir kez alır.
+
+SLOT = struct.Struct("<qq")
+
+class PageSlot:
+    # Bir dosyanın sayaç yuvası; süreçler arasında (yol, sıra) olarak taşınır. Eşleme ilk yazmada açılır ve
+    # dosya bitince close() ile kapatılır: Windows'ta açık bir eşleme, toplu iş sonunda dosyanın silinmesini engeller.
+    def __init__(self, path, index):
+        self.path = path
+        self.index = index
+        self.map = None
+
+    def __getstate__(self):
+        return {"path": self.path, "index": self.index, "map": None}
+
+    def update(self, done, total):
+        try:
+            if self.map is None:
+                with open(self.path, "r+b") as f:
+                    self.map = mmap.mmap(f.fileno(), 0)
+            SLOT.pack_into(self.map, self.index * SLOT.size, done, total)
+        except (OSError, ValueError):
+            # Toplu iş bitip dosya kaldırılmışsa ilerleme bildirimi atlanır.
+            pass
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+class PageCounters:
+    def __init__(self, slots):
+        fd, self.path = tempfile.mkstemp(prefix="converty-progress-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(bytes(SLOT.size * max(1, slots)))
+        self.slots = slots
+        with open(self.path, "r+b") as f:
+            self.map = mmap.mmap(f.fileno(), 0)
+
+    def slot(self, index):
+        return PageSlot(self.path, index)
+
+    def update(self, index, done, total):
+        SLOT.pack_into(self.map, index * SLOT.size, done, total)
+
+    def read_slot(self, index):
+        return SLOT.unpack_from(self.map, index * SLOT.size)
+
+    def read(self):
+        # Dönüş: (biten sayfalar, süren dosyalarda kalan sayfalar, süren dosya sayısı,
+        #         sayfa sayısı bilinen dosyaların toplamı ve sayısı).
+        values = array.array("q")
+        values.frombytes(self.map[:SLOT.size * self.slots])
+        dones, totals = values[0::2], values[1::2]
+        remaining = [t - d for d, t in zip(dones, totals) if t > d]
+        return sum(dones), sum(remaining), len(remaining), sum(totals), sum(1 for t in totals if t)
+
+    def close(self):
+        # Eşleme dosyadan önce kapatılır (Windows eşlenmiş dosyanın silinmesine izin vermez).
+        self.map.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+class ProgressChannel:
+    # post() herhangi bir iş parçacığından çağrılabilir; drain() ve snapshot() yalnızca arayüz döngüsünden.
+    def __init__(self, window=10.0):
+        self.events = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.counters = None
+        self.window = window
+        self.samples = collections.deque()
+        self.files = (0, 0)
+
+    def start(self, files):
+        # convert_files her toplu iş için çağırır; sayaçlar dosya sayısı kadar yuvayla yeniden açılır.
+        with self.lock:
+            if self.counters is not None:
+                self.counters.close()
+            self.counters = PageCounters(files)
+        self.post("batch", files=files)
+        return self.counters
+
+    def post(self, kind, **fields):
+        self.events.put((kind, fields))
+
+    def call(self, fn):
+        # Arayüz iş parçacığında çalıştırılacak fonksiyon (root.after'ın iş parçacığı güvenli karşılığı).
+        self.post("call", fn=fn)
+
+    def drain(self, limit=10000):
+        # Kuyruktaki olaylar sırasıyla döner; art arda gelen "file" olaylarından yalnızca sonuncusu kalır.
+        events = []
+        for _ in range(limit):
+            try:
+                kind, fields = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "batch":
+                self.samples.clear()
+                self.files = (0, fields["files"])
+            elif kind == "file":
+                self.files = (fields["completed"], fields["total"])
+                if events and events[-1][0] == "file":
+                    events[-1] = (kind, fields)
+                    continue
+            events.append((kind, fields))
+        return events
+
+    def snapshot(self, now=None):
+        # Sayfa/sn son "window" saniyedeki örneklerden hesaplanır. Henüz başlamamış dosyaların sayfa sayısı,
+        # sayfa sayısı bilinen dosyaların ortalaması kabul edilir.
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            if self.counters is None:
+                return None
+            done, remaining, running, known, counted = self.counters.read()
+        files_done, files_total = self.files
+        waiting = max(0, files_total - files_done - running)
+        total = done + remaining + (round(known / counted * waiting) if counted else 0)
+        self.samples.append((now, done))
+        while len(self.samples) > 2 and now - self.samples[0][0] > self.window:
+            self.samples.popleft()
+        first_time, first_done = self.samples[0]
+        rate = (done - first_done) / (now - first_time) if now > first_time else 0.0
+        eta = (total - done) / rate if rate > 0 and (counted or not waiting) else None
+        return {"pages_done": done, "pages_total": total, "files_done": files_done, "files_total": files_total,
+                "pages_per_second": rate, "eta_seconds": eta}
+
+    def close(self):
+        with self.lock:
+            if self.counters is not None:
+                self.counters.close()
+                self.counters = None
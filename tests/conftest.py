@@ -0,0 +1,59 @@
+import os, sys, uuid, random, shutil
+import pytest
+
+# Testler depo kökündeki modülleri doğrudan içe aktarır (paket kurulumu yok).
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import benchmark
+import pdf_to_pptx
+
+def _pymupdf_render(pdf_path, first_page=None, last_page=None, output_folder=None, paths_only=False, fmt="png",
+                    dpi=200, grayscale=False, jpegopt=None):
+    # pdftoppm'in yerine: aynı argümanlarla sayfaları output_folder içine sırayla yazar ve yolları döndürür.
+    import pymupdf
+    paths = []
+    with pymupdf.open(pdf_path) as document:
+        for number in range(first_page or 1, (last_page or document.page_count) + 1):
+            pixmap = document[number - 1].get_pixmap(dpi=dpi, colorspace=pymupdf.csGRAY if grayscale else pymupdf.csRGB)
+            path = os.path.join(output_folder, f"{uuid.uuid4()}-{number:04d}.{'jpg' if fmt == 'jpeg' else 'png'}")
+            if fmt == "jpeg":
+                pixmap.save(path, jpg_quality=(jpegopt or {}).get("quality", 85))
+            else:
+                pixmap.save(path)
+            paths.append(path)
+    return paths
+
+def _pymupdf_info(pdf_path, first_page=None, last_page=None):
+    import pymupdf
+    with pymupdf.open(pdf_path) as document:
+        info = {"Pages": document.page_count}
+        for number, page in enumerate(document, 1):
+            info[f"Page {number:4d} size"] = f"{page.rect.width} x {page.rect.height} pts"
+    return info
+
+@pytest.fixture
+def renderer(monkeypatch):
+    # Rasterleştirme gerçek pdftoppm ile yapılır; poppler kurulu değilse sayfalar PyMuPDF ile çizilir.
+    # İşçi süreçler yamayı yalnızca fork ile devralır, bu yüzden paralel testler "thread" havuzu kullanır.
+    if shutil.which("pdftoppm") and shutil.which("pdfinfo"):
+        return "pdftoppm"
+    pytest.importorskip("pymupdf")
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", _pymupdf_render)
+    monkeypatch.setattr(pdf_to_pptx, "pdfinfo_from_path", _pymupdf_info)
+    return "pymupdf"
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    # make_pdf("ad.pdf", kind="text", pages=3): benchmark derlemleriyle aynı üreteçle yazılmış gerçek bir PDF.
+    def make(name="input.pdf", kind="text", pages=3, seed=None, folder=None):
+        path = os.path.join(folder or tmp_path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        benchmark.write_pdf(path, benchmark.pdf_pages(kind, random.Random(seed or name), pages))
+        return path
+    return make
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    # Tercih, geçmiş ve önbellek dosyaları depoya değil testin klasörüne yazılır.
+    monkeypatch.chdir(tmp_path)
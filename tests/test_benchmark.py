@@ -0,0 +1,89 @@
+import os, json, random
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+import benchmark
+
+def test_generated_pdfs_are_valid_and_reproducible(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf")
+    pages = benchmark.pdf_pages("mixed", random.Random("seed"), 3)
+    first, second = str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")
+    benchmark.write_pdf(first, pages)
+    benchmark.write_pdf(second, benchmark.pdf_pages("mixed", random.Random("seed"), 3))
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+    with pymupdf.open(first) as document:
+        assert document.page_count == 3
+        assert not document.is_repaired
+        assert tuple(document[0].rect)[2:] == benchmark.LETTER
+        assert pages[0][2][0] in document[0].get_text()
+        # Tek sayfalarda fotoğraf vardır.
+        assert [len(page.get_images()) for page in document] == [0, 1, 0]
+
+def test_corpus_is_reused_until_its_signature_changes(tmp_path):
+    info = benchmark.generate_corpus(str(tmp_path), "text", quick=True)
+    kind, files, _, quick_count = benchmark.CORPORA["text"]
+    assert info["kind"] == kind and len(info["paths"]) == files and info["pages"] == files * quick_count
+    assert info["bytes"] == sum(os.path.getsize(p) for p in info["paths"])
+    stamps = [os.stat(p).st_mtime_ns for p in info["paths"]]
+    assert benchmark.generate_corpus(str(tmp_path), "text", quick=True) == info
+    assert [os.stat(p).st_mtime_ns for p in info["paths"]] == stamps
+    # Eksik dosya veya farklı boyut derlemi yeniden üretir.
+    os.remove(info["paths"][0])
+    assert os.path.exists(benchmark.generate_corpus(str(tmp_path), "text", quick=True)["paths"][0])
+    full = benchmark.generate_corpus(str(tmp_path), "text")
+    assert full["pages"] == files * benchmark.CORPORA["text"][2]
+
+def test_pptx_corpus_opens_in_python_pptx(tmp_path):
+    info = benchmark.generate_corpus(str(tmp_path), "pptx_large", quick=True)
+    slides = benchmark.CORPORA["pptx_large"][3]
+    for path in info["paths"]:
+        presentation = Presentation(path)
+        assert len(presentation.slides) == slides
+        assert all(any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slide.shapes) for slide in presentation.slides)
+
+def test_percentile_uses_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert benchmark.percentile(values, 50) == 3
+    assert benchmark.percentile(values, 95) == 5
+    assert benchmark.percentile(values, 0) == 1
+    assert benchmark.percentile([], 50) is None
+
+def case(name, **fields):
+    return dict({"name": name, "pages_per_second": 10.0, "peak_rss_mb": 100.0, "output_bytes": 1000,
+                 "failed": 0}, **fields)
+
+def test_compare_flags_only_changes_beyond_the_threshold():
+    old = {"cases": [case("a"), case("b"), case("c"), case("startup/import", heavy_modules=[]),
+                     case("gone", error="boom")]}
+    new = {"cases": [case("a", pages_per_second=9.5, peak_rss_mb=105.0),
+                     case("b", pages_per_second=8.0, output_bytes=1200),
+                     case("c", failed=1),
+                     case("startup/import", heavy_modules=["pptx"]),
+                     case("gone"), case("added")]}
+    rows = benchmark.compare_reports(old, new, threshold=0.10)
+    regressions = {(row["case"], row["metric"]) for row in rows if row["regression"]}
+    assert regressions == {("b", "pages_per_second"), ("b", "output_bytes"), ("c", "failed"),
+                           ("startup/import", "heavy_modules")}
+    # Yeni veya eskiden hatalı durumlar karşılaştırılmaz.
+    assert not {row["case"] for row in rows} & {"gone", "added"}
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    old, new = str(tmp_path / "old.json"), str(tmp_path / "new.json")
+    with open(old, "w", encoding="utf-8") as f:
+        json.dump({"cases": [case("a")]}, f)
+    with open(new, "w", encoding="utf-8") as f:
+        json.dump({"cases": [case("a", pages_per_second=12.0)]}, f)
+    assert benchmark.main(["compare", old, new]) == 0
+    assert benchmark.main(["compare", new, old]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+def test_run_reports_startup_cases(tmp_path):
+    output = str(tmp_path / "report.json")
+    report = benchmark.run_benchmark(output, str(tmp_path / "corpus"), quick=True, jobs_values=[1],
+                                     patterns=["startup/import"], log=lambda message: None)
+    with open(output, encoding="utf-8") as f:
+        assert json.load(f) == report
+    [entry] = report["cases"]
+    assert entry["name"] == "startup/import" and entry["startup_seconds"] > 0
@@ -0,0 +1,83 @@
+import os, json, signal
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+import pdf_to_pptx
+
+@pytest.fixture
+def cli(capsys):
+    # cli_main Ctrl+C işleyicisini kurar; test bitince pytest'in işleyicisi geri konur.
+    handler = signal.getsignal(signal.SIGINT)
+    def run(*argv):
+        try:
+            code = pdf_to_pptx.cli_main(list(argv))
+        finally:
+            signal.signal(signal.SIGINT, handler)
+        return code, json.loads(capsys.readouterr().out)
+    return run
+
+def test_convert_files_round_trip_opens_in_python_pptx(renderer, make_pdf, tmp_path):
+    pdf = make_pdf("report.pdf", pages=3)
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", [pdf], str(tmp_path / "out"), {"jobs": 1})
+    assert batch["succeeded"] == 1 and batch["failed"] == 0
+    output = batch["results"][0]["output"]
+    assert output == str(tmp_path / "out" / "report.pptx")
+    presentation = Presentation(output)
+    assert len(presentation.slides) == 3
+    for slide in presentation.slides:
+        pictures = [shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+        assert len(pictures) == 1
+        # Sayfa slayta sığdırılır ve ortalanır.
+        assert pictures[0].left + pictures[0].width <= presentation.slide_width
+        assert pictures[0].top + pictures[0].height <= presentation.slide_height
+    # İş bitince iş kaydı kaldırılır.
+    assert batch["manifest"] is None
+    assert not os.path.exists(pdf_to_pptx.default_manifest_path(str(tmp_path / "out")))
+
+def test_output_names_do_not_collide(renderer, make_pdf, tmp_path):
+    first = make_pdf("a/deck.pdf", pages=1)
+    second = make_pdf("b/deck.pdf", pages=1)
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", [first, second], str(tmp_path / "out"), {"jobs": 1})
+    assert sorted(os.listdir(tmp_path / "out")) == ["deck (2).pptx", "deck.pptx"]
+    assert batch["succeeded"] == 2
+
+def test_missing_input_is_reported_not_raised(renderer, make_pdf, tmp_path):
+    pdf = make_pdf(pages=1)
+    missing = str(tmp_path / "missing.pdf")
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", [pdf, missing], str(tmp_path / "out"), {"jobs": 1})
+    assert [r["status"] for r in batch["results"]] == ["done", "failed"]
+    assert batch["results"][1]["error"]
+    # Başarısız dosya kaldığı için iş kaydı sürdürülebilmek üzere yerinde kalır.
+    assert batch["manifest"] is not None
+
+def test_cli_converts_folder_headless(cli, renderer, make_pdf, tmp_path):
+    make_pdf("in/one.pdf", pages=2)
+    make_pdf("in/two.pdf", pages=1)
+    code, batch = cli("pdf_to_pptx", str(tmp_path / "in"), "-o", str(tmp_path / "out"), "-q", "--no-history")
+    assert code == 0
+    assert batch["succeeded"] == 2
+    assert sorted(os.listdir(tmp_path / "out")) == ["one.pptx", "two.pptx"]
+    assert not os.path.exists(tmp_path / pdf_to_pptx.HISTORY_DB)
+
+def test_cli_exit_code_reports_failures(cli, renderer, tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    code, batch = cli("pdf_to_pptx", str(broken), "-o", str(tmp_path / "out"), "-q", "--no-history")
+    assert code == 1
+    assert batch["failed"] == 1
+
+def test_cli_zip_collects_outputs(cli, renderer, make_pdf, tmp_path):
+    import zipfile
+    make_pdf("in/one.pdf", pages=1)
+    make_pdf("in/two.pdf", pages=1)
+    code, batch = cli("pdf_to_pptx", str(tmp_path / "in"), "-o", str(tmp_path / "out"), "--zip", "-q", "--no-history")
+    assert code == 0
+    with zipfile.ZipFile(batch["zip"]) as archive:
+        assert sorted(archive.namelist()) == ["one.pptx", "two.pptx"]
+    # Arşive alınan desteler diskte ayrıca kalmaz.
+    assert sorted(os.listdir(tmp_path / "out")) == [os.path.basename(batch["zip"])]
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        pdf_to_pptx.conversion_options({"profile": "poster"})
@@ -0,0 +1,80 @@
+import os, json, time, signal
+from pptx import Presentation
+
+import pdf_to_pptx
+from conversion_cache import ConversionCache
+
+OPTIONS = pdf_to_pptx.conversion_options()
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+def test_keys_follow_content_and_output_options(tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"))
+    a = write(tmp_path / "a.pdf", b"same bytes")
+    b = write(tmp_path / "b.pdf", b"same bytes")
+    c = write(tmp_path / "c.pdf", b"other bytes")
+    key_a, key_b, key_c, missing = cache.keys("pdf_to_pptx", [a, b, c, str(tmp_path / "none.pdf")], OPTIONS)
+    # Ad değil içerik önemlidir; okunamayan dosyanın anahtarı yoktur.
+    assert key_a == key_b != key_c and missing is None
+    assert cache.keys("pdf_to_pptx", [a], dict(OPTIONS, jobs=8, page_window=2)) == [key_a]
+    assert cache.keys("pdf_to_pptx", [a], dict(OPTIONS, dpi=300)) != [key_a]
+
+def test_store_and_fetch_copies_output_and_result(tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"))
+    output = write(tmp_path / "deck.pptx", b"x" * 1000)
+    cache.store("k1", output, {"input": "in.pdf", "output": output, "status": "done", "pages": 4})
+    # Boyut, çıktı ile yanındaki sonuç dosyasının toplamıdır.
+    sidecar = os.path.getsize(tmp_path / "cache" / "k1.pptx.json")
+    assert cache.total_bytes() == 1000 + sidecar
+    assert ConversionCache(str(tmp_path / "cache")).total_bytes() == 1000 + sidecar
+    copy = str(tmp_path / "copy.pptx")
+    assert cache.fetch("k1", copy) == {"status": "done", "pages": 4, "cached": True}
+    with open(copy, "rb") as f:
+        assert f.read() == b"x" * 1000
+    assert cache.fetch("k2", copy) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"), max_bytes=2500)
+    outputs = [write(tmp_path / f"{n}.pptx", bytes(1000)) for n in range(3)]
+    cache.store("first", outputs[0], {})
+    cache.store("second", outputs[1], {})
+    # İlk kayıt kullanılınca en eski kayıt ikincisi olur.
+    past = time.time() - 60
+    os.utime(tmp_path / "cache" / "second.pptx", (past, past))
+    cache.entries["second.pptx"] = (past, cache.entries["second.pptx"][1])
+    cache.fetch("first", str(tmp_path / "copy.pptx"))
+    cache.store("third", outputs[2], {})
+    assert sorted(cache.entries) == ["first.pptx", "third.pptx"]
+    assert sorted(os.listdir(tmp_path / "cache")) == ["first.pptx", "first.pptx.json", "third.pptx", "third.pptx.json"]
+    assert cache.evictions == 1
+    assert cache.total_bytes() <= 2500
+
+def test_purge_empties_the_cache(tmp_path):
+    cache = ConversionCache(str(tmp_path / "cache"))
+    cache.store("k", write(tmp_path / "deck.pptx", b"deck"), {})
+    assert cache.purge() == 1
+    assert os.listdir(tmp_path / "cache") == [] and cache.total_bytes() == 0
+
+def test_cli_uses_cache_only_when_asked(renderer, make_pdf, tmp_path, capsys):
+    pdf = make_pdf("in/report.pdf", pages=2)
+    cache_dir = str(tmp_path / "cache")
+    handler = signal.getsignal(signal.SIGINT)
+    def run(*extra):
+        try:
+            assert pdf_to_pptx.cli_main(["pdf_to_pptx", pdf, "-o", str(tmp_path / "out"), "-q", "--no-history",
+                                         "--cache-dir", cache_dir, *extra]) == 0
+        finally:
+            signal.signal(signal.SIGINT, handler)
+        return json.loads(capsys.readouterr().out)
+    assert run()["cache"] is None
+    assert not os.path.exists(cache_dir)
+    first = run("--cache")
+    assert first["cache"]["misses"] == 1 and first["cache"]["entries"] == 1
+    second = run("--cache")
+    assert second["cache"]["hits"] == 1
+    assert second["results"][0]["cached"] is True
+    assert len(Presentation(second["results"][0]["output"]).slides) == 2
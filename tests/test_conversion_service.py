@@ -0,0 +1,167 @@
+import os, io, sys, json, signal, threading, subprocess
+import pytest
+from pptx import Presentation
+
+import conversion_service
+import pdf_to_pptx
+from conversion_service import ConversionService, TOKEN_HEADER
+from job_manifest import CancelToken
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOKEN = "test-token"
+
+def converting(job, progress):
+    # Servis komutundaki gibi: dosyalar convert_files ile, iş parçacığı havuzunda dönüştürülür.
+    inputs = pdf_to_pptx.collect_input_files(job.inputs, ".pdf")
+    options = dict(job.options, jobs=1, cancel=job.cancel, manifest=False)
+    return pdf_to_pptx.convert_files(job.conversion, inputs, job.output_folder, options, job.zip, progress)
+
+@pytest.fixture
+def serve(tmp_path):
+    # serve(run_job, **servis seçenekleri) -> (adres, servis); sunucu test bitince kapatılır.
+    started = []
+    def start(run_job=converting, **kwargs):
+        kwargs.setdefault("input_roots", [str(tmp_path / "in")])
+        kwargs.setdefault("output_root", str(tmp_path / "out"))
+        service = ConversionService(run_job, str(tmp_path / "spool"), make_cancel=CancelToken, **kwargs)
+        server = conversion_service.create_server(service, port=0, token=TOKEN)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.1}, daemon=True)
+        thread.start()
+        started.append((server, service))
+        return f"http://127.0.0.1:{server.server_address[1]}", service
+    yield start
+    for server, service in started:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+def request(address, method, path, body=None, headers=None):
+    # Dönüş: (durum, gövde); JSON yanıtlar çözülür.
+    connection = conversion_service.connect(address, timeout=60)
+    try:
+        headers = dict(headers or {})
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+            headers.setdefault("Content-Type", "application/json")
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        data = response.read()
+    finally:
+        connection.close()
+    if response.getheader("Content-Type", "").startswith("application/json"):
+        data = json.loads(data)
+    return response.status, data
+
+def events(address, job_id):
+    status, data = request(address, "GET", f"/jobs/{job_id}/events")
+    assert status == 200
+    return [json.loads(line[6:]) for line in data.decode().splitlines() if line.startswith("data: ")]
+
+def test_path_job_round_trip(renderer, make_pdf, serve, tmp_path):
+    pdf = make_pdf("in/report.pdf", pages=2)
+    address, _ = serve()
+    status, job = request(address, "POST", "/jobs", {"conversion": "pdf_to_pptx", "inputs": [pdf], "output": "decks"})
+    assert status == 202 and job["state"] == "queued"
+    kinds = [event["event"] for event in events(address, job["id"])]
+    assert kinds[:2] == ["queued", "started"] and kinds[-1] == "done" and "progress" in kinds
+    status, job = request(address, "GET", f"/jobs/{job['id']}")
+    assert job["state"] == "done" and job["succeeded"] == 1
+    assert job["results"][0]["output"] == str(tmp_path / "out" / "decks" / "report.pptx")
+    status, deck = request(address, "GET", f"/jobs/{job['id']}/result")
+    assert status == 200 and len(Presentation(io.BytesIO(deck)).slides) == 2
+
+def test_upload_round_trip_needs_the_token(renderer, make_pdf, serve):
+    with open(make_pdf("upload.pdf", pages=1), "rb") as f:
+        data = f.read()
+    address, service = serve(input_roots=())
+    query = "/jobs?conversion=pdf_to_pptx&filename=../../etc/deck.pdf"
+    for headers in ({}, {TOKEN_HEADER: "wrong"}):
+        assert request(address, "POST", query, data, headers)[0] == 401
+    status, job = request(address, "POST", query, data, {TOKEN_HEADER: TOKEN})
+    assert status == 202
+    # Dosya adındaki klasörler atılır; yükleme işe ait klasöre yazılır.
+    assert os.path.basename(job["output_folder"]) == "output"
+    assert events(address, job["id"])[-1]["event"] == "done"
+    status, deck = request(address, "GET", f"/jobs/{job['id']}/result")
+    assert status == 200 and len(Presentation(io.BytesIO(deck)).slides) == 1
+    spool = service.get(job["id"]).spool
+    assert request(address, "DELETE", f"/jobs/{job['id']}") == (200, {"id": job["id"], "deleted": True})
+    assert not os.path.exists(spool)
+    assert request(address, "GET", f"/jobs/{job['id']}")[0] == 404
+
+def test_rejected_requests(make_pdf, serve, tmp_path):
+    pdf = make_pdf("in/a.pdf", pages=1)
+    outside = make_pdf("elsewhere/b.pdf", pages=1)
+    os.symlink(outside, str(tmp_path / "in" / "link.pdf"))
+    address, service = serve()
+    def post(body, headers=None):
+        return request(address, "POST", "/jobs", body, headers)[0]
+    job = {"conversion": "pdf_to_pptx", "inputs": [pdf]}
+    assert request(address, "GET", "/status", headers={"Host": "attacker.example:8765"})[0] == 403
+    assert post(job, {"Origin": "http://attacker.example"}) == 403
+    assert post(dict(job, inputs=[outside])) == 403
+    assert post(dict(job, inputs=[str(tmp_path / "in" / "link.pdf")])) == 403
+    assert post(dict(job, inputs=["in/a.pdf"])) == 403
+    assert post(dict(job, output=str(tmp_path / "anywhere"))) == 400
+    assert post(dict(job, output="../../anywhere")) == 403
+    assert post(dict(job, options=["dpi"])) == 400
+    assert post(["pdf_to_pptx"]) == 400
+    assert post({"conversion": "pdf_to_pptx"}) == 400
+    assert post(b"{not json", {"Content-Type": "application/json"}) == 400
+    assert request(address, "GET", "/nowhere")[0] == 404
+    assert request(address, "GET", "/jobs/000000-none")[0] == 404
+    # Yerel kaynaklı tarayıcı istekleri kabul edilir.
+    assert request(address, "GET", "/status", headers={"Origin": "http://localhost:8765"})[0] == 200
+    assert service.status()["submitted"] == 0
+
+def test_paths_are_refused_without_input_roots(make_pdf, serve):
+    address, _ = serve(input_roots=())
+    status, body = request(address, "POST", "/jobs", {"conversion": "pdf_to_pptx", "inputs": [make_pdf()]})
+    assert status == 403 and "only accepts uploads" in body["error"]
+
+def test_priority_cancel_and_results_of_unfinished_jobs(make_pdf, serve):
+    release = threading.Event()
+    order = []
+    def blocking(job, progress):
+        order.append(job.priority)
+        release.wait(10)
+        return {"succeeded": 0, "failed": 0, "cancelled": 0, "seconds": 0.0, "results": [], "zip": None}
+    address, _ = serve(blocking)
+    body = {"conversion": "pdf_to_pptx", "inputs": [make_pdf("in/a.pdf", pages=1)]}
+    first = request(address, "POST", "/jobs", body)[1]
+    low = request(address, "POST", "/jobs", dict(body, priority=1))[1]
+    high = request(address, "POST", "/jobs", dict(body, priority=5))[1]
+    dropped = request(address, "POST", "/jobs", dict(body, priority=9))[1]
+    assert request(address, "GET", f"/jobs/{first['id']}/result")[0] == 409
+    status, cancelled = request(address, "POST", f"/jobs/{dropped['id']}/cancel")
+    assert status == 202 and cancelled["state"] == "cancelled"
+    release.set()
+    for job in (first, low, high):
+        assert events(address, job["id"])[-1]["event"] == "done"
+    # Kuyruktakiler önceliğe göre, iptal edilen hiç çalışmadan.
+    assert order == [0, 5, 1]
+
+def test_serve_command_prints_its_settings_and_stops_on_interrupt(tmp_path, make_pdf):
+    make_pdf("in/a.pdf", pages=1)
+    command = [sys.executable, os.path.join(ROOT, "pdf_to_pptx.py"), "serve", "--port", "0", "-j", "1",
+               "--office-instances", "0", "--input-root", str(tmp_path / "in"), "--spool", str(tmp_path / "spool"),
+               "--token", TOKEN, "--no-history", "-q"]
+    process = subprocess.Popen(command, cwd=str(tmp_path), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    try:
+        listening = json.loads(process.stdout.readline())
+        assert listening["token"] == TOKEN
+        assert listening["input_roots"] == [os.path.realpath(str(tmp_path / "in"))]
+        address = listening["listening"]
+        job = {"conversion": "pdf_to_pptx", "inputs": [str(tmp_path / "in" / "a.pdf")]}
+        status, body = request(address, "POST", "/jobs", dict(job, options={"jobs": 64}))
+        assert status == 400 and "Unsupported options: jobs" in body["error"]
+        assert request(address, "POST", "/jobs", dict(job, conversion="pdf_to_docx"))[0] == 400
+        assert request(address, "POST", "/jobs", dict(job, inputs=[str(tmp_path / "in" / "*.pptx")]))[0] == 400
+        process.send_signal(signal.SIGINT)
+        output, _ = process.communicate(timeout=60)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.communicate()
+    assert process.returncode == 0
+    assert json.loads(output)["submitted"] == 0
@@ -0,0 +1,50 @@
+import random, zipfile
+from pptx import Presentation
+
+import benchmark
+import pdf_to_pptx
+
+def repeated_pdf(path, seed="cover", copies=3, extra=1):
+    # copies adet aynı sayfa ve ardından extra adet farklı sayfa.
+    rng = random.Random(seed)
+    page = (*benchmark.LETTER, benchmark._text_lines(rng, 10), None)
+    others = benchmark.pdf_pages("text", random.Random(str(path)), extra)
+    benchmark.write_pdf(str(path), [page] * copies + others)
+    return str(path)
+
+def media_parts(path):
+    with zipfile.ZipFile(path) as package:
+        return [n for n in package.namelist() if n.startswith("ppt/media/")]
+
+def test_identical_pages_share_one_image(renderer, tmp_path):
+    pdf = repeated_pdf(tmp_path / "in.pdf", copies=3, extra=1)
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {})
+    assert stats["duplicate_pages"] == 2
+    assert stats["bytes_saved"] > 0
+    assert len(media_parts(output)) == 2
+    assert len(Presentation(output).slides) == 4
+
+def test_python_pptx_writer_also_shares_images(renderer, tmp_path):
+    pdf = repeated_pdf(tmp_path / "in.pdf", copies=3, extra=0)
+    output = str(tmp_path / "out.pptx")
+    pdf_to_pptx.convert_pdf(pdf, output, {"writer": "python-pptx"})
+    assert len(media_parts(output)) == 1
+    assert len(Presentation(output).slides) == 3
+
+def test_dedupe_can_be_turned_off(renderer, tmp_path):
+    pdf = repeated_pdf(tmp_path / "in.pdf", copies=3, extra=0)
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"dedupe": False})
+    assert stats["duplicate_pages"] == 0
+    # Direct yazıcı aynı baytları yine tek parça olarak saklar, ama her sayfa ayrıca okunup kodlanır.
+    assert stats["encodings"] == {"png": 3}
+
+def test_pages_repeated_across_decks_are_encoded_once(renderer, tmp_path):
+    # "auto" biçimde kodlanan görüntü toplu iş boyunca paylaşılır; ikinci destede aynı kapak yeniden kodlanmaz.
+    # Dosyalar sırayla dönüştürülür, böylece ikinci deste birincinin kodladığı görüntüyü bulur.
+    pdfs = [repeated_pdf(tmp_path / f"{name}.pdf", copies=1, extra=1) for name in ("a", "b")]
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", pdfs, str(tmp_path / "out"),
+                                      {"jobs": 1, "profile": "auto"})
+    assert batch["succeeded"] == 2
+    assert batch["encodes_saved"] == 1
@@ -0,0 +1,48 @@
+import io, zipfile
+import pytest
+from PIL import Image
+
+import pdf_to_pptx
+
+@pytest.fixture
+def rendered(renderer, monkeypatch):
+    # Renderer'ın diske yazdığı baytlar, dönüştürücü okuyup silmeden önce alınır.
+    blobs = []
+    render = pdf_to_pptx.convert_from_path
+    def recording(*args, **kwargs):
+        paths = render(*args, **kwargs)
+        for path in paths:
+            with open(path, "rb") as f:
+                blobs.append(f.read())
+        return paths
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", recording)
+    return blobs
+
+def deck_media(path):
+    with zipfile.ZipFile(path) as package:
+        return {name: package.read(name) for name in package.namelist() if name.startswith("ppt/media/")}
+
+@pytest.mark.parametrize("image_format, extension", [("png", ".png"), ("jpeg", ".jpg")])
+def test_rendered_pages_are_embedded_without_reencoding(rendered, make_pdf, tmp_path, image_format, extension):
+    pdf = make_pdf(kind="mixed", pages=3)
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"image_format": image_format, "dedupe": False})
+    media = deck_media(output)
+    assert sorted(media.values()) == sorted(rendered)
+    assert all(name.endswith(extension) for name in media)
+    assert stats["encodings"] == {image_format: 3}
+
+def test_python_pptx_writer_embeds_the_same_bytes(rendered, make_pdf, tmp_path):
+    pdf = make_pdf(pages=2)
+    output = str(tmp_path / "out.pptx")
+    pdf_to_pptx.convert_pdf(pdf, output, {"writer": "python-pptx", "dedupe": False})
+    assert sorted(deck_media(output).values()) == sorted(rendered)
+
+def test_auto_format_keeps_rendered_png_when_quantizing_does_not_help():
+    # Tek renkli küçük bir sayfa: paletli PNG daha küçük olmadığı için pdftoppm çıktısı aynen kullanılır.
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), "white").save(buffer, "PNG")
+    options = pdf_to_pptx.conversion_options({"image_format": "auto"})
+    blob, encoding = pdf_to_pptx.encode_page(buffer.getvalue(), options)
+    assert encoding == "png"
+    assert len(blob) <= len(buffer.getvalue())
@@ -0,0 +1,108 @@
+import os, random, zipfile
+import pytest
+
+import benchmark
+import pdf_fingerprint
+import pdf_to_pptx
+
+def write_deck(path, edited=(), count=4):
+    # Aynı tohumla aynı sayfalar; "edited" içindeki sayfaların (1'den başlar) ilk satırı değiştirilir.
+    pages = benchmark.pdf_pages("mixed", random.Random("deck"), count)
+    for number in edited:
+        width, height, lines, image = pages[number - 1]
+        pages[number - 1] = (width, height, ["Edited " + lines[0]] + lines[1:], image)
+    benchmark.write_pdf(str(path), pages)
+    return str(path)
+
+def test_fingerprints_survive_object_renumbering(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf")
+    original = write_deck(tmp_path / "a.pdf")
+    rewritten = str(tmp_path / "b.pdf")
+    with pymupdf.open(original) as document:
+        # Nesneler yeniden numaralanır ve nesne akışlarına sıkıştırılır.
+        document.save(rewritten, garbage=4, use_objstms=1)
+    assert pdf_fingerprint.page_fingerprints(rewritten) == pdf_fingerprint.page_fingerprints(original)
+    assert pdf_fingerprint.page_count(rewritten) == 4
+
+def test_only_the_edited_page_changes(tmp_path):
+    before = pdf_fingerprint.page_fingerprints(write_deck(tmp_path / "a.pdf"))
+    after = pdf_fingerprint.page_fingerprints(write_deck(tmp_path / "b.pdf", edited=[2]))
+    assert len(set(before)) == 4
+    assert [a == b for a, b in zip(before, after)] == [True, False, True, True]
+
+def test_layer_visibility_changes_every_page(tmp_path):
+    pymupdf = pytest.importorskip("pymupdf")
+    original = write_deck(tmp_path / "a.pdf")
+    layered = str(tmp_path / "b.pdf")
+    with pymupdf.open(original) as document:
+        document.add_ocg("Notes", on=False)
+        document.save(layered)
+    before, after = pdf_fingerprint.page_fingerprints(original), pdf_fingerprint.page_fingerprints(layered)
+    assert not set(before) & set(after)
+
+def test_unreadable_files_raise_value_error(tmp_path):
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    garbage = tmp_path / "garbage.pdf"
+    garbage.write_bytes(b"%PDF-1.4\nnot really a pdf\n")
+    for path in (empty, garbage):
+        with pytest.raises(ValueError):
+            pdf_fingerprint.page_fingerprints(str(path))
+
+@pytest.fixture
+def rendered_pages(renderer, monkeypatch):
+    # Rasterleştirilen sayfa numaraları
+    numbers = []
+    render = pdf_to_pptx.convert_from_path
+    def counting(pdf_path, first_page=None, last_page=None, **kwargs):
+        paths = render(pdf_path, first_page=first_page, last_page=last_page, **kwargs)
+        numbers.extend(range(first_page, first_page + len(paths)))
+        return paths
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", counting)
+    return numbers
+
+def slide_media(path):
+    with zipfile.ZipFile(path) as package:
+        return [package.read(name) for name in pdf_to_pptx.deck_media(path)]
+
+def test_incremental_run_renders_only_changed_pages(rendered_pages, tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    options = {"incremental": True}
+    first = pdf_to_pptx.convert_pdf(write_deck(tmp_path / "deck.pdf"), output, options)
+    assert first["reused_pages"] == 0 and rendered_pages == [1, 2, 3, 4]
+    assert os.path.exists(pdf_to_pptx.page_index_path(output))
+    before = slide_media(output)
+
+    del rendered_pages[:]
+    second = pdf_to_pptx.convert_pdf(write_deck(tmp_path / "deck.pdf", edited=[3]), output, options)
+    assert second["reused_pages"] == 3 and rendered_pages == [3]
+    after = slide_media(output)
+    assert [a == b for a, b in zip(before, after)] == [True, True, False, True]
+    assert not os.path.exists(output + ".partial")
+
+    # Hiçbir sayfa değişmediyse rasterleştirme çalışmaz, sayfa sayısı yine bilinir.
+    del rendered_pages[:]
+    third = pdf_to_pptx.convert_pdf(str(tmp_path / "deck.pdf"), output, options)
+    assert third["reused_pages"] == 4 and third["page_total"] == 4 and rendered_pages == []
+    assert slide_media(output) == after
+
+def test_changed_options_or_edited_deck_convert_everything(rendered_pages, tmp_path):
+    pdf = write_deck(tmp_path / "deck.pdf")
+    output = str(tmp_path / "deck.pptx")
+    pdf_to_pptx.convert_pdf(pdf, output, {"incremental": True})
+    del rendered_pages[:]
+    assert pdf_to_pptx.convert_pdf(pdf, output, {"incremental": True, "dpi": 100})["reused_pages"] == 0
+    assert rendered_pages == [1, 2, 3, 4]
+    # Deste elle düzenlenmişse kayıt geçersizdir.
+    with open(output, "ab") as f:
+        f.write(b"\0")
+    del rendered_pages[:]
+    assert pdf_to_pptx.convert_pdf(pdf, output, {"incremental": True, "dpi": 100})["reused_pages"] == 0
+    assert rendered_pages == [1, 2, 3, 4]
+
+def test_page_count_reads_only_the_page_tree_root(tmp_path, monkeypatch):
+    pdf = write_deck(tmp_path / "a.pdf")
+    def no_parse(data):
+        raise AssertionError("the whole file must not be parsed")
+    monkeypatch.setattr(pdf_fingerprint, "PdfDocument", no_parse)
+    assert pdf_fingerprint.page_count(pdf) == 4
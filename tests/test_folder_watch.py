@@ -0,0 +1,147 @@
+import os, time, threading
+import pytest
+
+import folder_watch
+from folder_watch import HotFolder
+
+def write(path, data=b"%PDF-1.4 test"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+def converting(seen):
+    def convert(paths):
+        seen.extend(paths)
+        return [{"status": "done"} for _ in paths]
+    return convert
+
+@pytest.mark.parametrize("polling", [True, pytest.param(False, marks=pytest.mark.skipif(
+    not folder_watch.inotify_available(), reason="inotify yok"))])
+def test_finished_files_are_converted_once(tmp_path, polling):
+    watched = str(tmp_path / "in")
+    os.makedirs(watched)
+    seen = []
+    watcher = HotFolder([watched], (".pdf",), converting(seen), recursive=True, settle=0.2, polling=polling,
+                        poll_interval=0.1)
+    watcher.start()
+    try:
+        pdf = write(os.path.join(watched, "sub", "a.pdf"))
+        write(os.path.join(watched, "notes.txt"))
+        write(os.path.join(watched, ".hidden.pdf"))
+        write(os.path.join(watched, "~$lock.pdf"))
+        assert wait_for(lambda: watcher.stats()["converted"] == 1)
+        time.sleep(0.5)
+        stats = watcher.stats()
+    finally:
+        watcher.stop()
+    assert seen == [pdf]
+    assert stats["detected"] == 1 and stats["batches"] == 1
+    assert stats["source"] == ("polling" if polling else "inotify")
+    assert stats["mean_latency_seconds"] is not None
+
+def test_file_is_held_until_it_stops_changing(tmp_path):
+    pdf = write(str(tmp_path / "a.pdf"))
+    watcher = HotFolder([str(tmp_path)], (".pdf",), converting([]), settle=0.3)
+    watcher.touch(pdf)
+    watcher.check_candidates()
+    # İlk bakışta imza kaydedilir; dosya henüz kuyruğa girmez.
+    assert watcher.queue.empty() and pdf in watcher.candidates
+    with open(pdf, "ab") as f:
+        f.write(b" more")
+    time.sleep(0.35)
+    watcher.check_candidates()
+    assert watcher.queue.empty()
+    time.sleep(0.35)
+    watcher.check_candidates()
+    assert watcher.queue.get_nowait()[0] == pdf
+    # Aynı sürüm ikinci kez kuyruğa alınmaz.
+    watcher.touch(pdf)
+    watcher.check_candidates()
+    time.sleep(0.35)
+    watcher.check_candidates()
+    assert watcher.queue.empty()
+
+def test_files_written_for_too_long_expire(tmp_path):
+    pdf = write(str(tmp_path / "a.pdf"))
+    watcher = HotFolder([str(tmp_path)], (".pdf",), converting([]), settle=10.0, expire=0.1)
+    watcher.touch(pdf)
+    watcher.check_candidates()
+    time.sleep(0.15)
+    watcher.check_candidates()
+    assert watcher.candidates == {} and watcher.stats()["expired"] == 1
+
+def test_waiting_list_is_bounded_and_refilled_by_a_rescan(tmp_path):
+    pdfs = [write(str(tmp_path / f"{n}.pdf")) for n in range(4)]
+    watcher = HotFolder([str(tmp_path)], (".pdf",), converting([]), settle=0.0, queue_size=1, max_waiting=1)
+    for pdf in pdfs:
+        watcher.touch(pdf)
+    watcher.check_candidates()
+    watcher.check_candidates()
+    # Kuyruğa biri girer; bekleme listesi sınırı aşan diğerleri bırakılır ve liste boşalınca taramayla geri gelir.
+    assert watcher.queue.qsize() == 1 and not watcher.waiting
+    assert watcher.stats()["deferred"] == 3 and not watcher.deferred
+    assert set(watcher.candidates) == set(pdfs)
+    queued = watcher.queue.queue[0][0]
+    watcher.check_candidates()
+    watcher.check_candidates()
+    # Kuyruktaki sürüm yeniden alınmaz; kuyruk doluyken bekleme listesinde en çok bir dosya durur.
+    assert len(watcher.waiting) == 1 and queued not in watcher.waiting
+    assert watcher.queue.qsize() == 1 and watcher.deferred
+
+def test_scan_skips_excluded_folders_and_current_outputs(tmp_path):
+    keep = write(str(tmp_path / "in" / "a.pdf"))
+    done = write(str(tmp_path / "in" / "b.pdf"))
+    write(str(tmp_path / "in" / "out" / "c.pdf"))
+    watcher = HotFolder([str(tmp_path / "in")], (".pdf",), converting([]), recursive=True,
+                        exclude=[str(tmp_path / "in" / "out")], is_current=lambda path: path == done)
+    watcher.rescan()
+    assert list(watcher.candidates) == [keep]
+
+class BrokenSource:
+    closed = False
+
+    def poll(self, timeout):
+        raise OSError(28, "inotify watch limit reached")
+
+    def close(self):
+        self.closed = True
+
+def test_watch_errors_fall_back_to_scanning(tmp_path):
+    messages = []
+    seen = []
+    watcher = HotFolder([str(tmp_path)], (".pdf",), converting(seen), settle=0.1, poll_interval=0.1,
+                        log=messages.append)
+    watcher.polling = False
+    watcher.source = broken = BrokenSource()
+    watcher.threads = [threading.Thread(target=watcher.run_watcher, daemon=True),
+                       threading.Thread(target=watcher.run_converter, daemon=True)]
+    for thread in watcher.threads:
+        thread.start()
+    try:
+        assert wait_for(lambda: watcher.polling)
+        pdf = write(str(tmp_path / "late.pdf"))
+        assert wait_for(lambda: seen == [pdf])
+    finally:
+        watcher.stop()
+    assert broken.closed
+    assert watcher.stats()["errors"] == 1 and "scanning every" in messages[0]
+
+def test_converter_errors_are_counted_as_failures(tmp_path):
+    def explode(paths):
+        raise RuntimeError("boom")
+    watcher = HotFolder([str(tmp_path)], (".pdf",), explode, settle=0.1, polling=True, poll_interval=0.1)
+    watcher.start()
+    try:
+        write(str(tmp_path / "a.pdf"))
+        assert wait_for(lambda: watcher.stats()["failed"] == 1)
+    finally:
+        watcher.stop()
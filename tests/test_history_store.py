@@ -0,0 +1,70 @@
+import threading
+
+from history_store import HistoryStore, _filters
+
+def store_with_batches(path):
+    store = HistoryStore(str(path))
+    for day, conversion in ((1, "pdf_to_pptx"), (2, "pptx_to_pdf"), (2, "pdf_to_pptx"), (3, "pdf_to_pptx")):
+        store.add_batch(f"2024-05-0{day} 10:00:00", conversion, 1, False, 1, "/out")
+    return store
+
+def test_pages_are_newest_first(tmp_path):
+    store = store_with_batches(tmp_path / "history.db")
+    dates = [row[1] for row in store.page(0, 10)]
+    assert dates == sorted(dates, reverse=True)
+    assert [row[0] for row in store.page(1, 2)] == [row[0] for row in store.page(0, 10)][1:3]
+    assert store.count() == 4
+
+def test_filters_by_conversion_and_inclusive_dates(tmp_path):
+    store = store_with_batches(tmp_path / "history.db")
+    assert store.count(conversion="pdf_to_pptx") == 3
+    # Yalnızca gün verilen bitiş tarihi o günün tamamını kapsar.
+    assert store.count(date_from="2024-05-02", date_to="2024-05-02") == 2
+    assert store.count(conversion="pdf_to_pptx", date_to="2024-05-02") == 2
+    assert [row[2] for row in store.page(0, 10, conversion="pptx_to_pdf")] == ["pptx_to_pdf"]
+
+def test_filtered_pages_use_the_indexes(tmp_path):
+    store = store_with_batches(tmp_path / "history.db")
+    where, params = _filters("pdf_to_pptx", "2024-05-01", "2024-05-03")
+    plan = store.connection.execute("EXPLAIN QUERY PLAN SELECT id FROM batches" + where + " ORDER BY date DESC",
+                                    params).fetchall()
+    assert any("batches_conversion_date" in row[-1] for row in plan)
+
+def test_file_records_are_kept_per_batch_and_cleared_with_it(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    results = [{"input": "a.pdf", "output": "a.pptx", "status": "done", "seconds": 1.5},
+               {"input": "b.pdf", "status": "failed", "error": "broken"}]
+    batch_id = store.add_batch("2024-05-01 10:00:00", "pdf_to_pptx", 2, True, 1, "/out", 2.0, results)
+    assert store.file_records(batch_id) == [("a.pdf", "a.pptx", "done", None, 1.5), ("b.pdf", None, "failed", "broken", None)]
+    store.clear()
+    assert store.count() == 0
+    assert store.connection.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 0
+
+def test_legacy_csv_is_imported_once(tmp_path):
+    csv_path = tmp_path / "history.csv"
+    csv_path.write_text("Date,Conversion,Mode,Compressed,Files,Output\n"
+                        "2023-01-01 09:00:00,pdf_to_pptx,2,✓,3,/out\n"
+                        "broken row\n"
+                        "2023-01-02 09:00:00,pptx_to_pdf,x,,y,/out2\n", encoding="utf-8")
+    store = HistoryStore(str(tmp_path / "history.db"))
+    assert store.import_csv(str(csv_path)) == 2
+    assert store.import_csv(str(csv_path)) == 0
+    rows = store.page(0, 10)
+    assert [(row[2], row[3], row[4], row[5]) for row in rows] == [("pptx_to_pdf", 1, 0, 0), ("pdf_to_pptx", 2, 1, 3)]
+    store.close()
+    # Yeniden açılan depo aktarımı hatırlar.
+    assert HistoryStore(str(tmp_path / "history.db")).import_csv(str(csv_path)) == 0
+
+def test_concurrent_writers_share_the_connection(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    def add(n):
+        for i in range(25):
+            store.add_batch(f"2024-06-01 00:00:{i:02d}", "pdf_to_pptx", 1, False, 1, f"/out{n}",
+                            results=[{"input": f"{n}-{i}.pdf", "status": "done"}])
+    threads = [threading.Thread(target=add, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.count() == 100
+    assert store.connection.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 100
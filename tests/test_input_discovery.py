@@ -0,0 +1,86 @@
+import os, fnmatch
+import pytest
+
+from input_discovery import discover_files, glob_regex, glob_match, work_costs, largest_first, balanced_groups
+
+NAMES = ["a.pdf", "b.pdf", "z.pdf", "-.pdf", "].pdf", "!.pdf", "[.pdf", "ab.pdf", "A.pdf", "m/x.pdf"]
+
+@pytest.mark.parametrize("pattern", ["[ab].pdf", "[!ab].pdf", "[a-c].pdf", "[z-a].pdf", "[]].pdf", "[!]].pdf",
+                                     "[a-].pdf", "[!a-c]*", "[.pdf", "[[].pdf", "[!!].pdf", "?.pdf", "*b.pdf", "m*"])
+def test_brackets_match_like_fnmatch(pattern):
+    for name in NAMES:
+        assert bool(glob_regex(pattern, False).match(name)) == fnmatch.fnmatchcase(name, pattern), name
+
+def test_folder_patterns_stop_at_separators():
+    assert glob_regex("*.pdf").match("x.pdf") and not glob_regex("*.pdf").match("m/x.pdf")
+    assert not glob_regex("m[!a]x.pdf").match("m/x.pdf")
+    assert not glob_regex("m?x.pdf").match("m/x.pdf")
+    # "**/" sıfır veya daha çok klasör
+    assert all(glob_regex("**/x.pdf").match(p) for p in ("x.pdf", "m/x.pdf", "m/n/x.pdf"))
+    assert glob_match("m/n/draft-1.pdf", ["draft-[0-9].pdf"]) and glob_match("m/n/x.pdf", ["m/*"])
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(os.path.basename(path).encode())
+    return path
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    for name in ("b.pdf", "a.pdf", "notes.txt", "~$a.pdf", "sub/c.pdf", "sub/deep/d.pdf", "sub/drafts/e.pdf",
+                 "other/f.PDF"):
+        touch(str(root / name))
+    return str(root)
+
+def relative(root, paths):
+    return [os.path.relpath(p, root).replace(os.sep, "/") for p in paths]
+
+def test_folders_are_walked_in_name_order(tree):
+    assert relative(tree, discover_files([tree], (".pdf",))[0]) == ["a.pdf", "b.pdf"]
+    files, counters = discover_files([tree], (".pdf",), recursive=True, exclude=["sub/drafts"])
+    assert relative(tree, files) == ["a.pdf", "b.pdf", "other/f.PDF", "sub/c.pdf", "sub/deep/d.pdf"]
+    # Kilit dosyası ve dışlanan klasör sayılır; dışlanan klasörün içine inilmez.
+    assert counters["excluded"] == 2
+    files, _ = discover_files([tree], (".pdf",), recursive=True, include=["[a-c].pdf", "sub/deep/*"])
+    assert relative(tree, files) == ["a.pdf", "b.pdf", "sub/c.pdf", "sub/deep/d.pdf"]
+
+def test_globs_expand_from_their_fixed_prefix(tree):
+    # Desen, glob modülü gibi büyük/küçük harfe duyarlıdır (Windows dışında); "*.pdf" f.PDF ile eşleşmez.
+    pattern = os.path.join(tree, "**", "*.pdf")
+    assert relative(tree, discover_files([pattern], (".pdf",))[0]) == ["sub/c.pdf"]
+    assert relative(tree, discover_files([pattern], (".pdf",), recursive=True)[0]) == \
+        ["a.pdf", "b.pdf", "sub/c.pdf", "sub/deep/d.pdf", "sub/drafts/e.pdf"]
+    assert relative(tree, discover_files([os.path.join(tree, "[!b]*.pdf")], (".pdf",))[0]) == ["a.pdf"]
+    assert relative(tree, discover_files([os.path.join(tree, "s?b", "[c-d].pdf")], (".pdf",))[0]) == ["sub/c.pdf"]
+
+def test_same_file_is_taken_once(tree):
+    os.symlink(os.path.join(tree, "a.pdf"), os.path.join(tree, "sub", "link.pdf"))
+    os.link(os.path.join(tree, "b.pdf"), os.path.join(tree, "other", "hard.pdf"))
+    files, counters = discover_files([tree, os.path.join(tree, "a.pdf")], (".pdf",), recursive=True)
+    assert relative(tree, files).count("a.pdf") == 1
+    assert "sub/link.pdf" not in relative(tree, files) and "other/hard.pdf" not in relative(tree, files)
+    assert counters["duplicates"] == 3
+
+def test_symlinked_folder_loops_end(tree):
+    os.symlink(tree, os.path.join(tree, "sub", "loop"))
+    files, _ = discover_files([tree], (".pdf",), recursive=True)
+    assert "sub/loop/a.pdf" not in relative(tree, files)
+    followed, counters = discover_files([tree], (".pdf",), recursive=True, follow_symlinks=True)
+    assert sorted(followed) == sorted(files) and counters["directories"] == 5
+
+def test_missing_explicit_path_is_kept_for_error_reporting(tmp_path):
+    missing = str(tmp_path / "gone.pdf")
+    assert discover_files([missing], (".pdf",))[0] == [missing]
+    assert discover_files([str(tmp_path / "none" / "*.pdf")], (".pdf",))[0] == []
+
+def test_costs_and_scheduling(make_pdf):
+    small, large = make_pdf("small.pdf", pages=1), make_pdf("large.pdf", pages=6)
+    assert work_costs([small, large], "pages") == [1, 6]
+    sizes = work_costs([small, large, "missing.pdf"], "size")
+    assert sizes[0] < sizes[1] and sizes[2] == 0
+    assert largest_first(["a", "b", "c", "d"], [1, 5, 5, 2]) == ["b", "c", "d", "a"]
+    groups = balanced_groups(list("abcdef"), [8, 7, 6, 5, 4, 3], 2, 3)
+    assert sorted(map(sorted, groups)) == [["a", "d", "e"], ["b", "c", "f"]]
+    # Kapasite dolunca öğe başka gruba gider.
+    assert [len(g) for g in balanced_groups(list("abcd"), [100, 1, 1, 1], 2, 2)] == [2, 2]
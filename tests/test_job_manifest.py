@@ -0,0 +1,133 @@
+import os, json, pickle
+from concurrent.futures import ProcessPoolExecutor
+from pptx import Presentation
+
+import pdf_to_pptx
+from job_manifest import JobManifest, CancelToken, default_manifest_path, RUNTIME_OPTIONS
+
+def records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def cancel_after(token, files):
+    # progress_update: "files" dosya bitince iptal edilir.
+    def update(completed, total, message):
+        if completed > files:
+            token.cancel()
+    return update
+
+def test_cancelled_batch_resumes_from_its_manifest(renderer, make_pdf, tmp_path):
+    pdfs = [make_pdf(f"in/{n}.pdf", pages=2) for n in range(3)]
+    out = str(tmp_path / "out")
+    token = CancelToken()
+    try:
+        batch = pdf_to_pptx.convert_files("pdf_to_pptx", pdfs, out, {"jobs": 1, "cancel": token},
+                                          progress_update=cancel_after(token, 1))
+    finally:
+        token.close()
+    assert [r["status"] for r in batch["results"]] == ["done", "cancelled", "cancelled"]
+    assert batch["manifest"] == default_manifest_path(out)
+    assert sorted(os.listdir(out)) == sorted([os.path.basename(batch["manifest"]), "0.pptx"])
+    # Kayıtta yalnızca sürdürmede yeniden kullanılabilecek seçenekler bulunur.
+    options = records(batch["manifest"])[0]["options"]
+    assert not set(options) & set(RUNTIME_OPTIONS)
+    assert options["jobs"] == 1 and options["dpi"] == 200
+    first = os.stat(os.path.join(out, "0.pptx")).st_mtime_ns
+
+    resumed = pdf_to_pptx.resume_batch(out)
+    assert resumed["succeeded"] == 3 and resumed["manifest"] is None
+    assert resumed["results"][0].get("resumed") is True
+    assert os.stat(os.path.join(out, "0.pptx")).st_mtime_ns == first
+    assert sorted(os.listdir(out)) == ["0.pptx", "1.pptx", "2.pptx"]
+    assert [len(Presentation(os.path.join(out, f"{n}.pptx")).slides) for n in range(3)] == [2, 2, 2]
+
+def test_manifest_survives_a_torn_last_line(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    outputs = [str(tmp_path / f"{n}.pptx") for n in range(3)]
+    manifest = JobManifest.create(path, "pdf_to_pptx", ["a.pdf", "b.pdf", "c.pdf"], outputs, str(tmp_path),
+                                  {"jobs": 2, "cancel": CancelToken(), "metrics": object(), "dpi": 150}, False)
+    with open(outputs[0], "wb") as f:
+        f.write(b"deck")
+    manifest.record(0, {"status": "done"})
+    manifest.record(1, {"status": "failed", "error": "boom"})
+    # Süreç satırın ortasında ölmüş gibi.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "result", "index": 2, "sta')
+    loaded = JobManifest.load(path)
+    assert loaded.options() == {"jobs": 2, "dpi": 150}
+    assert loaded.counts() == {"done": 1, "failed": 1, "pending": 1}
+    assert loaded.remaining() == [1, 2]
+    assert loaded.files[1]["error"] == "boom"
+
+def test_changed_or_missing_outputs_are_converted_again(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    outputs = [str(tmp_path / f"{n}.pptx") for n in range(3)]
+    manifest = JobManifest.create(path, "pdf_to_pptx", ["a", "b", "c"], outputs, str(tmp_path), {}, True)
+    for n, output in enumerate(outputs):
+        with open(output, "wb") as f:
+            f.write(b"deck %d" % n)
+        manifest.record(n, {"status": "done"})
+    with open(outputs[1], "wb") as f:
+        f.write(b"truncated")
+    os.remove(outputs[2])
+    loaded = JobManifest.load(path)
+    assert loaded.remaining() == [1, 2]
+    # ZIP'e alınmış (diskten silinmiş) çıktı yeniden dönüştürülmez.
+    assert loaded.remaining(archived={"2.pptx"}) == [1]
+
+def is_cancelled(token):
+    return token.cancelled()
+
+def test_cancel_token_reaches_worker_processes():
+    token = CancelToken()
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(is_cancelled, token).result() is False
+            token.cancel()
+            assert executor.submit(is_cancelled, token).result() is True
+        copy = pickle.loads(pickle.dumps(token))
+        assert copy.cancelled() and copy.flag_path == token.flag_path
+    finally:
+        token.close()
+    assert not os.path.exists(token.flag_path)
+
+def test_cancelled_file_leaves_no_partial_output(renderer, make_pdf, tmp_path, monkeypatch):
+    # İlk sayfa aralığı çizildikten sonra iptal edilir; dönüşüm sayfa sınırında durur.
+    token = CancelToken()
+    render = pdf_to_pptx.convert_from_path
+    def render_then_cancel(*args, **kwargs):
+        paths = render(*args, **kwargs)
+        token.cancel()
+        return paths
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", render_then_cancel)
+    pdf = make_pdf(pages=4)
+    output = str(tmp_path / "out.pptx")
+    try:
+        result = pdf_to_pptx.convert_file("pdf_to_pptx", pdf, output, {"cancel": token, "page_window": 2})
+    finally:
+        token.close()
+    assert result["status"] == "cancelled"
+    assert not os.path.exists(output)
+
+def test_cancelled_rerun_keeps_the_earlier_output(renderer, make_pdf, tmp_path, monkeypatch):
+    pdf = make_pdf(pages=4)
+    output = str(tmp_path / "out.pptx")
+    assert pdf_to_pptx.convert_file("pdf_to_pptx", pdf, output)["status"] == "done"
+    with open(output, "rb") as f:
+        before = f.read()
+    token = CancelToken()
+    render = pdf_to_pptx.convert_from_path
+    def render_then_cancel(*args, **kwargs):
+        paths = render(*args, **kwargs)
+        token.cancel()
+        return paths
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", render_then_cancel)
+    try:
+        result = pdf_to_pptx.convert_file("pdf_to_pptx", pdf, output, {"cancel": token, "page_window": 2})
+    finally:
+        token.close()
+    assert result["status"] == "cancelled"
+    # Yarım deste geçici dosyada kalmıştı; önceki tam çıktı değişmez.
+    with open(output, "rb") as f:
+        assert f.read() == before
+    assert not os.path.exists(output + ".partial")
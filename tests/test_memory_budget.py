@@ -0,0 +1,66 @@
+import io, time, random, zipfile, threading
+from PIL import Image
+
+import benchmark
+import pdf_to_pptx
+
+MB = 1024 * 1024
+
+def poster_pdf(path):
+    # Bir A0 poster ve iki mektup boyu sayfa.
+    rng = random.Random("poster")
+    benchmark.write_pdf(str(path), [(*benchmark.LETTER, benchmark._text_lines(rng, 5), None),
+                                    (*benchmark.A0, benchmark._text_lines(rng, 5), None),
+                                    (*benchmark.LETTER, benchmark._text_lines(rng, 5), None)])
+    return str(path)
+
+def test_plan_groups_pages_and_downscales_oversized_ones(renderer, tmp_path):
+    pdf = poster_pdf(tmp_path / "poster.pdf")
+    options = pdf_to_pptx.conversion_options({"dpi": 200})
+    letter_cost = int(612 / 72 * 200 * 792 / 72 * 200 * 3)
+    stats = {}
+    plan = pdf_to_pptx.plan_render(pdf, options, 8, 20 * MB, stats=stats)
+    assert stats["page_total"] == 3
+    assert [(first, last) for first, last, _, _ in plan] == [(1, 1), (2, 2), (3, 3)]
+    assert plan[0][2:] == (200, letter_cost)
+    # Poster bütçeye sığacak kadar düşük çözünürlükte çizilir.
+    assert plan[1][2] < 200 and plan[1][3] <= 20 * MB
+    # Bütçe yoksa bütün sayfalar tek aralıkta, istenen çözünürlüktedir.
+    assert [group[:3] for group in pdf_to_pptx.plan_render(pdf, options, 8, 0)] == [(1, 3, 200)]
+
+def test_plan_only_covers_requested_pages(renderer, make_pdf):
+    pdf = make_pdf(pages=6)
+    options = pdf_to_pptx.conversion_options()
+    plan = pdf_to_pptx.plan_render(pdf, options, 8, 0, pages={1, 2, 5})
+    assert [group[:2] for group in plan] == [(1, 2), (5, 5)]
+
+def test_oversized_page_is_rendered_at_lower_resolution(renderer, tmp_path):
+    pdf = poster_pdf(tmp_path / "poster.pdf")
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"dpi": 100, "memory_budget_mb": 20})
+    assert stats["downscaled_pages"] == 1
+    assert stats["peak_pixel_bytes"] <= 20 * MB
+    with zipfile.ZipFile(output) as package:
+        sizes = [Image.open(io.BytesIO(package.read(name))).size for name in pdf_to_pptx.deck_media(output)]
+    assert sizes[0] == (850, 1100)
+    width, height = sizes[1]
+    assert width * height * 3 <= 20 * MB
+
+def test_memory_budget_admits_work_under_the_limit():
+    budget = pdf_to_pptx.MemoryBudget(100)
+    budget.acquire(60)
+    admitted = threading.Event()
+    def second():
+        budget.acquire(60)
+        admitted.set()
+    thread = threading.Thread(target=second)
+    thread.start()
+    time.sleep(0.1)
+    assert not admitted.is_set()
+    budget.release(60)
+    thread.join(5)
+    assert admitted.is_set() and budget.peak == 60
+    # Bütçeden büyük iş, başka iş yokken tek başına kabul edilir.
+    budget.release(60)
+    budget.acquire(500)
+    assert budget.used == 500
@@ -0,0 +1,73 @@
+import os, json, signal
+
+import pdf_to_pptx
+from metrics import Metrics, JsonLinesSink, PrometheusSink, StatsSink
+
+def read_spans(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_batch_spans_reach_every_sink(renderer, make_pdf, tmp_path):
+    pdfs = [make_pdf(f"in/{name}.pdf", pages=2) for name in ("a", "b")]
+    jsonl, prom = str(tmp_path / "spans.jsonl"), str(tmp_path / "converty.prom")
+    stats = StatsSink()
+    metrics = Metrics([JsonLinesSink(jsonl), PrometheusSink(prom), stats])
+    try:
+        batch = pdf_to_pptx.convert_files("pdf_to_pptx", pdfs, str(tmp_path / "out"),
+                                          {"jobs": 2, "pool": "thread", "metrics": metrics}, zip_option=True)
+    finally:
+        metrics.close()
+    assert batch["succeeded"] == 2
+    # Aralıklar ana süreçte kayıt yerlerine iletilir; sonuç sözlüğünde kalmaz.
+    assert all("spans" not in result for result in batch["results"])
+    spans = read_spans(jsonl)
+    names = {span["span"] for span in spans}
+    assert {"render", "encode", "assemble", "save", "file", "zip", "schedule", "batch"} <= names
+    for span in spans:
+        assert span["seconds"] >= 0 and "ts" in span
+        if span["span"] in ("render", "encode", "save", "file"):
+            assert span["file"] in pdfs and span["conversion"] == "pdf_to_pptx"
+    assert sum(span.get("pages", 0) for span in spans if span["span"] == "render") == 4
+    assert [span["files"] for span in spans if span["span"] == "batch"] == [2]
+
+    snapshot = stats.snapshot()
+    assert snapshot["files"] == {("pdf_to_pptx", "done"): 2}
+    assert snapshot["stages"]["file"]["count"] == 2
+    with open(prom, encoding="utf-8") as f:
+        text = f.read()
+    assert 'converty_files_total{conversion="pdf_to_pptx",status="done"} 2' in text
+    assert 'converty_stage_spans_total{stage="render"}' in text
+    assert "# TYPE converty_stage_seconds_total counter" in text
+    assert not os.path.exists(prom + ".tmp")
+
+def test_metrics_are_off_by_default(renderer, make_pdf, tmp_path):
+    result = pdf_to_pptx.convert_file("pdf_to_pptx", make_pdf(), str(tmp_path / "out.pptx"), {})
+    assert result["status"] == "done" and "spans" not in result
+
+def test_stats_sink_totals_and_reset():
+    stats = StatsSink()
+    metrics = Metrics([stats])
+    with metrics.span("render", bytes=10) as fields:
+        fields["pages"] = 3
+    metrics.emit({"span": "render", "seconds": 0.5, "bytes": 5, "rss_bytes": 1024})
+    metrics.emit({"span": "file", "conversion": "pptx_to_pdf", "status": "failed", "seconds": 1.0})
+    snapshot = stats.snapshot()
+    assert snapshot["stages"]["render"]["count"] == 2 and snapshot["stages"]["render"]["bytes"] == 15
+    assert snapshot["stages"]["render"]["seconds"] >= 0.5
+    assert snapshot["files"] == {("pptx_to_pdf", "failed"): 1} and snapshot["rss_bytes"] == 1024
+    stats.reset()
+    assert stats.snapshot() == {"stages": {}, "files": {}, "rss_bytes": None}
+
+def test_cli_writes_metric_files(renderer, make_pdf, tmp_path, capsys):
+    make_pdf("in/a.pdf", pages=1)
+    jsonl, prom = str(tmp_path / "m.jsonl"), str(tmp_path / "m.prom")
+    handler = signal.getsignal(signal.SIGINT)
+    try:
+        code = pdf_to_pptx.cli_main(["pdf_to_pptx", str(tmp_path / "in"), "-o", str(tmp_path / "out"), "-q",
+                                     "--no-history", "--jobs", "1", "--metrics-jsonl", jsonl, "--metrics-prom", prom])
+    finally:
+        signal.signal(signal.SIGINT, handler)
+    capsys.readouterr()
+    assert code == 0
+    assert [span["status"] for span in read_spans(jsonl) if span["span"] == "file"] == ["done"]
+    assert os.path.getsize(prom) > 0
@@ -0,0 +1,77 @@
+import os, sys, shutil, textwrap
+import pytest
+from pptx import Presentation
+
+import office_pool
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="the stand-in soffice is a POSIX script")
+
+@pytest.fixture
+def fake_soffice(tmp_path, monkeypatch):
+    # Komut satırını soffice gibi yorumlayan küçük bir program: her girdi için --outdir içine, içinde girdinin
+    # yolu yazan bir "PDF" bırakır. Adı "fail" ile başlayan girdiler için hiçbir şey yazmaz ve hata ile çıkar.
+    script = tmp_path / "soffice"
+    script.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import os, sys
+        args = sys.argv[1:]
+        out_dir = args[args.index("--outdir") + 1]
+        inputs = [a for a in args[args.index("pdf") + 1:args.index("--outdir")]]
+        os.makedirs(out_dir, exist_ok=True)
+        failed = False
+        for path in inputs:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            if stem.startswith("fail"):
+                failed = True
+                continue
+            with open(os.path.join(out_dir, stem + ".pdf"), "w") as f:
+                f.write("%PDF-1.4 " + path)
+        sys.exit(1 if failed else 0)
+        """))
+    script.chmod(0o755)
+    monkeypatch.setattr(office_pool, "SOFFICE", str(script))
+    return script
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+def test_inputs_with_the_same_name_do_not_overwrite_each_other(fake_soffice, tmp_path):
+    inputs = [str(tmp_path / "a" / "deck.pptx"), str(tmp_path / "b" / "Deck.pptx"), str(tmp_path / "other.pptx")]
+    outputs = [str(tmp_path / "out" / name) for name in ("deck.pdf", "deck (2).pdf", "other.pdf")]
+    os.makedirs(tmp_path / "out")
+    assert office_pool.convert_many(inputs, outputs) == [None, None, None]
+    assert [read(p) for p in outputs] == ["%PDF-1.4 " + p for p in inputs]
+    # Çalışma klasörü (profil ve ara çıktılar) kaldırılır.
+    assert sorted(os.listdir(tmp_path / "out")) == ["deck (2).pdf", "deck.pdf", "other.pdf"]
+
+def test_failures_are_reported_per_file(fake_soffice, tmp_path):
+    inputs = [str(tmp_path / "good.pptx"), str(tmp_path / "fail.pptx")]
+    outputs = [str(tmp_path / "good.pdf"), str(tmp_path / "fail.pdf")]
+    errors = office_pool.convert_many(inputs, outputs)
+    # soffice hata ile çıksa da üretilen PDF'ler kullanılır.
+    assert errors[0] is None and os.path.exists(outputs[0])
+    assert errors[1].startswith("CalledProcessError")
+    assert not os.path.exists(outputs[1])
+
+def test_missing_output_is_an_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(office_pool, "SOFFICE", shutil.which("true") or "/bin/true")
+    errors = office_pool.convert_many([str(tmp_path / "deck.pptx")], [str(tmp_path / "deck.pdf")])
+    assert errors == [f"LibreOffice did not produce a PDF for {tmp_path / 'deck.pptx'}"]
+
+@pytest.mark.skipif(not shutil.which(office_pool.SOFFICE) or not office_pool.uno_available(),
+                    reason="LibreOffice with Python UNO bindings is not installed")
+def test_office_pool_converts_real_decks(tmp_path):
+    paths = []
+    for n in range(3):
+        presentation = Presentation()
+        presentation.slides.add_slide(presentation.slide_layouts[0]).shapes.title.text = f"Deck {n}"
+        paths.append(str(tmp_path / f"deck{n}.pptx"))
+        presentation.save(paths[-1])
+    with office_pool.OfficePool(2, timeout=120) as pool:
+        for path in paths:
+            pool.convert(path, path[:-5] + ".pdf")
+        assert pool.stats() == {"instances": 2, "restarts": 0}
+    for path in paths:
+        with open(path[:-5] + ".pdf", "rb") as f:
+            assert f.read(5) == b"%PDF-"
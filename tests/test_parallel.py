@@ -0,0 +1,63 @@
+import os, sys, time
+import pytest
+from pptx import Presentation
+
+import pdf_to_pptx
+
+def square(n):
+    return n * n
+
+def crash_on(n, bad):
+    # İşçi süreci aniden ölür (ör. bellek yetmezliği); havuz bozulur.
+    if n == bad:
+        os._exit(1)
+    return n
+
+def slow(n):
+    time.sleep(0.05)
+    return n
+
+def collect(tasks, jobs, pool, cancelled=None):
+    results = {}
+    pdf_to_pptx.run_parallel(tasks, jobs, pool, lambda i, result, error: results.__setitem__(i, (result, error)), cancelled)
+    return results
+
+def test_run_parallel_returns_every_result_in_a_process_pool():
+    results = collect([(square, (n,)) for n in range(6)], 3, "process")
+    assert results == {n: (n * n, None) for n in range(6)}
+
+def test_crashed_worker_only_fails_its_own_task():
+    results = collect([(crash_on, (n, 2)) for n in range(5)], 2, "process")
+    assert results[2] == (None, "Worker process crashed")
+    assert {i: results[i] for i in (0, 1, 3, 4)} == {i: (i, None) for i in (0, 1, 3, 4)}
+
+def test_task_exceptions_are_reported_per_task():
+    results = collect([(square, ("x",)), (square, (3,))], 2, "thread")
+    assert results[0][0] is None and results[0][1].startswith("TypeError")
+    assert results[1] == (9, None)
+
+def test_cancelled_batch_starts_no_new_tasks():
+    started = []
+    def cancelled():
+        return len(started) >= 2
+    def on_result(i, result, error):
+        started.append(i)
+    pdf_to_pptx.run_parallel([(slow, (n,)) for n in range(8)], 1, "thread", on_result, cancelled)
+    assert len(started) == 2
+
+def test_files_convert_concurrently(renderer, make_pdf, tmp_path):
+    pdfs = [make_pdf(f"in/{name}.pdf", pages=pages) for name, pages in (("a", 1), ("b", 3), ("c", 2))]
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", pdfs, str(tmp_path / "out"), {"jobs": 3, "pool": "thread"})
+    assert batch["succeeded"] == 3
+    # Sonuçlar bitiş sırasına değil, girdi sırasına göredir.
+    assert [os.path.basename(r["output"]) for r in batch["results"]] == ["a.pptx", "b.pptx", "c.pptx"]
+    assert [len(Presentation(r["output"]).slides) for r in batch["results"]] == [1, 3, 2]
+
+def test_missing_powerpoint_stops_the_batch_with_its_own_error(tmp_path, monkeypatch):
+    # comtypes yüklenemez; yalnızca COM başlatma hatası PowerPointUnavailable olur.
+    monkeypatch.setitem(sys.modules, "comtypes", None)
+    deck = tmp_path / "a.pptx"
+    deck.write_bytes(b"")
+    with pytest.raises(pdf_to_pptx.PowerPointUnavailable):
+        pdf_to_pptx.convert_files("pptx_to_pdf", [str(deck)], str(tmp_path / "out"),
+                                  {"pdf_engine": "powerpoint_com", "manifest": False})
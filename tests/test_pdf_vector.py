@@ -0,0 +1,62 @@
+import random
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+import benchmark
+import pdf_to_pptx
+
+pymupdf = pytest.importorskip("pymupdf")
+
+def texts(slide):
+    return [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+
+def test_text_stays_editable_without_rasterizing(tmp_path, monkeypatch):
+    def no_render(*args, **kwargs):
+        raise AssertionError("vector pages must not be rasterized")
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", no_render)
+    monkeypatch.setattr(pdf_to_pptx, "pdfinfo_from_path", no_render)
+    pages = benchmark.pdf_pages("mixed", random.Random("vector"), 2)
+    pdf, output = str(tmp_path / "in.pdf"), str(tmp_path / "out.pptx")
+    benchmark.write_pdf(pdf, pages)
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"pptx_engine": "vector"})
+    assert stats["vector_pages"] == 2 and stats["raster_pages"] == 0 and stats["fallbacks"] == {}
+    presentation = Presentation(output)
+    for slide, (_, _, lines, image) in zip(presentation.slides, pages):
+        assert texts(slide) == lines
+        run = next(shape for shape in slide.shapes if shape.has_text_frame).text_frame.paragraphs[0].runs[0]
+        # Helvetica, Office'teki ölçü uyumlu karşılığıyla yazılır.
+        assert run.font.name == "Arial"
+        pictures = [shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+        if image is None:
+            assert pictures == []
+        else:
+            # JPEG olduğu gibi gömülür ve sayfadaki yerinde, metnin altında durur.
+            assert [picture.image.blob for picture in pictures] == [image[0]]
+            assert slide.shapes[0].shape_type == MSO_SHAPE_TYPE.PICTURE
+            assert abs(pictures[0].top + pictures[0].height - presentation.slide_height) <= 12700
+
+def write_fallback_pdf(path):
+    # 1: düz metin, 2: beyaz kutuyla örtülmüş metin, 3: not eklentisi
+    with pymupdf.open() as document:
+        for number in range(3):
+            page = document.new_page(width=benchmark.LETTER[0], height=benchmark.LETTER[1])
+            page.insert_text((72, 72), f"Page {number + 1} text", fontname="helv", fontsize=14)
+            if number == 1:
+                page.draw_rect(pymupdf.Rect(60, 50, 300, 90), color=None, fill=(1, 1, 1))
+            elif number == 2:
+                page.add_text_annot((200, 200), "Reviewer note")
+        document.save(path)
+    return path
+
+def test_pages_that_cannot_be_kept_as_shapes_are_rasterized(renderer, tmp_path):
+    pdf = write_fallback_pdf(str(tmp_path / "in.pdf"))
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"pptx_engine": "vector"})
+    assert stats["vector_pages"] == 1 and stats["raster_pages"] == 2
+    assert stats["fallbacks"] == {"covered_text": 1, "annotations": 1}
+    slides = list(Presentation(output).slides)
+    assert texts(slides[0]) == ["Page 1 text"]
+    for slide in slides[1:]:
+        # Rasterleştirilen sayfa tek bir görüntüdür; gizlenmiş metin seçilebilir hale gelmez.
+        assert [shape.shape_type for shape in slide.shapes] == [MSO_SHAPE_TYPE.PICTURE]
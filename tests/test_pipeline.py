@@ -0,0 +1,43 @@
+import time, zipfile
+
+import pdf_to_pptx
+
+def slide_media(path):
+    # Slayt sırasıyla görüntü baytları.
+    media = pdf_to_pptx.deck_media(path)
+    with zipfile.ZipFile(path) as package:
+        return [package.read(name) for name in media]
+
+def test_pipelined_deck_matches_sequential_deck(renderer, make_pdf, tmp_path):
+    pdf = make_pdf(kind="mixed", pages=7)
+    sequential = str(tmp_path / "sequential.pptx")
+    pipelined = str(tmp_path / "pipelined.pptx")
+    pdf_to_pptx.convert_pdf(pdf, sequential, {"page_jobs": 1})
+    stats = pdf_to_pptx.convert_pdf(pdf, pipelined, {"page_jobs": 3, "page_window": 2})
+    assert stats["page_jobs"] == 3 and stats["pages"] == 7
+    assert slide_media(pipelined) == slide_media(sequential)
+
+def test_slides_keep_page_order_when_renders_finish_out_of_order(renderer, make_pdf, tmp_path, monkeypatch):
+    # İlk aralık en geç biter; slaytlar yine de sayfa sırasıyla yazılır.
+    render = pdf_to_pptx.convert_from_path
+    def uneven(pdf_path, first_page=None, last_page=None, **kwargs):
+        time.sleep(0.3 if first_page == 1 else 0.0)
+        return render(pdf_path, first_page=first_page, last_page=last_page, **kwargs)
+    pdf = make_pdf(kind="mixed", pages=6)
+    expected = str(tmp_path / "expected.pptx")
+    pdf_to_pptx.convert_pdf(pdf, expected, {"page_jobs": 1})
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", uneven)
+    output = str(tmp_path / "out.pptx")
+    pdf_to_pptx.convert_pdf(pdf, output, {"page_jobs": 3, "page_window": 3})
+    assert slide_media(output) == slide_media(expected)
+
+def test_single_file_batch_gives_its_workers_to_the_page_pipeline(renderer, make_pdf, tmp_path):
+    pdf = make_pdf(pages=4)
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", [pdf], str(tmp_path / "out"), {"jobs": 3})
+    assert batch["results"][0]["page_jobs"] == 3
+    assert batch["results"][0]["pages"] == 4
+
+def test_explicit_page_jobs_are_kept_for_a_single_file(renderer, make_pdf, tmp_path):
+    pdf = make_pdf(pages=4)
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", [pdf], str(tmp_path / "out"), {"jobs": 3, "page_jobs": 1})
+    assert batch["results"][0]["page_jobs"] == 1
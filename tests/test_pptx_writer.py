@@ -0,0 +1,84 @@
+import io, os, zipfile
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from pptx_writer import PptxWriter, fit_box
+
+def image_bytes(size, color, kind="PNG"):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, kind)
+    return buffer.getvalue()
+
+def pictures(slide):
+    return [shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+
+def test_image_slides_open_in_python_pptx(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    wide = image_bytes((400, 100), "red")
+    tall = image_bytes((100, 400), "blue", "JPEG")
+    with PptxWriter(output) as writer:
+        writer.add_image_slide(wide)
+        writer.add_image_slide(io.BytesIO(tall))
+    presentation = Presentation(output)
+    assert len(presentation.slides) == 2
+    width, height = presentation.slide_width, presentation.slide_height
+    for slide, (iw, ih), blob in zip(presentation.slides, [(400, 100), (100, 400)], [wide, tall]):
+        (picture,) = pictures(slide)
+        assert (picture.left, picture.top, picture.width, picture.height) == fit_box(iw, ih, width, height)
+        assert picture.image.blob == blob
+    assert presentation.slides[1].shapes[0].image.content_type == "image/jpeg"
+
+def test_repeated_images_share_one_media_part(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    blob = image_bytes((200, 150), "green")
+    with PptxWriter(output) as writer:
+        handle = writer.add_image_slide(blob)
+        writer.add_image_slide(blob)
+        writer.repeat_slide(handle)
+    assert writer.duplicate_media == 1 and writer.bytes_saved == len(blob)
+    with zipfile.ZipFile(output) as package:
+        assert [n for n in package.namelist() if n.startswith("ppt/media/")] == ["ppt/media/image1.png"]
+    assert len(Presentation(output).slides) == 3
+
+def test_empty_deck_is_valid(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    with PptxWriter(output):
+        pass
+    assert len(Presentation(output).slides) == 0
+
+def test_failed_write_removes_partial_deck(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    with pytest.raises(RuntimeError):
+        with PptxWriter(output) as writer:
+            writer.add_image_slide(image_bytes((10, 10), "white"))
+            raise RuntimeError("render failed")
+    assert not os.path.exists(output)
+
+def test_vector_slide_shapes(tmp_path):
+    output = str(tmp_path / "deck.pptx")
+    logo = image_bytes((50, 50), "black")
+    run = {"text": "Quarterly <review> & plan\x07", "font": "Arial", "size": 1800, "bold": True, "italic": False,
+           "color": "1F1F1F", "alpha": None}
+    shapes = [
+        {"kind": "text", "box": (914400, 914400, 4000000, 400000), "rotation": 0, "runs": [run]},
+        {"kind": "picture", "box": (0, 0, 914400, 914400), "rotation": 0, "flip_h": False, "flip_v": False,
+         "crop": (0, 0, 0, 0), "blob": logo},
+        {"kind": "path", "box": (0, 2000000, 1000000, 500000), "preset": None,
+         "commands": [("M", (0, 0)), ("L", (1000000, 500000)), ("Z",)],
+         "fill": None, "line": {"width": 12700, "color": "FF0000", "alpha": None, "dashed": True}},
+    ]
+    with PptxWriter(output) as writer:
+        writer.add_vector_slide(shapes)
+        writer.add_vector_slide([dict(shapes[1])])
+    presentation = Presentation(output)
+    text, picture, path = presentation.slides[0].shapes
+    # Denetim karakterleri atılır, XML özel karakterleri kaçışlanır.
+    assert text.text_frame.text == "Quarterly <review> & plan"
+    assert text.text_frame.paragraphs[0].runs[0].font.bold
+    assert picture.image.blob == logo
+    assert path.shape_type == MSO_SHAPE_TYPE.FREEFORM
+    # İki slayttaki aynı resim tek medya parçasıdır.
+    with zipfile.ZipFile(output) as package:
+        assert len([n for n in package.namelist() if n.startswith("ppt/media/")]) == 1
@@ -0,0 +1,60 @@
+import io, random, zipfile
+import pytest
+from PIL import Image
+
+import benchmark
+import pdf_to_pptx
+
+def slide_images(path):
+    with zipfile.ZipFile(path) as package:
+        return [Image.open(io.BytesIO(package.read(name))) for name in sorted(package.namelist())
+                if name.startswith("ppt/media/")]
+
+def test_explicit_options_override_the_profile():
+    options = pdf_to_pptx.conversion_options({"profile": "small", "dpi": 90})
+    assert options["dpi"] == 90
+    assert options["image_format"] == "jpeg" and options["quality"] == 70
+    # None, "verilmedi" demektir ve profilin değerini ezmez.
+    assert pdf_to_pptx.conversion_options({"profile": "scan", "grayscale": None})["grayscale"] is True
+
+def test_invalid_image_format_is_rejected():
+    with pytest.raises(ValueError):
+        pdf_to_pptx.conversion_options({"image_format": "webp"})
+
+@pytest.mark.parametrize("quality", ["0", "96", "-5", "high"])
+def test_quality_outside_jpeg_range_is_a_usage_error(quality, capsys):
+    with pytest.raises(SystemExit) as exit:
+        pdf_to_pptx.build_arg_parser().parse_args(["pdf_to_pptx", "in.pdf", "-o", "out", "--quality", quality])
+    assert exit.value.code == 2 and "--quality" in capsys.readouterr().err
+
+@pytest.mark.parametrize("profile, size, mode, kind", [
+    ("default", (1700, 2200), "RGB", "PNG"),
+    ("small", (1020, 1320), "RGB", "JPEG"),
+    ("scan", (1275, 1650), "L", "PNG"),
+])
+def test_profiles_set_resolution_format_and_color(renderer, make_pdf, tmp_path, profile, size, mode, kind):
+    pdf = make_pdf(pages=1)
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"profile": profile})
+    (image,) = slide_images(output)
+    assert image.size == size
+    assert image.mode == mode
+    assert image.format == kind
+    assert stats["dpi"] == pdf_to_pptx.RENDER_PROFILES[profile]["dpi"]
+
+def test_auto_format_picks_jpeg_for_photos_and_png_for_text(renderer, tmp_path):
+    rng = random.Random("auto")
+    pdf = str(tmp_path / "auto.pdf")
+    benchmark.write_pdf(pdf, [(*benchmark.LETTER, benchmark._text_lines(rng, 40), None),
+                              (*benchmark.LETTER, [], benchmark._photo(rng, (1240, 1604)))])
+    output = str(tmp_path / "out.pptx")
+    stats = pdf_to_pptx.convert_pdf(pdf, output, {"profile": "auto"})
+    assert stats["encodings"] == {"png": 1, "jpeg": 1}
+    assert [image.format for image in slide_images(output)] == ["PNG", "JPEG"]
+
+def test_classify_page():
+    photo = Image.effect_noise((300, 300), 80).convert("RGB")
+    drawing = Image.new("RGB", (300, 300), "white")
+    drawing.paste((0, 0, 0), (20, 20, 280, 40))
+    assert pdf_to_pptx.classify_page(photo) == "photo"
+    assert pdf_to_pptx.classify_page(drawing) == "line_art"
@@ -0,0 +1,99 @@
+import os, pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pdf_to_pptx
+from progress_channel import PageCounters, ProgressChannel
+
+def convert_pages(slot, pages):
+    # İşçi süreçte sayfa başına bir yazma
+    for page in range(1, pages + 1):
+        slot.update(page, pages)
+    slot.close()
+    return slot.map is None
+
+def test_worker_processes_write_their_own_slots():
+    counters = PageCounters(3)
+    try:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert all(executor.map(convert_pages, [counters.slot(0), counters.slot(2)], [4, 7]))
+        assert [counters.read_slot(i) for i in range(3)] == [(4, 4), (0, 0), (7, 7)]
+        assert counters.read() == (11, 0, 0, 11, 2)
+    finally:
+        counters.close()
+    assert not os.path.exists(counters.path)
+
+def test_slot_pickles_without_its_map():
+    counters = PageCounters(2)
+    try:
+        slot = counters.slot(1)
+        slot.update(1, 5)
+        assert slot.map is not None
+        copy = pickle.loads(pickle.dumps(slot))
+        assert copy.map is None and (copy.path, copy.index) == (counters.path, 1)
+        copy.update(2, 5)
+        # Süren dosyada kalan sayfalar
+        assert counters.read() == (2, 3, 1, 5, 1)
+        copy.close()
+        slot.close()
+    finally:
+        counters.close()
+    # Dosya kaldırıldıktan sonra gelen bildirim sessizce atlanır.
+    copy.update(3, 5)
+    assert copy.map is None
+
+def test_drain_keeps_only_the_last_of_consecutive_file_events():
+    channel = ProgressChannel()
+    called = []
+    channel.post("batch", files=3)
+    channel.post("file", completed=1, total=3)
+    channel.post("file", completed=2, total=3)
+    channel.call(lambda: called.append(1))
+    channel.post("file", completed=3, total=3)
+    channel.post("done", succeeded=3, total=3)
+    events = channel.drain()
+    assert [kind for kind, _ in events] == ["batch", "file", "call", "file", "done"]
+    assert events[1][1]["completed"] == 2
+    events[2][1]["fn"]()
+    assert called == [1] and channel.files == (3, 3)
+    assert channel.drain() == []
+
+def test_snapshot_rate_and_estimate():
+    channel = ProgressChannel(window=10.0)
+    assert channel.snapshot() is None
+    counters = channel.start(4)
+    channel.drain()
+    try:
+        counters.update(0, 10, 10)
+        counters.update(1, 2, 10)
+        channel.post("file", completed=1, total=4)
+        channel.drain()
+        first = channel.snapshot(now=100.0)
+        # Başlamamış iki dosya, sayfa sayısı bilinen dosyaların ortalaması (10) kadar sayılır.
+        assert first["pages_done"] == 12 and first["pages_total"] == 40
+        assert first["pages_per_second"] == 0.0 and first["eta_seconds"] is None
+        counters.update(1, 6, 10)
+        second = channel.snapshot(now=102.0)
+        assert second["pages_per_second"] == 2.0 and second["eta_seconds"] == 12.0
+        # Pencereden eski örnekler düşer.
+        counters.update(1, 10, 10)
+        third = channel.snapshot(now=120.0)
+        assert third["pages_per_second"] == 4 / 18
+    finally:
+        channel.close()
+    assert not os.path.exists(counters.path)
+
+def test_batch_reports_pages_through_the_channel(renderer, make_pdf, tmp_path):
+    pdfs = [make_pdf(f"in/{n}.pdf", pages=n + 1) for n in range(3)]
+    channel = ProgressChannel()
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", pdfs, str(tmp_path / "out"),
+                                      {"jobs": 2, "pool": "thread", "progress": channel})
+    assert batch["succeeded"] == 3
+    events = channel.drain()
+    assert events[0] == ("batch", {"files": 3})
+    assert events[-1] == ("done", {"succeeded": 3, "total": 3})
+    assert channel.files == (3, 3)
+    snapshot = channel.snapshot()
+    assert snapshot["pages_done"] == snapshot["pages_total"] == 6
+    path = channel.counters.path
+    channel.close()
+    assert not os.path.exists(path)
@@ -0,0 +1,45 @@
+import os
+import pytest
+
+import pdf_to_pptx
+
+@pytest.fixture
+def render_calls(renderer, monkeypatch):
+    # Her pdftoppm çağrısının sayfa aralığı kaydedilir.
+    calls = []
+    render = pdf_to_pptx.convert_from_path
+    def recording(pdf_path, first_page=None, last_page=None, **kwargs):
+        calls.append((first_page, last_page))
+        return render(pdf_path, first_page=first_page, last_page=last_page, **kwargs)
+    monkeypatch.setattr(pdf_to_pptx, "convert_from_path", recording)
+    return calls
+
+def test_pages_are_rendered_in_windows(render_calls, make_pdf, tmp_path):
+    pdf = make_pdf(pages=5)
+    pages = list(pdf_to_pptx.iter_pdf_pages(pdf, 2, str(tmp_path), {}))
+    assert render_calls == [(1, 2), (3, 4), (5, 5)]
+    assert len(pages) == 5 and all(os.path.exists(p) for p in pages)
+
+def test_windows_are_rendered_lazily(render_calls, make_pdf, tmp_path):
+    pdf = make_pdf(pages=6)
+    pages = pdf_to_pptx.iter_pdf_pages(pdf, 2, str(tmp_path), {})
+    next(pages)
+    assert render_calls == [(1, 2)]
+    next(pages)
+    next(pages)
+    assert render_calls == [(1, 2), (3, 4)]
+
+def test_zero_window_renders_whole_document_at_once(render_calls, make_pdf, tmp_path):
+    pdf = make_pdf(pages=4)
+    assert len(list(pdf_to_pptx.iter_pdf_pages(pdf, 0, str(tmp_path), {}))) == 4
+    assert render_calls == [(1, 4)]
+
+def test_convert_pdf_leaves_no_rendered_pages(render_calls, make_pdf, tmp_path, monkeypatch):
+    # Sayfa görüntüleri slayta yazılınca silinir; geçici klasör de dönüşümden sonra kaldırılır.
+    monkeypatch.setattr(pdf_to_pptx.tempfile, "tempdir", str(tmp_path / "temp"))
+    os.makedirs(tmp_path / "temp")
+    pdf = make_pdf(pages=5)
+    stats = pdf_to_pptx.convert_pdf(pdf, str(tmp_path / "out.pptx"), {"page_window": 2})
+    assert stats["pages"] == 5
+    assert render_calls == [(1, 2), (3, 4), (5, 5)]
+    assert os.listdir(tmp_path / "temp") == []
@@ -0,0 +1,42 @@
+import os, sys, json, subprocess
+import pytest
+
+import benchmark
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Yalnızca belirli komutlarda gereken depo modülleri
+OPTIONAL_MODULES = ("conversion_service", "folder_watch", "office_pool", "conversion_cache", "history_store",
+                    "metrics", "pdf_fingerprint", "pdf_vector", "progress_channel")
+
+def loaded_after(code, tmp_path):
+    # Kod temiz bir yorumlayıcıda çalışır; sonunda yüklü olan ağır ve isteğe bağlı modüller döner.
+    script = (f"import sys\nsys.path.insert(0, {ROOT!r})\n" + code +
+              f"\nimport json\nprint(json.dumps([m for m in {benchmark.HEAVY_MODULES + OPTIONAL_MODULES!r} "
+              f"if m in sys.modules]))\n")
+    process = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, capture_output=True, text=True, timeout=120)
+    assert process.returncode == 0, process.stderr
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+def test_import_loads_no_conversion_libraries(tmp_path):
+    assert loaded_after("import pdf_to_pptx", tmp_path) == []
+
+def test_cli_help_loads_no_conversion_libraries(tmp_path):
+    code = ("import contextlib, io, pdf_to_pptx\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    try:\n"
+            "        pdf_to_pptx.cli_main(['pdf_to_pptx', '--help'])\n"
+            "    except SystemExit:\n"
+            "        pass")
+    assert loaded_after(code, tmp_path) == []
+
+def test_prewarm_loads_the_conversion_libraries(tmp_path):
+    loaded = loaded_after("import pdf_to_pptx\npdf_to_pptx.prewarm()", tmp_path)
+    assert {"pptx", "pdf2image", "PIL.Image"} <= set(loaded)
+    assert not set(loaded) & set(OPTIONAL_MODULES)
+
+def test_startup_benchmark_reports_no_heavy_modules():
+    result = benchmark.measure_startup("import", repeat=1)
+    if "error" in result:
+        pytest.fail(result["error"])
+    assert result["heavy_modules"] == [] and result["startup_seconds"] > 0
@@ -0,0 +1,53 @@
+import os, zipfile
+import pytest
+
+import pdf_to_pptx
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+@pytest.mark.parametrize("method", list(pdf_to_pptx.ZIP_METHODS))
+def test_added_files_are_archived_and_removed(tmp_path, method):
+    written = []
+    stream = pdf_to_pptx.ZipStream(str(tmp_path / "out.zip"), method, on_write=lambda *args: written.append(args))
+    paths = [write(tmp_path / f"{n}.pptx", bytes([n]) * 5000) for n in range(3)]
+    for path in paths:
+        stream.add(path)
+    stream.add(write(tmp_path / "renamed.bin", b"data"), "inner/name.bin")
+    info = stream.close()
+    assert info["bytes_in"] == 3 * 5000 + 4
+    assert info["bytes"] == os.path.getsize(tmp_path / "out.zip")
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert archive.namelist() == ["0.pptx", "1.pptx", "2.pptx", "inner/name.bin"]
+        assert archive.read("1.pptx") == bytes([1]) * 5000
+        assert archive.getinfo("0.pptx").compress_type == pdf_to_pptx.ZIP_METHODS[method]
+    assert not any(os.path.exists(p) for p in paths)
+    assert [os.path.basename(w[0]) for w in written] == ["0.pptx", "1.pptx", "2.pptx", "renamed.bin"]
+
+def test_archiving_error_is_raised_on_close(tmp_path):
+    stream = pdf_to_pptx.ZipStream(str(tmp_path / "out.zip"))
+    stream.add(str(tmp_path / "missing.pptx"))
+    with pytest.raises(FileNotFoundError):
+        stream.close()
+
+def test_append_mode_keeps_existing_members(tmp_path):
+    with zipfile.ZipFile(tmp_path / "out.zip", "w") as archive:
+        archive.writestr("old.pptx", b"old")
+    stream = pdf_to_pptx.ZipStream(str(tmp_path / "out.zip"), mode="a")
+    stream.add(write(tmp_path / "new.pptx", b"new"))
+    stream.close()
+    with zipfile.ZipFile(tmp_path / "out.zip") as archive:
+        assert archive.namelist() == ["old.pptx", "new.pptx"]
+
+def test_batch_zip_uses_requested_method(renderer, make_pdf, tmp_path):
+    pdfs = [make_pdf(f"in/{n}.pdf", pages=1) for n in range(3)]
+    batch = pdf_to_pptx.convert_files("pdf_to_pptx", pdfs, str(tmp_path / "out"),
+                                      {"jobs": 2, "pool": "thread", "zip_method": "stored"}, zip_option=True)
+    assert batch["succeeded"] == 3
+    with zipfile.ZipFile(batch["zip"]) as archive:
+        assert sorted(archive.namelist()) == ["0.pptx", "1.pptx", "2.pptx"]
+        assert {i.compress_type for i in archive.infolist()} == {zipfile.ZIP_STORED}
+        assert archive.testzip() is None
+    assert batch["zip_bytes"] == os.path.getsize(batch["zip"])